@@ -24,6 +24,7 @@ from src.handlers.logging import logiKonsoli
 from src.helpers.helpers import (
 	dopasujWpisyDoListy,
 	pobierzListęKlas,
+	pobierzListęNauczycieli,
 	pobierzSłownikSerwera,
 	usuńDuplikaty,
 	wyczyśćFiltry,
@@ -412,7 +413,7 @@ class PrzyciskNauczyciel(discord.ui.Button):
 		self,
 		interaction: discord.Interaction
 	) -> None:
-		listaNauczycieli = konfiguracja.get("szkoły", {}).get(self.szkoła, {}).get("lista-nauczycieli", [])
+		listaNauczycieli = pobierzListęNauczycieli(self.szkoła)
 		if not listaNauczycieli:
 			embed = discord.Embed(
 				title="**Opcja niedostępna!**",
@@ -25,8 +25,14 @@ class Constants():
 		KOLOR (discord.Color): Kolor embedów.
 		KRÓTSZA_STOPKA (str): Krótka stopka w embedach bez informacji licencyjnych.
 		DŁUŻSZA_STOPKA (str): Pełna stopka w embedach z informacjami licencyjnymi.
+		MAKSYMALNA_DŁUGOŚĆ_OPISU (int): Maksymalna liczba znaków opisu pojedynczego embeda.
+		MAKSYMALNA_LICZBA_EMBEDÓW (int): Maksymalna liczba embedów w jednej wiadomości.
+		MAKSYMALNA_DŁUGOŚĆ_EMBEDÓW (int): Maksymalna łączna liczba znaków wszystkich embedów jednej wiadomości.
 	"""
 
 	KOLOR: discord.Color = discord.Color(0xcb4348)
 	KRÓTSZA_STOPKA: str = "Stworzone z ❤️ przez Kacpra Górkę!"
-	DŁUŻSZA_STOPKA: str = "Projekt licencjonowany na podstawie licencji MIT. Stworzone z ❤️ przez Kacpra Górkę!"
\ No newline at end of file
+	DŁUŻSZA_STOPKA: str = "Projekt licencjonowany na podstawie licencji MIT. Stworzone z ❤️ przez Kacpra Górkę!"
+	MAKSYMALNA_DŁUGOŚĆ_OPISU: int = 4096
+	MAKSYMALNA_LICZBA_EMBEDÓW: int = 10
+	MAKSYMALNA_DŁUGOŚĆ_EMBEDÓW: int = 6000
\ No newline at end of file
@@ -0,0 +1,201 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+
+# Standardowe biblioteki
+from dataclasses import (
+	dataclass,
+	field
+)
+import re
+from typing import Optional
+
+# Zewnętrzne biblioteki
+import discord
+
+@dataclass(frozen=True)
+class KomórkaTabeli():
+	"""
+	Komórka (<td>) tabeli zastępstw w postaci niezależnej od wykorzystanego parsera HTML.
+
+	Attributes:
+		tekst (str): Oczyszczony tekst komórki.
+		klasy (tuple[str, ...]): Klasy HTML komórki (np. `st0`, `st1`).
+		tekstZOdnośnikiem (str): Oczyszczony tekst komórki z pierwszym odnośnikiem zapisanym w formacie Markdown.
+	"""
+
+	tekst: str
+	klasy: tuple[str, ...]
+	tekstZOdnośnikiem: str
+
+
+@dataclass(frozen=True)
+class WpisZastępstwa():
+	"""
+	Ustrukturyzowany wiersz zastępstwa wyodrębniony jednorazowo ze strony szkoły, współdzielony przez wszystkie serwery.
+
+	Attributes:
+		nauczyciel (str): Nazwa nauczyciela, którego dotyczy zastępstwo.
+		lekcja (str): Zawartość kolumny lekcji.
+		opis (str): Zawartość kolumny opisu.
+		zastępca (str): Zawartość kolumny zastępcy.
+		uwagi (str): Zawartość kolumny uwag.
+		treść (str): Sformatowana treść wpisu bez wiersza z nauczycielem.
+		tekstKlas (str): Znormalizowany tekst wiersza używany do dopasowania wybranych klas.
+		klasy (frozenset[str]): Klasy z listy klas szkoły wykryte w wierszu.
+		bezKlasy (bool): Informuje, czy w wierszu nie wykryto żadnej klasy.
+		kluczeNauczycieli (frozenset[str]): Klucze dopasowań nauczycieli wyodrębnionych z wiersza.
+	"""
+
+	nauczyciel: str
+	lekcja: str
+	opis: str
+	zastępca: str
+	uwagi: str
+	treść: str
+	tekstKlas: str
+	klasy: frozenset[str]
+	bezKlasy: bool
+	kluczeNauczycieli: frozenset[str]
+
+
+@dataclass(frozen=True)
+class FiltrZastępstw():
+	"""
+	Skompilowany filtr zastępstw serwera, budowany jednorazowo z wybranych klas i nauczycieli.
+
+	Attributes:
+		odcisk (str): Suma kontrolna konfiguracji filtrów, pod którą filtr przechowywany jest w pamięci podręcznej.
+		wzórKlas (Optional[re.Pattern[str]]): Jedno wyrażenie regularne dopasowujące dowolną z wybranych klas lub None, jeśli nie wybrano żadnej klasy.
+		kluczeNauczycieli (frozenset[str]): Klucze dopasowań wszystkich wybranych nauczycieli.
+	"""
+
+	odcisk: str
+	wzórKlas: Optional[re.Pattern[str]]
+	kluczeNauczycieli: frozenset[str]
+
+
+@dataclass(frozen=True)
+class SubskrypcjaSzkoły():
+	"""
+	Serwer subskrybujący zastępstwa szkoły, przechowywany w indeksie serwerów według szkół.
+
+	Attributes:
+		identyfikatorSerwera (str): ID serwera Discord.
+		identyfikatorKanału (str): ID kanału tekstowego, na który wysyłane są zastępstwa.
+		odcisk (tuple): Odcisk konfiguracji serwera (ID kanału, wybrane klasy i wybrani nauczyciele), pozwalający wykryć zmianę konfiguracji od ostatniego przetworzenia.
+		filtr (FiltrZastępstw): Skompilowany filtr zastępstw serwera.
+	"""
+
+	identyfikatorSerwera: str
+	identyfikatorKanału: str
+	odcisk: tuple
+	filtr: FiltrZastępstw
+
+
+@dataclass(frozen=True)
+class IndeksDopasowań():
+	"""
+	Indeks wyszukiwania listy klas lub nauczycieli, budowany jednorazowo dla danej listy i używany przy dopasowywaniu i autouzupełnianiu wprowadzonych wpisów.
+
+	Attributes:
+		mapaKluczy (dict[str, list[str]]): Klucze normalizacyjne mapowane do odpowiadających im oryginalnych elementów.
+		normalizowaneDoOryginalnych (dict[str, list[str]]): Pełne znormalizowane nazwy mapowane do oryginalnych elementów.
+		trigramyNormalizowanych (dict[str, tuple[str, ...]]): Indeks odwrócony trigramów znakowych do znormalizowanych nazw, które je zawierają.
+		drzewoPrefiksów (dict[str, tuple[str, ...]]): Węzły drzewa prefiksów według ścieżki (znormalizowanego prefiksu), przechowujące pierwsze pasujące oryginalne elementy.
+	"""
+
+	mapaKluczy: dict[str, list[str]]
+	normalizowaneDoOryginalnych: dict[str, list[str]]
+	trigramyNormalizowanych: dict[str, tuple[str, ...]]
+	drzewoPrefiksów: dict[str, tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class RankingNauczycieli():
+	"""
+	Ranking nauczycieli z największą liczbą zastępstw na serwerze, aktualizowany przyrostowo po każdym zwiększeniu liczników.
+
+	Attributes:
+		odcisk (str): Odcisk filtru serwera, z którego pochodzą klucze pomijanych nauczycieli.
+		licznik (int): Licznik zastępstw serwera, dla którego ranking jest aktualny.
+		pozycje (tuple[tuple[str, int], ...]): Nauczyciele i liczby ich zastępstw, posortowani malejąco według liczby zastępstw.
+	"""
+
+	odcisk: str
+	licznik: int
+	pozycje: tuple[tuple[str, int], ...]
+
+
+@dataclass(frozen=True)
+class PrzygotowaneWiadomości():
+	"""
+	Wiadomości aktualizacji zbudowane jednorazowo i wysyłane bez zmian na kanały wielu serwerów.
+
+	Attributes:
+		osadzenia (tuple[tuple[discord.Embed, ...], ...]): Osadzenia kolejnych wiadomości (nagłówek i wpisy zastępstw), spakowane po kilka w jednej wiadomości.
+		tytuły (tuple[tuple[str, ...], ...]): Tytuły grup wpisów, których osadzenia znajdują się w kolejnych wiadomościach (pusty tytuł oznacza nagłówek).
+		wzmianka (bool): Informuje, czy przed osadzeniami należy wysłać wzmiankę @everyone.
+		reakcja (bool): Informuje, czy pod ostatnią wiadomością należy dodać reakcję.
+	"""
+
+	osadzenia: tuple[tuple[discord.Embed, ...], ...]
+	tytuły: tuple[tuple[str, ...], ...]
+	wzmianka: bool
+	reakcja: bool
+
+
+@dataclass(frozen=True)
+class WynikFiltrowania():
+	"""
+	Wynik filtrowania zastępstw szkoły wspólny dla grupy serwerów o identycznych filtrach.
+
+	Attributes:
+		informacjeDodatkowe (str): Informacje znajdujące się nad zastępstwami.
+		wpisyZastępstw (list[tuple[str, list[str]]]): Przefiltrowane wpisy zastępstw sortowane według nauczyciela.
+		sumaKontrolnaInformacjiDodatkowych (str): Suma kontrolna informacji dodatkowych.
+		sumaKontrolnaWpisówZastępstw (str): Suma kontrolna przefiltrowanych wpisów zastępstw.
+		wiadomościInformacji (PrzygotowaneWiadomości): Wiadomości wysyłane, gdy zmieniły się wyłącznie informacje dodatkowe.
+		odciskiWpisów (dict[str, str]): Odciski poszczególnych wierszy zastępstw przypisane do odcisków ich kluczy (nauczyciel i lekcja).
+		sumyKontrolneGrup (dict[str, str]): Sumy kontrolne pełnych bloków wpisów według tytułu grupy, używane w trybie edycji wiadomości.
+		klasyWpisów (dict[str, frozenset[str]]): Klasy wykryte w poszczególnych wierszach zastępstw według odcisków wierszy, używane w statystykach okresowych.
+		różnice (dict[frozenset[str], RóżnicaWpisów]): Różnice względem poprzednio wysłanych wierszy, obliczone jednorazowo dla każdego poprzedniego stanu serwerów grupy.
+		osadzeniaGrup (dict[str, list[discord.Embed]]): Osadzenia pełnych bloków wpisów według tytułu grupy, budowane jednorazowo na potrzeby trybu edycji wiadomości.
+	"""
+
+	informacjeDodatkowe: str
+	wpisyZastępstw: list[tuple[str, list[str]]]
+	sumaKontrolnaInformacjiDodatkowych: str
+	sumaKontrolnaWpisówZastępstw: str
+	wiadomościInformacji: PrzygotowaneWiadomości
+	odciskiWpisów: dict[str, str]
+	sumyKontrolneGrup: dict[str, str]
+	klasyWpisów: dict[str, frozenset[str]]
+	różnice: dict[frozenset[str], "RóżnicaWpisów"] = field(default_factory=dict, compare=False)
+	osadzeniaGrup: dict[str, list[discord.Embed]] = field(default_factory=dict, compare=False)
+
+
+@dataclass(frozen=True)
+class RóżnicaWpisów():
+	"""
+	Różnica między aktualnymi a poprzednio wysłanymi wierszami zastępstw serwera.
+
+	Attributes:
+		wpisyDoWysłania (list[tuple[str, list[str]]]): Wiersze nowe lub zmienione, sortowane według nauczyciela.
+		wpisyNowe (list[tuple[str, list[str]]]): Wyłącznie wiersze nowe (bez zmienionych), uwzględniane w statystykach.
+		liczbaUsuniętych (int): Liczba wierszy, które zniknęły ze strony i nie zostały zastąpione zmienionymi.
+		wiadomości (PrzygotowaneWiadomości): Wiadomości zawierające wyłącznie różnicę.
+	"""
+
+	wpisyDoWysłania: list[tuple[str, list[str]]]
+	wpisyNowe: list[tuple[str, list[str]]]
+	liczbaUsuniętych: int
+	wiadomości: PrzygotowaneWiadomości
\ No newline at end of file
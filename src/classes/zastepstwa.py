@@ -31,9 +31,24 @@ from src.events import (
 	join,
 	remove
 )
-from src.handlers.configuration import konfiguracja
+from src.handlers.configuration import (
+	konfiguracja,
+	zatwierdźKonfiguracje,
+	zmianaKonfiguracji
+)
+from src.handlers.data import (
+	zamknijBazęDanych,
+	zatwierdźZapisy
+)
 from src.handlers.logging import logiKonsoli
+from src.helpers.helpers import zatrzymajPracowników
+from src.tasks.deletions import usuwajZaplanowaneWiadomości
+from src.tasks.delivery import ponawiajDostarczanie
 from src.tasks.statistics import sprawdźKoniecRoku
+from src.tasks.storage import (
+	zapisujDaneOkresowo,
+	zapisujKonfiguracjęOkresowo
+)
 from src.tasks.updates import sprawdźAktualizacje
 
 class Zastępstwa(discord.Client):
@@ -78,10 +93,10 @@ class Zastępstwa(discord.Client):
 
 	async def close(self) -> None:
 		"""
-		Bezpiecznie wyłącza bota, anuluje wszystkie zadania i zamyka sesję HTTP.
+		Bezpiecznie wyłącza bota, anuluje wszystkie zadania, zapisuje oczekujące dane i konfigurację, zamyka bazę danych i sesję HTTP.
 		"""
 
-		for atrybut in ("aktualizacje", "koniecRoku"):
+		for atrybut in ("aktualizacje", "koniecRoku", "zapisDanych", "usuwanieWiadomości", "ponawianieDostarczania", "zapisKonfiguracji"):
 			zadanie = getattr(self, atrybut, None)
 
 			if zadanie and not zadanie.done():
@@ -95,6 +110,24 @@ class Zastępstwa(discord.Client):
 				with contextlib.suppress(asyncio.CancelledError, Exception):
 					await zadanie
 
+		await zatrzymajPracowników()
+
+		try:
+			if zmianaKonfiguracji.is_set():
+				await zatwierdźKonfiguracje()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas zapisywania pliku konfiguracyjnego. Więcej informacji: {e}"
+			)
+
+		try:
+			await zatwierdźZapisy()
+			zamknijBazęDanych()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas zamykania bazy danych. Więcej informacji: {e}"
+			)
+
 		if getattr(self, "połączenieHTTP", None):
 			try:
 				await self.połączenieHTTP.close()
@@ -138,6 +171,34 @@ class Zastępstwa(discord.Client):
 					"Zadanie sprawdzające zakończenie roku szkolnego jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
 				)
 
+			if not getattr(self, "zapisDanych", None) or self.zapisDanych.done():
+				self.zapisDanych = asyncio.create_task(zapisujDaneOkresowo(self))
+			else:
+				logiKonsoli.warning(
+					"Zadanie zapisujące dane serwerów jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
+			if not getattr(self, "zapisKonfiguracji", None) or self.zapisKonfiguracji.done():
+				self.zapisKonfiguracji = asyncio.create_task(zapisujKonfiguracjęOkresowo(self))
+			else:
+				logiKonsoli.warning(
+					"Zadanie zapisujące plik konfiguracyjny jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
+			if not getattr(self, "usuwanieWiadomości", None) or self.usuwanieWiadomości.done():
+				self.usuwanieWiadomości = asyncio.create_task(usuwajZaplanowaneWiadomości(self))
+			else:
+				logiKonsoli.warning(
+					"Zadanie usuwające zaplanowane wiadomości jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
+			if not getattr(self, "ponawianieDostarczania", None) or self.ponawianieDostarczania.done():
+				self.ponawianieDostarczania = asyncio.create_task(ponawiajDostarczanie(self))
+			else:
+				logiKonsoli.warning(
+					"Zadanie ponawiające dostarczanie wiadomości jest już uruchomione. Próba ponownego jego uruchomienia została zatrzymana."
+				)
+
 			logiKonsoli.info(
 				"Wszystkie zadania zostały poprawnie uruchomione. Enjoy!"
 			)
@@ -25,6 +25,8 @@ from src.handlers.logging import (
 	logiKonsoli,
 	logujPolecenia
 )
+from src.handlers.scraper import zwróćStanWyłącznika
+from src.helpers.helpers import zwróćStatystykiNormalizacji
 
 def ustaw(bot: discord.Client) -> None:
 	"""
@@ -86,6 +88,31 @@ def ustaw(bot: discord.Client) -> None:
 				name="Bot pracuje bez przerwy przez:",
 				value=f"**{int(dni)}** dni, **{int(godziny)}** godz., **{int(minuty)}** min. i **{int(sekundy)}** sek."
 			)
+			identyfikatorSzkoły = konfiguracja.get("serwery", {}).get(str(interaction.guild_id), {}).get("szkoła", "")
+			url = konfiguracja.get("szkoły", {}).get(identyfikatorSzkoły, {}).get("url", "")
+
+			if url:
+				wyłącznik = zwróćStanWyłącznika(url)
+
+				if wyłącznik["stan"] == "zamknięty":
+					stanStrony = "Strona szkoły odpowiada poprawnie."
+				else:
+					stanStrony = f"Strona szkoły nie odpowiada od **{wyłącznik['kolejne-błędy']}** kolejnych sprawdzeń. Kolejna próba <t:{int(wyłącznik['otwarty-do'])}:R>."
+
+				embed.add_field(
+					name="Strona z zastępstwami:",
+					value=stanStrony
+				)
+
+			normalizacja = zwróćStatystykiNormalizacji()
+			liczbaOdwołań = normalizacja["trafienia"] + normalizacja["chybienia"]
+
+			if liczbaOdwołań:
+				embed.add_field(
+					name="Pamięć podręczna normalizacji:",
+					value=f"**{normalizacja['trafienia'] / liczbaOdwołań:.1%}** trafień ({normalizacja['trafienia']} z {liczbaOdwołań}), zapamiętanych nazw: **{normalizacja['rozmiar']}**."
+				)
+
 			embed.set_footer(text=Constants.DŁUŻSZA_STOPKA)
 			await interaction.response.send_message(embed=embed)
 			logujPolecenia(interaction, sukces=True)
@@ -12,18 +12,29 @@
 
 # Standardowe biblioteki
 import contextlib
+from typing import Optional
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
-from src.classes.commands import WidokGłówny
+from src.classes.commands import (
+	WidokGłówny,
+	WidokPodsumowania
+)
 from src.classes.constants import Constants
 from src.handlers.configuration import konfiguracja
 from src.handlers.logging import (
 	logiKonsoli,
 	logujPolecenia
 )
+from src.helpers.helpers import (
+	dopasujWpisyDoListy,
+	pobierzListęKlas,
+	pobierzListęNauczycieli,
+	podpowiedzWpisy,
+	zapiszKluczeSerwera
+)
 
 def ustaw(bot: discord.Client) -> None:
 	"""
@@ -39,7 +50,9 @@ def ustaw(bot: discord.Client) -> None:
 	)
 	@discord.app_commands.describe(
 		kanał="Kanał tekstowy, na który będą wysyłane powiadomienia z zastępstwami.",
-		szkoła="Szkoła, z której to strony będą pobierane informacje o zastępstwach."
+		szkoła="Szkoła, z której to strony będą pobierane informacje o zastępstwach.",
+		klasa="Klasa, której zastępstwa mają zostać dodane do filtrów (opcjonalnie, z podpowiedziami).",
+		nauczyciel="Nauczyciel, którego zastępstwa mają zostać dodane do filtrów (opcjonalnie, z podpowiedziami)."
 	)
 	@discord.app_commands.guild_only()
 	@discord.app_commands.choices(
@@ -55,13 +68,19 @@ def ustaw(bot: discord.Client) -> None:
 	async def skonfiguruj(
 		interaction: discord.Interaction,
 		szkoła: str,
-		kanał: discord.TextChannel
+		kanał: discord.TextChannel,
+		klasa: Optional[str]=None,
+		nauczyciel: Optional[str]=None
 	) -> None:
 		"""
-		Pozwala skonfigurować bota, dzięki opcjom wyboru szkoły, docelowego kanału tekstowego i filtracji zastępstw.
+		Pozwala skonfigurować bota, dzięki opcjom wyboru szkoły, docelowego kanału tekstowego i filtracji zastępstw. Klasa lub nauczyciel wybrani z podpowiedzi są zapisywane od razu, bez otwierania formularza.
 
 		Args:
 			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
+			szkoła (str): ID wybranej szkoły.
+			kanał (discord.TextChannel): Kanał tekstowy, na który będą wysyłane zastępstwa.
+			klasa (Optional[str]): Klasa dodawana do filtrów zastępstw.
+			nauczyciel (Optional[str]): Nauczyciel dodawany do filtrów zastępstw.
 		"""
 
 		try:
@@ -76,6 +95,45 @@ def ustaw(bot: discord.Client) -> None:
 				logujPolecenia(interaction, sukces=False, wiadomośćBłędu="Brak uprawnień.")
 				return
 
+			if klasa or nauczyciel:
+				dane = {"identyfikator-kanalu": str(kanał.id), "szkoła": szkoła}
+				nieZnaleziono = []
+
+				for kluczFiltru, wpis, lista in (
+					("wybrane-klasy", klasa, pobierzListęKlas(szkoła)),
+					("wybrani-nauczyciele", nauczyciel, pobierzListęNauczycieli(szkoła))
+				):
+					if not wpis:
+						continue
+
+					idealneDopasowania, _, _ = dopasujWpisyDoListy([wpis], lista)
+
+					if idealneDopasowania:
+						dane[kluczFiltru] = idealneDopasowania
+					else:
+						nieZnaleziono.append(wpis)
+
+				if nieZnaleziono:
+					embed = discord.Embed(
+						title="**Nie znaleziono wprowadzonych danych**",
+						description=(
+							"Nie znaleziono odpowiadających wpisów dla następujących danych:\n"
+							+ "\n".join(f"- **{wprowadzoneDane}**" for wprowadzoneDane in nieZnaleziono)
+							+ "\n\nWybierz wartość z podpowiedzi wyświetlanych podczas wpisywania."
+						),
+						color=Constants.KOLOR
+					)
+					embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+					await interaction.response.send_message(embed=embed, ephemeral=True)
+					logujPolecenia(interaction, sukces=False, wiadomośćBłędu="Nie znaleziono wprowadzonych danych.")
+					return
+
+				await zapiszKluczeSerwera(str(interaction.guild.id), dane)
+				embed = WidokPodsumowania.utwórz(str(interaction.guild.id))
+				await interaction.response.send_message(embed=embed)
+				logujPolecenia(interaction, sukces=True)
+				return
+
 			view = WidokGłówny(identyfikatorKanału=str(kanał.id), szkoła=szkoła)
 			embed = discord.Embed(
 				title="**Skonfiguruj filtrowanie zastępstw**",
@@ -106,4 +164,46 @@ def ustaw(bot: discord.Client) -> None:
 					await interaction.followup.send(
 						"Wystąpił błąd. Spróbuj ponownie lub skontaktuj się z administratorem bota.",
 						ephemeral=True
-					)
\ No newline at end of file
+					)
+
+	@skonfiguruj.autocomplete("klasa")
+	async def podpowiedzKlasy(
+		interaction: discord.Interaction,
+		wpisanyTekst: str
+	) -> list[discord.app_commands.Choice[str]]:
+		"""
+		Podpowiada klasy szkoły wybranej w poleceniu na podstawie wpisanego dotychczas tekstu.
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji autouzupełniania.
+			wpisanyTekst (str): Tekst wpisany dotychczas w opcji klasy.
+
+		Returns:
+			list[discord.app_commands.Choice[str]]: Podpowiedzi klas.
+		"""
+
+		return [
+			discord.app_commands.Choice(name=klasa[:100], value=klasa[:100])
+			for klasa in podpowiedzWpisy(pobierzListęKlas(interaction.namespace.szkoła), wpisanyTekst)
+		]
+
+	@skonfiguruj.autocomplete("nauczyciel")
+	async def podpowiedzNauczycieli(
+		interaction: discord.Interaction,
+		wpisanyTekst: str
+	) -> list[discord.app_commands.Choice[str]]:
+		"""
+		Podpowiada nauczycieli szkoły wybranej w poleceniu na podstawie wpisanego dotychczas tekstu.
+
+		Args:
+			interaction (discord.Interaction): Obiekt interakcji autouzupełniania.
+			wpisanyTekst (str): Tekst wpisany dotychczas w opcji nauczyciela.
+
+		Returns:
+			list[discord.app_commands.Choice[str]]: Podpowiedzi nauczycieli.
+		"""
+
+		return [
+			discord.app_commands.Choice(name=nauczyciel[:100], value=nauczyciel[:100])
+			for nauczyciel in podpowiedzWpisy(pobierzListęNauczycieli(interaction.namespace.szkoła), wpisanyTekst)
+		]
\ No newline at end of file
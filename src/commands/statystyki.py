@@ -12,6 +12,12 @@
 
 # Standardowe biblioteki
 import contextlib
+from datetime import (
+	datetime,
+	timedelta
+)
+from typing import Optional
+from zoneinfo import ZoneInfo
 
 # Zewnętrzne biblioteki
 import discord
@@ -22,14 +28,20 @@ from src.handlers.configuration import (
 	blokadaKonfiguracji,
 	konfiguracja
 )
-from src.handlers.data import zarządzajPlikiemDanych
+from src.handlers.data import (
+	pobierzStatystykiOkresu,
+	zarządzajPlikiemDanych
+)
 from src.handlers.logging import (
 	logiKonsoli,
 	logujPolecenia
 )
 from src.helpers.helpers import (
 	odmieńZastępstwa,
-	zwróćNazwyKluczy
+	pobierzFiltrSerwera,
+	pobierzRankingNauczycieli,
+	zbudujRanking,
+	zwróćZakresStatystyk
 )
 
 def ustaw(bot: discord.Client) -> None:
@@ -44,14 +56,28 @@ def ustaw(bot: discord.Client) -> None:
 		name="statystyki",
 		description="Wyświetl bieżące statystyki dostarczonych zastępstw w aktualnym roku szkolnym."
 	)
+	@discord.app_commands.describe(
+		zakres="Okres, z którego mają zostać wyświetlone statystyki (domyślnie cały rok szkolny)."
+	)
 	@discord.app_commands.guild_only()
+	@discord.app_commands.choices(
+		zakres=[
+			discord.app_commands.Choice(name="Ostatnie 7 dni", value="ostatnie-7-dni"),
+			discord.app_commands.Choice(name="Ten miesiąc", value="ten-miesiac"),
+			discord.app_commands.Choice(name="Ten semestr", value="ten-semestr")
+		]
+	)
 
-	async def statystyki(interaction: discord.Interaction) -> None:
+	async def statystyki(
+		interaction: discord.Interaction,
+		zakres: Optional[str]=None
+	) -> None:
 		"""
-		Wyświetla bieżące statystyki dostarczonych zastępstw w aktualnym roku szkolnym.
+		Wyświetla bieżące statystyki dostarczonych zastępstw w aktualnym roku szkolnym lub w wybranym okresie.
 
 		Args:
 			interaction (discord.Interaction): Obiekt interakcji wywołujący polecenie.
+			zakres (Optional[str]): Wybrany okres statystyk (`ostatnie-7-dni`, `ten-miesiac` lub `ten-semestr`).
 		"""
 
 		try:
@@ -62,7 +88,6 @@ def ustaw(bot: discord.Client) -> None:
 				dane = {}
 
 			licznik = int(dane.get("licznik-zastepstw", 0))
-			statystyki = dane.get("statystyki-nauczycieli", {})
 
 			async with blokadaKonfiguracji:
 				konfiguracjaSerwera = konfiguracja.get("serwery", {}).get(identyfikatorSerwera, {}).copy()
@@ -70,6 +95,53 @@ def ustaw(bot: discord.Client) -> None:
 			wybraniNauczyciele = konfiguracjaSerwera.get("wybrani-nauczyciele", [])
 			wybraneKlasy = konfiguracjaSerwera.get("wybrane-klasy", [])
 
+			if zakres and (wybraneKlasy or wybraniNauczyciele):
+				początek, koniec = zwróćZakresStatystyk(zakres, datetime.now(ZoneInfo("Europe/Warsaw")).date())
+				statystykiOkresu = await pobierzStatystykiOkresu(identyfikatorSerwera, początek, koniec)
+				licznikOkresu = statystykiOkresu.get("wszystkie", {}).get("", 0)
+				okres = f"{początek:%d.%m.%Y} – {koniec - timedelta(days=1):%d.%m.%Y}"
+
+				if licznikOkresu == 0:
+					embed = discord.Embed(
+						title="**Statystyki zastępstw**",
+						description=f"Dla tego serwera w okresie **{okres}** nie odnotowano żadnych zastępstw.",
+						color=Constants.KOLOR
+					)
+				else:
+					embed = discord.Embed(
+						title="**Statystyki zastępstw**",
+						description=(
+							f"Dla tego serwera w okresie **{okres}** dostarczono **{licznikOkresu}** {odmieńZastępstwa(licznikOkresu)}! "
+							"Poniżej znajdują się klasy oraz nauczyciele z największą liczbą zarejestrowanych zastępstw."
+							+ (" (Pominięto nauczycieli ustawionych w filtrze)." if wybraniNauczyciele else "")
+						),
+						color=Constants.KOLOR
+					)
+					klasy = sorted(statystykiOkresu.get("klasa", {}).items(), key=lambda x: (-x[1], x[0]))
+
+					if klasy:
+						embed.add_field(
+							name="Klasy z największą liczbą zastępstw:",
+							value=", ".join(f"**{klasa}** ({liczba})" for klasa, liczba in klasy[:10]),
+							inline=False
+						)
+
+					ranking = zbudujRanking(statystykiOkresu.get("nauczyciel", {}), pobierzFiltrSerwera(identyfikatorSerwera, konfiguracjaSerwera), licznikOkresu).pozycje
+					wolneMiejsca = 25 - len(embed.fields)
+
+					if wolneMiejsca > 0:
+						for nauczyciel, liczba in ranking[:wolneMiejsca]:
+							embed.add_field(
+								name=nauczyciel,
+								value=f"Liczba zastępstw: {liczba}",
+								inline=True
+							)
+
+				embed.set_footer(text=Constants.DŁUŻSZA_STOPKA)
+				await interaction.response.send_message(embed=embed)
+				logujPolecenia(interaction, sukces=True)
+				return
+
 			if licznik == 0:
 				embed = discord.Embed(
 					title="**Statystyki zastępstw**",
@@ -90,17 +162,16 @@ def ustaw(bot: discord.Client) -> None:
 					color=Constants.KOLOR
 				)
 
-				if isinstance(statystyki, dict) and statystyki:
-					sortowanie = sorted(statystyki.items(), key=lambda x: (-int(x[1]), x[0]))
-					wolneMiejsca = 25 - len(embed.fields)
+				ranking = pobierzRankingNauczycieli(identyfikatorSerwera, dane, konfiguracjaSerwera)
+				wolneMiejsca = 25 - len(embed.fields)
 
-					if wolneMiejsca > 0:
-						for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
-							embed.add_field(
-								name=str(nauczyciel),
-								value=f"Liczba zastępstw: {int(liczba)}",
-								inline=True
-							)
+				if wolneMiejsca > 0:
+					for nauczyciel, liczba in ranking[:wolneMiejsca]:
+						embed.add_field(
+							name=nauczyciel,
+							value=f"Liczba zastępstw: {liczba}",
+							inline=True
+						)
 				embed.set_footer(text=Constants.DŁUŻSZA_STOPKA)
 				await interaction.response.send_message(embed=embed)
 
@@ -114,26 +185,17 @@ def ustaw(bot: discord.Client) -> None:
 					color=Constants.KOLOR
 				)
 
-				wykluczeni = set()
-				pozostali = {}
-
-				for nauczyciel in wybraniNauczyciele:
-					wykluczeni |= zwróćNazwyKluczy(nauczyciel)
-
-				if isinstance(statystyki, dict):
-					for nazwa, liczba in statystyki.items():
-						if not (zwróćNazwyKluczy(nazwa) & wykluczeni):
-							pozostali[nazwa] = int(liczba)
+				# Ranking pomija nauczycieli ustawionych w filtrze serwera
+				ranking = pobierzRankingNauczycieli(identyfikatorSerwera, dane, konfiguracjaSerwera)
 
-				if pozostali:
-					sortowanie = sorted(pozostali.items(), key=lambda x: (-int(x[1]), x[0]))
+				if ranking:
 					wolneMiejsca = 25 - len(embed.fields)
 
 					if wolneMiejsca > 0:
-						for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
+						for nauczyciel, liczba in ranking[:wolneMiejsca]:
 							embed.add_field(
-								name=str(nauczyciel),
-								value=f"Liczba zastępstw: {int(liczba)}",
+								name=nauczyciel,
+								value=f"Liczba zastępstw: {liczba}",
 								inline=True
 							)
 				else:
@@ -12,17 +12,23 @@
 
 # Standardowe biblioteki
 import asyncio
-import copy
 import discord
 
 # Wewnętrzne importy
 from src.handlers.configuration import (
 	blokadaKonfiguracji,
 	konfiguracja,
-	zapiszKonfiguracje
+	oznaczZmianęKonfiguracji
+)
+from src.handlers.data import (
+	folderDanych,
+	usuńDaneSerwera
 )
-from src.handlers.data import folderDanych
 from src.handlers.logging import logiKonsoli
+from src.helpers.helpers import (
+	unieważnijFiltrSerwera,
+	zaktualizujIndeksSerwera
+)
 
 def ustaw(bot: discord.Client) -> None:
 	"""
@@ -56,6 +62,8 @@ def ustaw(bot: discord.Client) -> None:
 
 			if str(identyfikatorSerwera) in serwery:
 				del serwery[str(identyfikatorSerwera)]
+				unieważnijFiltrSerwera(identyfikatorSerwera)
+				zaktualizujIndeksSerwera(identyfikatorSerwera, None)
 				logiKonsoli.info(
 					f"Usunięto serwer o ID {identyfikatorSerwera} z pliku konfiguracyjnego."
 				)
@@ -64,10 +72,19 @@ def ustaw(bot: discord.Client) -> None:
 					f"Nie znaleziono konfiguracji serwera o ID {identyfikatorSerwera}. Dane nie zostały usunięte."
 				)
 
-			snapshot = copy.deepcopy(konfiguracja)
-			await zapiszKonfiguracje(snapshot)
+			oznaczZmianęKonfiguracji()
+
+		try:
+			await usuńDaneSerwera(identyfikatorSerwera)
+			logiKonsoli.info(
+				f"Usunięto dane serwera o ID {identyfikatorSerwera} z bazy danych."
+			)
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas usuwania danych serwera o ID {identyfikatorSerwera} z bazy danych. Więcej informacji: {e}"
+			)
 
-		for rozszerzenie in (".json", ".json.old", ".json.tmp", ".json.bad"):
+		for rozszerzenie in (".json", ".json.old", ".json.tmp", ".json.bad", ".json.imported"):
 			ścieżkaZasobów = folderDanych / f"{identyfikatorSerwera}{rozszerzenie}"
 
 			if ścieżkaZasobów.exists():
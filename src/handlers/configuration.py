@@ -27,6 +27,26 @@ blokadaKonfiguracji = asyncio.Lock()
 # Ścieżka pliku konfiguracyjnego
 ścieżkaKonfiguracji = Path("config.json")
 
+# Zdarzenie ustawiane po zmianie konfiguracji oczekującej na zapis do pliku konfiguracyjnego
+zmianaKonfiguracji = asyncio.Event()
+
+# Treść ostatnio zapisanego pliku konfiguracyjnego, pozwalająca pominąć zapis identycznej treści (uzupełniana po wczytaniu konfiguracji)
+ostatnioZapisanaKonfiguracja = b""
+
+def serializujKonfiguracje(dane: dict[str, Any]) -> bytes:
+	"""
+	Zamienia konfigurację na treść pliku konfiguracyjnego. Wszystkie zapisy używają tego samego, czytelnego formatu, ponieważ plik jest edytowany ręcznie.
+
+	Args:
+		dane (dict[str, Any]): Konfiguracja do zapisania.
+
+	Returns:
+		bytes: Treść pliku konfiguracyjnego w formacie `JSON` z wcięciami.
+	"""
+
+	return json.dumps(dane, ensure_ascii=False, indent=4).encode("utf-8")
+
+
 def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 	"""
 	Wczytuje plik konfiguracyjny zapisany w formacie `JSON`.
@@ -69,12 +89,36 @@ def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 		"wersja": "2.3.3.0-stable",
 		"token": "",
 		"koniec-roku-szkolnego": "2026-06-26",
+		"poczatek-drugiego-semestru": "2026-02-02",
+		"limit-jednoczesnych-szkol": 4,
+		"harmonogram-sprawdzania": {
+			"godziny-poranne": [6, 10],
+			"interwal-poranny": 120,
+			"interwal-dzienny": 300,
+			"godziny-nocne": [22, 6],
+			"interwal-nocny": 1800,
+			"interwal-weekendowy": 3600,
+			"interwal-wakacyjny": 21600,
+			"prog-niezmienionych-odpowiedzi": 3,
+			"maksymalny-interwal": 3600,
+			"rozrzut": 0.2
+		},
+		"liczba-prob-pobrania": 3,
+		"prog-wylacznika-awaryjnego": 3,
+		"interwal-proby-wylacznika": 900,
+		"liczba-pracownikow-dostarczania": 16,
+		"rozmiar-kolejki-kanalu": 100,
+		"interwal-zapisu-danych": 60,
+		"opoznienie-zapisu-konfiguracji": 5,
+		"interwal-ponawiania-dostarczania": 30,
+		"edytuj-wyslane-wiadomosci": True,
 		"serwery": {},
 		"szkoły": {
 			"01": {
 				"nazwa": "Zespół Szkół Przykładowych w Przykładowicach",
 				"url": "https://kacpergorka.com/zastepstwa/01",
 				"kodowanie": "iso-8859-2",
+				"parser": "html.parser",
 				"lista-klas": {
 					"1": [],
 					"2": [],
@@ -88,6 +132,7 @@ def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 				"nazwa": "LXVII Liceum Ogólnokształcące w Przykładowicach",
 				"url": "https://kacpergorka.com/zastepstwa/02",
 				"kodowanie": "iso-8859-2",
+				"parser": "html.parser",
 				"lista-klas": {
 					"1": [],
 					"2": [],
@@ -100,7 +145,7 @@ def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 	}
 
 	if not path.exists():
-		path.write_text(json.dumps(domyślne, ensure_ascii=False, indent=4), encoding="utf-8")
+		path.write_bytes(serializujKonfiguracje(domyślne))
 		logiKonsoli.warning(
 			"Utworzono plik konfiguracyjny z domyślną zawartością. Uzupełnij brakujące i skoryguj domyślnie uzupełnione dane."
 		)
@@ -113,14 +158,14 @@ def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 			dane.setdefault(klucz, wartość)
 
 		dane = uporządkuj(dane, domyślne)
-		path.write_text(json.dumps(dane, ensure_ascii=False, indent=4), encoding="utf-8")
+		path.write_bytes(serializujKonfiguracje(dane))
 
 		if dane.get("wersja", "") != domyślne["wersja"]:
 			logiKonsoli.warning(
 				f"Aktualizuję wersję oprogramowania z {dane.get('wersja', 'Brak danych')} na {domyślne['wersja']}."
 			)
 			dane["wersja"] = domyślne["wersja"]
-			path.write_text(json.dumps(dane, ensure_ascii=False, indent=4), encoding="utf-8")
+			path.write_bytes(serializujKonfiguracje(dane))
 
 		return dane
 	except json.JSONDecodeError as e:
@@ -130,25 +175,38 @@ def wczytajKonfiguracje(path: Path = ścieżkaKonfiguracji) -> dict[str, Any]:
 		raise
 
 konfiguracja = wczytajKonfiguracje()
+ostatnioZapisanaKonfiguracja = serializujKonfiguracje(konfiguracja)
 
-async def zapiszKonfiguracje(konfiguracja: dict[str, Any]) -> None:
+def oznaczZmianęKonfiguracji() -> None:
+	"""
+	Oznacza konfigurację jako zmienioną. Zmiany zgłoszone w krótkim odstępie czasu zapisywane są do pliku konfiguracyjnego zbiorczo, jednym wywołaniem `zatwierdźKonfiguracje`.
 	"""
-	Zapisuje słownik konfiguracji do pliku konfiguracyjnego w formacie `JSON`.
 
-	Args:
-		konfiguracja (dict[str, Any]): Słownik konfiguracji do zapisania.
+	zmianaKonfiguracji.set()
+
+
+async def zatwierdźKonfiguracje() -> None:
+	"""
+	Zapisuje konfigurację do pliku konfiguracyjnego, pomijając zapis, jeśli treść pliku nie uległa zmianie od ostatniego zapisu lub wczytania.
 	"""
 
+	global ostatnioZapisanaKonfiguracja
+
+	zmianaKonfiguracji.clear()
+
+	async with blokadaKonfiguracji:
+		treść = serializujKonfiguracje(konfiguracja)
+
+	if treść == ostatnioZapisanaKonfiguracja:
+		return
+
 	def zapisz() -> None:
 		"""
-		Zapisuje słownik konfiguracji do tymczasowego pliku konfiguracyjnego w formacie `JSON`,
-		a następnie nadpisuje istniejący plik konfiguracji, dodatkowo tworząc kopię `.old`.
+		Zapisuje treść konfiguracji do tymczasowego pliku konfiguracyjnego, a następnie nadpisuje istniejący plik konfiguracji, dodatkowo tworząc kopię `.old`.
 		"""
 
 		tymczasowy = ścieżkaKonfiguracji.with_suffix(".json.tmp")
-
-		with open(tymczasowy, "w", encoding="utf-8") as plik:
-			json.dump(konfiguracja, plik, ensure_ascii=False, indent=4)
+		tymczasowy.write_bytes(treść)
 
 		try:
 			if ścieżkaKonfiguracji.exists():
@@ -167,7 +225,10 @@ async def zapiszKonfiguracje(konfiguracja: dict[str, Any]) -> None:
 
 	try:
 		await asyncio.to_thread(zapisz)
+		ostatnioZapisanaKonfiguracja = treść
 	except Exception as e:
+		# Niezapisana zmiana zostanie zapisana przy kolejnej próbie
+		zmianaKonfiguracji.set()
 		logiKonsoli.exception(
 			f"Wystąpił błąd podczas zapisywania pliku konfiguracyjnego. Więcej informacji: {e}"
 		)
\ No newline at end of file
@@ -9,14 +9,17 @@
 #    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
 #                                                █▄▄
 #
-
 # Standardowe biblioteki
 import asyncio
 from collections import defaultdict
 import contextlib
+import copy
+from datetime import date
 import json
 import os
 from pathlib import Path
+import sqlite3
+import threading
 from typing import Any
 
 # Wewnętrzne importy
@@ -26,108 +29,671 @@ from src.handlers.logging import logiKonsoli
 folderDanych = Path("data")
 folderDanych.mkdir(exist_ok=True)
 
-# Globalna blokada modyfikacji pliku danych per serwer
-blokadaPlikuNaSerwer = defaultdict(lambda: asyncio.Lock())
+# Ścieżka bazy danych SQLite przechowującej stan wszystkich serwerów
+ścieżkaBazyDanych = folderDanych / "dane.db"
+
+# Połączenie z bazą danych, otwierane przy pierwszym użyciu
+połączenieBazy: sqlite3.Connection | None = None
+
+# Blokada połączenia z bazą danych, współdzielonego przez wątki wykonujące zapytania
+blokadaBazyDanych = threading.Lock()
+
+# Globalna blokada modyfikacji danych per serwer
+blokadaDanychNaSerwer = defaultdict(lambda: asyncio.Lock())
+
+# Pamięć podręczna danych serwerów, z której obsługiwane są odczyty (bot jest jedynym zapisującym bazę danych)
+pamięćDanychSerwerów: dict[str, dict[str, Any]] = {}
+
+# Serwery, których dane zmieniły się od ostatniego zbiorczego zapisu do bazy danych
+zmienioneSerwery: set[str] = set()
+
+# Liczba bezpośrednich zapisów danych każdego serwera, zwiększana pod blokadą bazy danych (pozwala zbiorczemu zapisowi pominąć dane nieaktualne względem nowszego zapisu bezpośredniego)
+wersjeDanychSerwerów: defaultdict[str, int] = defaultdict(int)
+
+# Liczba dni, przez które statystyki okresowe przechowywane są w przedziałach dziennych (później łączone w tygodniowe)
+dniStatystykDziennych = 62
+
+# Liczba dni, przez które statystyki okresowe przechowywane są w przedziałach co najwyżej tygodniowych (później łączone w miesięczne)
+dniStatystykTygodniowych = 400
+
+# Liczba dni, po których statystyki okresowe są usuwane
+dniPrzechowywaniaStatystyk = 1830
+
+def otwórzBazęDanych() -> sqlite3.Connection:
+	"""
+	Otwiera bazę danych w trybie WAL, tworzy brakujące tabele (sumy kontrolne, liczniki, statystyki nauczycieli, odciski wysłanych wierszy zastępstw, ID wysłanych wiadomości, skrzynka nadawcza i statystyki okresowe) i jednorazowo importuje istniejące pliki danych w formacie `JSON`. Wywoływana z zajętą blokadą bazy danych.
+
+	Returns:
+		sqlite3.Connection: Połączenie z bazą danych.
+	"""
+
+	global połączenieBazy
+
+	if połączenieBazy is not None:
+		return połączenieBazy
+
+	połączenie = sqlite3.connect(ścieżkaBazyDanych, check_same_thread=False, isolation_level=None)
+	połączenie.execute("PRAGMA journal_mode=WAL")
+	połączenie.execute("PRAGMA synchronous=NORMAL")
+	połączenie.executescript(
+		"""
+		CREATE TABLE IF NOT EXISTS sumy_kontrolne (
+			identyfikator_serwera TEXT PRIMARY KEY,
+			informacje_dodatkowe TEXT NOT NULL DEFAULT '',
+			wpisy_zastepstw TEXT NOT NULL DEFAULT ''
+		);
+		CREATE TABLE IF NOT EXISTS liczniki (
+			identyfikator_serwera TEXT PRIMARY KEY,
+			licznik_zastepstw INTEGER NOT NULL DEFAULT 0,
+			ostatni_raport TEXT NOT NULL DEFAULT ''
+		);
+		CREATE TABLE IF NOT EXISTS statystyki_nauczycieli (
+			identyfikator_serwera TEXT NOT NULL,
+			nauczyciel TEXT NOT NULL,
+			liczba INTEGER NOT NULL DEFAULT 0,
+			PRIMARY KEY (identyfikator_serwera, nauczyciel)
+		);
+		CREATE TABLE IF NOT EXISTS odciski_wpisow (
+			identyfikator_serwera TEXT NOT NULL,
+			odcisk TEXT NOT NULL,
+			odcisk_klucza TEXT NOT NULL,
+			PRIMARY KEY (identyfikator_serwera, odcisk)
+		);
+		CREATE TABLE IF NOT EXISTS wiadomosci_zastepstw (
+			identyfikator_serwera TEXT NOT NULL,
+			tytul TEXT NOT NULL,
+			identyfikator_wiadomosci INTEGER NOT NULL,
+			suma_kontrolna TEXT NOT NULL DEFAULT '',
+			data TEXT NOT NULL DEFAULT '',
+			kolejne_wiadomosci TEXT NOT NULL DEFAULT '[]',
+			PRIMARY KEY (identyfikator_serwera, tytul)
+		);
+		CREATE TABLE IF NOT EXISTS skrzynka_nadawcza (
+			identyfikator INTEGER PRIMARY KEY AUTOINCREMENT,
+			identyfikator_serwera TEXT NOT NULL,
+			identyfikator_kanalu INTEGER NOT NULL,
+			krok TEXT NOT NULL,
+			proby INTEGER NOT NULL DEFAULT 0,
+			termin REAL NOT NULL DEFAULT 0
+		);
+		CREATE INDEX IF NOT EXISTS skrzynka_nadawcza_serwer ON skrzynka_nadawcza (identyfikator_serwera, identyfikator);
+		CREATE TABLE IF NOT EXISTS statystyki_okresowe (
+			identyfikator_serwera TEXT NOT NULL,
+			rodzaj TEXT NOT NULL,
+			poczatek INTEGER NOT NULL,
+			nazwa TEXT NOT NULL,
+			dlugosc INTEGER NOT NULL DEFAULT 1,
+			liczba INTEGER NOT NULL DEFAULT 0,
+			PRIMARY KEY (identyfikator_serwera, rodzaj, poczatek, nazwa)
+		) WITHOUT ROWID;
+		"""
+	)
+
+	# Bazy danych utworzone przed zapamiętywaniem wszystkich wiadomości zajmowanych przez blok otrzymują brakującą kolumnę
+	if "kolejne_wiadomosci" not in {kolumna[1] for kolumna in połączenie.execute("PRAGMA table_info(wiadomosci_zastepstw)")}:
+		połączenie.execute("ALTER TABLE wiadomosci_zastepstw ADD COLUMN kolejne_wiadomosci TEXT NOT NULL DEFAULT '[]'")
+
+	połączenieBazy = połączenie
+	zaimportujPlikiDanych(połączenie)
+	return połączenie
+
+
+def zapiszWiersze(
+	połączenie: sqlite3.Connection,
+	identyfikatorSerwera: str,
+	dane: dict[str, Any]
+) -> None:
+	"""
+	Zapisuje dane serwera Discord do tabel bazy danych w ramach trwającej transakcji.
+
+	Args:
+		połączenie (sqlite3.Connection): Połączenie z bazą danych.
+		identyfikatorSerwera (str): ID serwera Discord.
+		dane (dict[str, Any]): Dane serwera w formacie dotychczasowego pliku danych.
+	"""
+
+	połączenie.execute(
+		"INSERT OR REPLACE INTO sumy_kontrolne VALUES (?, ?, ?)",
+		(identyfikatorSerwera, str(dane.get("suma-kontrolna-informacji-dodatkowych", "")), str(dane.get("suma-kontrolna-wpisow-zastepstw", "")))
+	)
+	połączenie.execute(
+		"INSERT OR REPLACE INTO liczniki VALUES (?, ?, ?)",
+		(identyfikatorSerwera, int(dane.get("licznik-zastepstw", 0)), str(dane.get("ostatni-raport", "")))
+	)
+	połączenie.execute("DELETE FROM statystyki_nauczycieli WHERE identyfikator_serwera = ?", (identyfikatorSerwera,))
+
+	statystykiNauczycieli = dane.get("statystyki-nauczycieli", {})
+
+	if isinstance(statystykiNauczycieli, dict) and statystykiNauczycieli:
+		połączenie.executemany(
+			"INSERT INTO statystyki_nauczycieli VALUES (?, ?, ?)",
+			[(identyfikatorSerwera, str(nauczyciel), int(liczba)) for nauczyciel, liczba in statystykiNauczycieli.items()]
+		)
+
+	połączenie.execute("DELETE FROM odciski_wpisow WHERE identyfikator_serwera = ?", (identyfikatorSerwera,))
+
+	odciskiWpisów = dane.get("odciski-wpisow-zastepstw", {})
+
+	if isinstance(odciskiWpisów, dict) and odciskiWpisów:
+		połączenie.executemany(
+			"INSERT INTO odciski_wpisow VALUES (?, ?, ?)",
+			[(identyfikatorSerwera, str(odcisk), str(odciskKlucza)) for odcisk, odciskKlucza in odciskiWpisów.items()]
+		)
+
+	połączenie.execute("DELETE FROM wiadomosci_zastepstw WHERE identyfikator_serwera = ?", (identyfikatorSerwera,))
+
+	wiadomościZastępstw = dane.get("wiadomosci-zastepstw", {})
+
+	if isinstance(wiadomościZastępstw, dict) and wiadomościZastępstw:
+		wiersze = []
+
+		for tytuł, (identyfikatory, sumaKontrolna) in wiadomościZastępstw.items():
+			# Pliki danych sprzed zapamiętywania wszystkich wiadomości bloku zawierają pojedyncze ID wiadomości
+			identyfikatory = [int(identyfikator) for identyfikator in (identyfikatory if isinstance(identyfikatory, list) else [identyfikatory])]
+
+			if identyfikatory:
+				wiersze.append((identyfikatorSerwera, str(tytuł), identyfikatory[0], str(sumaKontrolna), str(dane.get("data-wiadomosci", "")), json.dumps(identyfikatory[1:])))
+
+		połączenie.executemany("INSERT INTO wiadomosci_zastepstw VALUES (?, ?, ?, ?, ?, ?)", wiersze)
+
+
+def zaimportujPlikiDanych(połączenie: sqlite3.Connection) -> None:
+	"""
+	Jednorazowo importuje pliki danych w formacie `JSON` z folderu danych do bazy danych. Zaimportowane pliki otrzymują rozszerzenie `.json.imported`, dzięki czemu nie są importowane ponownie.
+
+	Args:
+		połączenie (sqlite3.Connection): Połączenie z bazą danych.
+	"""
+
+	for ścieżkaPliku in sorted(folderDanych.glob("*.json")):
+		try:
+			dane = json.loads(ścieżkaPliku.read_text(encoding="utf-8"))
+
+			if not isinstance(dane, dict):
+				raise ValueError("Plik danych nie zawiera obiektu JSON.")
+
+			połączenie.execute("BEGIN")
+			zapiszWiersze(połączenie, ścieżkaPliku.stem, dane)
+			połączenie.execute("COMMIT")
+			os.replace(str(ścieżkaPliku), str(ścieżkaPliku.with_suffix(".json.imported")))
+			logiKonsoli.info(
+				f"Zaimportowano plik danych ({ścieżkaPliku}) do bazy danych."
+			)
+		except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+			if połączenie.in_transaction:
+				połączenie.execute("ROLLBACK")
+
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas wczytywania importowanego pliku danych ({ścieżkaPliku}). Więcej informacji: {e}"
+			)
+
+			with contextlib.suppress(Exception):
+				os.replace(str(ścieżkaPliku), str(ścieżkaPliku.with_suffix(".json.bad")))
+		except Exception as e:
+			if połączenie.in_transaction:
+				połączenie.execute("ROLLBACK")
+
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas importowania pliku danych ({ścieżkaPliku}). Więcej informacji: {e}"
+			)
+
+
+def odczytajDaneSerwera(identyfikatorSerwera: str) -> dict[str, Any]:
+	"""
+	Odczytuje dane serwera Discord z bazy danych.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+
+	Returns:
+		dict[str, Any]: Dane serwera w formacie dotychczasowego pliku danych lub pusty słownik, jeśli serwer nie ma zapisanych danych.
+	"""
+
+	with blokadaBazyDanych:
+		połączenie = otwórzBazęDanych()
+		sumy = połączenie.execute("SELECT informacje_dodatkowe, wpisy_zastepstw FROM sumy_kontrolne WHERE identyfikator_serwera = ?", (identyfikatorSerwera,)).fetchone()
+		liczniki = połączenie.execute("SELECT licznik_zastepstw, ostatni_raport FROM liczniki WHERE identyfikator_serwera = ?", (identyfikatorSerwera,)).fetchone()
+		statystyki = połączenie.execute("SELECT nauczyciel, liczba FROM statystyki_nauczycieli WHERE identyfikator_serwera = ?", (identyfikatorSerwera,)).fetchall()
+		odciski = połączenie.execute("SELECT odcisk, odcisk_klucza FROM odciski_wpisow WHERE identyfikator_serwera = ?", (identyfikatorSerwera,)).fetchall()
+		wiadomości = połączenie.execute("SELECT tytul, identyfikator_wiadomosci, suma_kontrolna, data, kolejne_wiadomosci FROM wiadomosci_zastepstw WHERE identyfikator_serwera = ?", (identyfikatorSerwera,)).fetchall()
+
+	if sumy is None and liczniki is None:
+		return {}
+
+	return {
+		"suma-kontrolna-informacji-dodatkowych": sumy[0] if sumy else "",
+		"suma-kontrolna-wpisow-zastepstw": sumy[1] if sumy else "",
+		"licznik-zastepstw": liczniki[0] if liczniki else 0,
+		"statystyki-nauczycieli": dict(statystyki),
+		"ostatni-raport": liczniki[1] if liczniki else "",
+		"odciski-wpisow-zastepstw": dict(odciski),
+		"wiadomosci-zastepstw": {tytuł: [[identyfikatorWiadomości, *json.loads(kolejneWiadomości)], sumaKontrolna] for tytuł, identyfikatorWiadomości, sumaKontrolna, _, kolejneWiadomości in wiadomości},
+		"data-wiadomosci": wiadomości[0][3] if wiadomości else ""
+	}
+
+
+async def zatwierdźZapisy() -> None:
+	"""
+	Zapisuje dane wszystkich zmienionych serwerów z pamięci podręcznej do bazy danych w jednej transakcji. Dane serwera, które w międzyczasie zostały zapisane bezpośrednio (`zaplanujDostarczenie`, `zakończKrokSkrzynki`), są pomijane, aby starsza kopia nie nadpisała nowszego stanu.
+	"""
+
+	if not zmienioneSerwery:
+		return
+
+	zapisy = {identyfikatorSerwera: (wersjeDanychSerwerów[identyfikatorSerwera], copy.deepcopy(pamięćDanychSerwerów[identyfikatorSerwera])) for identyfikatorSerwera in zmienioneSerwery if identyfikatorSerwera in pamięćDanychSerwerów}
+	zmienioneSerwery.clear()
+
+	def zapisz() -> None:
+		"""
+		Funkcja pomocnicza zapisująca zmienione dane serwerów w jednej transakcji bazy danych.
+		"""
+
+		with blokadaBazyDanych:
+			połączenie = otwórzBazęDanych()
+
+			try:
+				połączenie.execute("BEGIN")
+
+				for identyfikatorSerwera, (wersja, dane) in zapisy.items():
+					if wersjeDanychSerwerów[identyfikatorSerwera] == wersja:
+						zapiszWiersze(połączenie, identyfikatorSerwera, dane)
+
+				połączenie.execute("COMMIT")
+			except Exception:
+				if połączenie.in_transaction:
+					połączenie.execute("ROLLBACK")
+				raise
+
+	try:
+		await asyncio.to_thread(zapisz)
+	except Exception as e:
+		# Niezapisane serwery pozostają oznaczone jako zmienione i zostaną zapisane przy kolejnej próbie
+		zmienioneSerwery.update(identyfikatorSerwera for identyfikatorSerwera in zapisy if identyfikatorSerwera in pamięćDanychSerwerów)
+		logiKonsoli.exception(
+			f"Wystąpił błąd podczas zapisywania danych serwerów do bazy danych. Więcej informacji: {e}"
+		)
+
 
 async def zarządzajPlikiemDanych(
 	identyfikatorSerwera: str,
 	dane: Any = None
 ) -> dict[str, Any]:
 	"""
-	Zarządza plikiem danych w formacie `JSON` dla konkretnego serwera Discord.
+	Zarządza danymi konkretnego serwera Discord. Odczyty obsługiwane są z pamięci podręcznej, a zapisy oznaczają serwer jako zmieniony i trafiają do bazy danych SQLite zbiorczo, wraz z kolejnym wywołaniem `zatwierdźZapisy`.
 
 	Args:
 		identyfikatorSerwera (str): ID serwera Discord, którego dane mają być odczytane lub zapisane.
-		dane (Any, optional): Jeśli podane, zostaną zapisane w pliku danych serwera. Domyślnie None.
+		dane (Any, optional): Jeśli podane, zostaną zapisane jako dane serwera. Domyślnie None.
 
 	Returns:
-		dict[str, Any]: Zawartość pliku danych serwera po operacji odczytu, lub pusty słownik w przypadku błędu.
-  """
+		dict[str, Any]: Kopia danych serwera po operacji odczytu, lub pusty słownik w przypadku błędu.
+	"""
 
 	identyfikatorSerwera = str(identyfikatorSerwera)
-	ścieżkaPliku = folderDanych / f"{identyfikatorSerwera}.json"
 
-	tymczasowy = ścieżkaPliku.with_suffix(".json.tmp")
-	kopia = ścieżkaPliku.with_suffix(".json.old")
-	uszkodzony = ścieżkaPliku.with_suffix(".json.bad")
-
-	async with blokadaPlikuNaSerwer[identyfikatorSerwera]:
+	async with blokadaDanychNaSerwer[identyfikatorSerwera]:
 		try:
 			if dane is not None:
-				def zapisz() -> None:
-					"""
-					Funkcja pomocnicza zapisująca dane serwera Discord do pliku danych w formacie `JSON`.
-					"""
-
-					with open(tymczasowy, "w", encoding="utf-8") as plik:
-						json.dump(dane, plik, ensure_ascii=False, indent=4)
-
-					try:
-						if ścieżkaPliku.exists():
-							with contextlib.suppress(Exception):
-								os.remove(str(kopia))
-
-							os.replace(str(ścieżkaPliku), str(kopia))
-					except Exception as e:
-						logiKonsoli.exception(
-							f"Wystąpił błąd podczas zapisywania kopii pliku danych z rozszerzeniem .old dla {ścieżkaPliku}. Więcej informacji: {e}"
-						)
-
-					os.replace(str(tymczasowy), str(ścieżkaPliku))
-				await asyncio.to_thread(zapisz)
-
-			def odczytaj() -> bool:
-				"""
-				Funkcja pomocnicza odczytująca plik danych serwera Discord.
-
-				Returns:
-					bool: True, jeśli plik danych istnieje, False w przeciwnym wypadku.
-				"""
-
-				return ścieżkaPliku.exists()
-
-			if await asyncio.to_thread(odczytaj):
-				try:
-					def wczytaj() -> Any:
-						"""
-						Wczytuje i parsuje zawartość pliku danych serwera Discord jako `JSON`.
-
-						Returns:
-							Any: Zawartość pliku danych w formacie `JSON`.
-						"""
-
-						return json.loads(ścieżkaPliku.read_text(encoding="utf-8"))
-
-					return await asyncio.to_thread(wczytaj)
-				except (json.JSONDecodeError, UnicodeDecodeError) as e:
-					logiKonsoli.exception(
-						f"Wystąpił błąd podczas wczytywania pliku danych. Więcej informacji: {e}"
-					)
-					try:
-						await asyncio.to_thread(os.replace, str(ścieżkaPliku), str(uszkodzony))
-						logiKonsoli.exception(
-							f"Uszkodzony plik danych został przeniesiony do {uszkodzony}. Wczytano pustą zawartość."
-						)
-					except Exception as e:
-						logiKonsoli.exception(
-							f"Wystąpił błąd podczas przenoszenia uszkodzonego pliku danych. Więcej informacji: {e}"
-						)
-
-					return {}
+				pamięćDanychSerwerów[identyfikatorSerwera] = copy.deepcopy(dane)
+				zmienioneSerwery.add(identyfikatorSerwera)
 
-			return {}
+			elif identyfikatorSerwera not in pamięćDanychSerwerów:
+				pamięćDanychSerwerów[identyfikatorSerwera] = await asyncio.to_thread(odczytajDaneSerwera, identyfikatorSerwera)
+
+			return copy.deepcopy(pamięćDanychSerwerów[identyfikatorSerwera])
 		except Exception as e:
 			logiKonsoli.exception(
-				f"Wystąpił błąd podczas operacji na pliku danych. Więcej informacji: {e}"
+				f"Wystąpił błąd podczas operacji na danych serwera. Więcej informacji: {e}"
+			)
+			return {}
+
+
+async def usuńDaneSerwera(identyfikatorSerwera: str) -> None:
+	"""
+	Usuwa wszystkie dane serwera Discord z bazy danych.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord, którego dane mają zostać usunięte.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+
+	def usuń() -> None:
+		"""
+		Funkcja pomocnicza usuwająca wiersze serwera ze wszystkich tabel bazy danych.
+		"""
+
+		with blokadaBazyDanych:
+			połączenie = otwórzBazęDanych()
+
+			try:
+				połączenie.execute("BEGIN")
+
+				for tabela in ("sumy_kontrolne", "liczniki", "statystyki_nauczycieli", "odciski_wpisow", "wiadomosci_zastepstw", "skrzynka_nadawcza", "statystyki_okresowe"):
+					połączenie.execute(f"DELETE FROM {tabela} WHERE identyfikator_serwera = ?", (identyfikatorSerwera,))
+
+				połączenie.execute("COMMIT")
+				wersjeDanychSerwerów[identyfikatorSerwera] += 1
+			except Exception:
+				if połączenie.in_transaction:
+					połączenie.execute("ROLLBACK")
+				raise
+
+	async with blokadaDanychNaSerwer[identyfikatorSerwera]:
+		pamięćDanychSerwerów.pop(identyfikatorSerwera, None)
+		zmienioneSerwery.discard(identyfikatorSerwera)
+		await asyncio.to_thread(usuń)
+
+
+async def zaplanujDostarczenie(
+	identyfikatorSerwera: str,
+	dane: dict[str, Any],
+	identyfikatorKanału: int,
+	kroki: list[dict[str, Any]],
+	przyrostyStatystyk: dict[tuple[str, str], int] | None = None,
+	dzień: date | None = None
+) -> None:
+	"""
+	Zapisuje nowe dane serwera Discord, kroki dostarczenia wiadomości do skrzynki nadawczej i przyrosty statystyk okresowych w jednej transakcji, dzięki czemu zmiana stanu serwera nie zostanie utrwalona bez wiadomości, które ją ogłaszają.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		dane (dict[str, Any]): Nowe dane serwera.
+		identyfikatorKanału (int): ID kanału, na który zostaną dostarczone wiadomości.
+		kroki (list[dict[str, Any]]): Kolejne kroki dostarczenia (wzmianka, wysłanie, edycja) w postaci gotowej do zapisania w formacie `JSON`.
+		przyrostyStatystyk (dict[tuple[str, str], int] | None, optional): Nowe zastępstwa według rodzaju (`wszystkie`, `nauczyciel` lub `klasa`) i nazwy. Domyślnie None.
+		dzień (date | None, optional): Dzień, do którego przedziału dodawane są przyrosty statystyk. Domyślnie bieżący dzień.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+
+	def zapisz() -> None:
+		"""
+		Funkcja pomocnicza zapisująca dane serwera i kroki dostarczenia w jednej transakcji bazy danych.
+		"""
+
+		with blokadaBazyDanych:
+			połączenie = otwórzBazęDanych()
+
+			try:
+				połączenie.execute("BEGIN")
+				zapiszWiersze(połączenie, identyfikatorSerwera, dane)
+				połączenie.executemany(
+					"INSERT INTO skrzynka_nadawcza (identyfikator_serwera, identyfikator_kanalu, krok) VALUES (?, ?, ?)",
+					[(identyfikatorSerwera, int(identyfikatorKanału), json.dumps(krok, ensure_ascii=False)) for krok in kroki]
+				)
+
+				if przyrostyStatystyk:
+					połączenie.executemany(
+						"INSERT INTO statystyki_okresowe VALUES (?, ?, ?, ?, 1, ?) ON CONFLICT DO UPDATE SET liczba = liczba + excluded.liczba",
+						[(identyfikatorSerwera, rodzaj, (dzień or date.today()).toordinal(), nazwa, int(liczba)) for (rodzaj, nazwa), liczba in przyrostyStatystyk.items()]
+					)
+
+				połączenie.execute("COMMIT")
+				wersjeDanychSerwerów[identyfikatorSerwera] += 1
+			except Exception:
+				if połączenie.in_transaction:
+					połączenie.execute("ROLLBACK")
+				raise
+
+	async with blokadaDanychNaSerwer[identyfikatorSerwera]:
+		await asyncio.to_thread(zapisz)
+		pamięćDanychSerwerów[identyfikatorSerwera] = copy.deepcopy(dane)
+		zmienioneSerwery.discard(identyfikatorSerwera)
+
+
+async def pobierzKrokiSkrzynki(identyfikatorSerwera: str) -> list[tuple[int, int, dict[str, Any], int, float]]:
+	"""
+	Pobiera niedostarczone kroki ze skrzynki nadawczej serwera Discord, w kolejności ich zaplanowania.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+
+	Returns:
+		list[tuple[int, int, dict[str, Any], int, float]]: Kroki jako krotki (ID kroku, ID kanału, krok, liczba prób, termin kolejnej próby).
+	"""
+
+	def odczytaj() -> list[tuple[int, int, dict[str, Any], int, float]]:
+		"""
+		Funkcja pomocnicza odczytująca kroki serwera ze skrzynki nadawczej.
+		"""
+
+		with blokadaBazyDanych:
+			wiersze = otwórzBazęDanych().execute(
+				"SELECT identyfikator, identyfikator_kanalu, krok, proby, termin FROM skrzynka_nadawcza WHERE identyfikator_serwera = ? ORDER BY identyfikator",
+				(str(identyfikatorSerwera),)
+			).fetchall()
+
+		return [(identyfikator, identyfikatorKanału, json.loads(krok), próby, termin) for identyfikator, identyfikatorKanału, krok, próby, termin in wiersze]
+
+	return await asyncio.to_thread(odczytaj)
+
+
+async def pobierzSerweryZeSkrzynką(teraz: float) -> list[str]:
+	"""
+	Pobiera serwery Discord, których pierwszy niedostarczony krok ze skrzynki nadawczej oczekuje już na kolejną próbę.
+
+	Args:
+		teraz (float): Bieżący czas uniksowy.
+
+	Returns:
+		list[str]: ID serwerów Discord.
+	"""
+
+	def odczytaj() -> list[str]:
+		"""
+		Funkcja pomocnicza odczytująca serwery z zaległymi krokami.
+		"""
+
+		with blokadaBazyDanych:
+			wiersze = otwórzBazęDanych().execute(
+				"SELECT DISTINCT identyfikator_serwera FROM skrzynka_nadawcza WHERE termin <= ?",
+				(teraz,)
+			).fetchall()
+
+		return [identyfikatorSerwera for identyfikatorSerwera, in wiersze]
+
+	return await asyncio.to_thread(odczytaj)
+
+
+async def zaktualizujKrokSkrzynki(
+	identyfikatorKroku: int,
+	krok: dict[str, Any],
+	próby: int = 0,
+	termin: float = 0
+) -> None:
+	"""
+	Zapisuje postęp kroku ze skrzynki nadawczej lub termin jego kolejnej próby.
+
+	Args:
+		identyfikatorKroku (int): ID kroku w skrzynce nadawczej.
+		krok (dict[str, Any]): Aktualna postać kroku.
+		próby (int, optional): Liczba nieudanych prób dostarczenia. Domyślnie 0.
+		termin (float, optional): Czas uniksowy, przed którym krok nie zostanie ponowiony. Domyślnie 0.
+	"""
+
+	def zapisz() -> None:
+		"""
+		Funkcja pomocnicza aktualizująca krok w skrzynce nadawczej.
+		"""
+
+		with blokadaBazyDanych:
+			otwórzBazęDanych().execute(
+				"UPDATE skrzynka_nadawcza SET krok = ?, proby = ?, termin = ? WHERE identyfikator = ?",
+				(json.dumps(krok, ensure_ascii=False), int(próby), float(termin), int(identyfikatorKroku))
 			)
 
-			if tymczasowy.exists():
-				try:
-					tymczasowy.unlink()
-				except Exception as e:
-					logiKonsoli.exception(
-						f"Nie udało się usunąć tymczasowego pliku danych ({tymczasowy}). Więcej informacji: {e}"
+	await asyncio.to_thread(zapisz)
+
+
+async def zakończKrokSkrzynki(
+	identyfikatorSerwera: str,
+	identyfikatorKroku: int,
+	dane: dict[str, Any] | None = None
+) -> None:
+	"""
+	Usuwa dostarczony krok ze skrzynki nadawczej, w tej samej transakcji zapisując zaktualizowane dane serwera Discord (np. ID wysłanych wiadomości).
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		identyfikatorKroku (int): ID kroku w skrzynce nadawczej.
+		dane (dict[str, Any] | None, optional): Zaktualizowane dane serwera. Domyślnie None.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+
+	def zapisz() -> None:
+		"""
+		Funkcja pomocnicza usuwająca krok i zapisująca dane serwera w jednej transakcji bazy danych.
+		"""
+
+		with blokadaBazyDanych:
+			połączenie = otwórzBazęDanych()
+
+			try:
+				połączenie.execute("BEGIN")
+
+				if dane is not None:
+					zapiszWiersze(połączenie, identyfikatorSerwera, dane)
+
+				połączenie.execute("DELETE FROM skrzynka_nadawcza WHERE identyfikator = ?", (int(identyfikatorKroku),))
+				połączenie.execute("COMMIT")
+
+				if dane is not None:
+					wersjeDanychSerwerów[identyfikatorSerwera] += 1
+			except Exception:
+				if połączenie.in_transaction:
+					połączenie.execute("ROLLBACK")
+				raise
+
+	async with blokadaDanychNaSerwer[identyfikatorSerwera]:
+		await asyncio.to_thread(zapisz)
+
+		if dane is not None:
+			pamięćDanychSerwerów[identyfikatorSerwera] = copy.deepcopy(dane)
+			zmienioneSerwery.discard(identyfikatorSerwera)
+
+
+async def pobierzStatystykiOkresu(
+	identyfikatorSerwera: str,
+	początek: date,
+	koniec: date
+) -> dict[str, dict[str, int]]:
+	"""
+	Sumuje statystyki okresowe serwera Discord z przedziałów rozpoczynających się w podanym okresie. Starsze dane przechowywane są w przedziałach tygodniowych lub miesięcznych, więc granice odległych okresów są przybliżone do początku przedziału.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		początek (date): Pierwszy dzień okresu.
+		koniec (date): Dzień następujący po ostatnim dniu okresu.
+
+	Returns:
+		dict[str, dict[str, int]]: Liczby zastępstw według rodzaju (`wszystkie`, `nauczyciel` lub `klasa`) i nazwy.
+	"""
+
+	def odczytaj() -> dict[str, dict[str, int]]:
+		"""
+		Funkcja pomocnicza sumująca statystyki serwera z wybranego okresu.
+		"""
+
+		with blokadaBazyDanych:
+			wiersze = otwórzBazęDanych().execute(
+				"SELECT rodzaj, nazwa, SUM(liczba) FROM statystyki_okresowe WHERE identyfikator_serwera = ? AND rodzaj IN ('wszystkie', 'nauczyciel', 'klasa') AND poczatek >= ? AND poczatek < ? GROUP BY rodzaj, nazwa",
+				(str(identyfikatorSerwera), początek.toordinal(), koniec.toordinal())
+			).fetchall()
+
+		statystyki = defaultdict(dict)
+
+		for rodzaj, nazwa, liczba in wiersze:
+			statystyki[rodzaj][nazwa] = int(liczba)
+
+		return dict(statystyki)
+
+	return await asyncio.to_thread(odczytaj)
+
+
+async def skompaktujStatystyki(dzisiaj: date) -> None:
+	"""
+	Łączy starzejące się statystyki okresowe w większe przedziały: dzienne starsze niż 62 dni w tygodniowe, a starsze niż 400 dni w miesięczne. Statystyki starsze niż 1830 dni są usuwane, dzięki czemu liczba przechowywanych wierszy pozostaje ograniczona.
+
+	Args:
+		dzisiaj (date): Bieżąca data.
+	"""
+
+	def zwróćTydzień(dzień: int) -> tuple[int, int]:
+		"""
+		Zwraca pierwszy dzień (poniedziałek) i długość tygodnia zawierającego podany dzień.
+		"""
+
+		return dzień - date.fromordinal(dzień).weekday(), 7
+
+	def zwróćMiesiąc(dzień: int) -> tuple[int, int]:
+		"""
+		Zwraca pierwszy dzień i długość miesiąca zawierającego podany dzień.
+		"""
+
+		początekMiesiąca = date.fromordinal(dzień).replace(day=1)
+		początekNastępnego = date.fromordinal(początekMiesiąca.replace(day=28).toordinal() + 4).replace(day=1)
+
+		return początekMiesiąca.toordinal(), początekNastępnego.toordinal() - początekMiesiąca.toordinal()
+
+	def skompaktuj() -> None:
+		"""
+		Funkcja pomocnicza łącząca i usuwająca statystyki okresowe w jednej transakcji bazy danych.
+		"""
+
+		with blokadaBazyDanych:
+			połączenie = otwórzBazęDanych()
+
+			try:
+				połączenie.execute("BEGIN")
+				połączenie.execute("DELETE FROM statystyki_okresowe WHERE poczatek < ?", (dzisiaj.toordinal() - dniPrzechowywaniaStatystyk,))
+
+				# Najpierw przedziały dzienne i tygodniowe starsze niż 400 dni łączone są w miesięczne, a następnie dzienne starsze niż 62 dni w tygodniowe
+				for granica, maksymalnaDługość, zwróćPrzedział in (
+					(dzisiaj.toordinal() - dniStatystykTygodniowych, 7, zwróćMiesiąc),
+					(dzisiaj.toordinal() - dniStatystykDziennych, 1, zwróćTydzień)
+				):
+					wiersze = połączenie.execute(
+						"SELECT identyfikator_serwera, rodzaj, poczatek, nazwa, liczba FROM statystyki_okresowe WHERE poczatek < ? AND dlugosc <= ?",
+						(granica, maksymalnaDługość)
+					).fetchall()
+
+					if not wiersze:
+						continue
+
+					przedziały = defaultdict(int)
+
+					for identyfikatorSerwera, rodzaj, początek, nazwa, liczba in wiersze:
+						początekPrzedziału, długośćPrzedziału = zwróćPrzedział(początek)
+						przedziały[(identyfikatorSerwera, rodzaj, początekPrzedziału, nazwa, długośćPrzedziału)] += liczba
+
+					połączenie.executemany(
+						"DELETE FROM statystyki_okresowe WHERE identyfikator_serwera = ? AND rodzaj = ? AND poczatek = ? AND nazwa = ?",
+						[wiersz[:4] for wiersz in wiersze]
+					)
+					połączenie.executemany(
+						"INSERT INTO statystyki_okresowe VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT DO UPDATE SET dlugosc = excluded.dlugosc, liczba = liczba + excluded.liczba",
+						[(*klucz, liczba) for klucz, liczba in przedziały.items()]
 					)
-					pass
 
-			return {}
\ No newline at end of file
+				połączenie.execute("COMMIT")
+			except Exception:
+				if połączenie.in_transaction:
+					połączenie.execute("ROLLBACK")
+				raise
+
+	await asyncio.to_thread(skompaktuj)
+
+
+def zamknijBazęDanych() -> None:
+	"""
+	Zamyka połączenie z bazą danych.
+	"""
+
+	global połączenieBazy
+
+	with blokadaBazyDanych:
+		if połączenieBazy is not None:
+			połączenieBazy.close()
+			połączenieBazy = None
\ No newline at end of file
@@ -12,113 +12,539 @@
 
 # Standardowe biblioteki
 import asyncio
+from collections import defaultdict
+import contextlib
+import time
+from typing import (
+	Any,
+	Optional
+)
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
 from src.classes.constants import Constants
+from src.classes.substitution import PrzygotowaneWiadomości
+from src.handlers.data import (
+	pobierzKrokiSkrzynki,
+	zakończKrokSkrzynki,
+	zaktualizujKrokSkrzynki,
+	zarządzajPlikiemDanych
+)
 from src.handlers.logging import logiKonsoli
 from src.helpers.helpers import (
+	odmieńZastępstwa,
+	ograniczEdytowanie,
 	ograniczReagowanie,
 	ograniczUsuwanie,
-	ograniczWysyłanie
+	ograniczWysyłanie,
+	zaplanujUsunięcie
 )
 
-async def wyślijAktualizacje(
-	kanał: discord.TextChannel,
-	identyfikatorSerwera: int,
+# Zapewnienie, że skrzynka nadawcza danego serwera jest dostarczana przez jedno zadanie naraz
+blokadaDostarczaniaNaSerwer = defaultdict(lambda: asyncio.Lock())
+
+# Opóźnienie pierwszej ponownej próby dostarczenia kroku (w sekundach), podwajane przy kolejnych próbach
+podstawaOpóźnienia = 30
+
+# Maksymalne opóźnienie kolejnej próby dostarczenia kroku (w sekundach)
+maksymalneOpóźnienie = 3600
+
+# Liczba prób dostarczenia kroku, po której krok zostaje pominięty
+maksymalnaLiczbaPrób = 10
+
+def przygotujNagłówek(
 	informacjeDodatkowe: str,
-	aktualneWpisyZastępstw: list[tuple[str, list[str]]]
-) -> None:
+	liczbaUsuniętych: int = 0
+) -> discord.Embed:
 	"""
-	Wysyła aktualizacje zastępstw do konkretnego kanału tekstowego Discord.
+	Buduje osadzenie nagłówka aktualizacji, poprzedzające osadzenia z wpisami zastępstw.
 
 	Args:
-		kanał (discord.TextChannel): Kanał tekstowy Discord, na który zostaną wysłane wiadomości.
-		identyfikatorSerwera (int): ID serwera Discord.
 		informacjeDodatkowe (str): Tekst informacji dodatkowych nad zastępstwami.
-		aktualneWpisyZastępstw (list[tuple[str, list[str]]]): Lista zastępstw.
+		liczbaUsuniętych (int, optional): Liczba zastępstw usuniętych od ostatniej aktualizacji. Domyślnie 0.
+
+	Returns:
+		discord.Embed: Osadzenie nagłówka aktualizacji.
 	"""
 
-	opisTylkoDlaInformacjiDodatkowych = (
-		"**Informacje dodatkowe zastępstw:**"
-		f"\n{informacjeDodatkowe}"
-		"\n\n**Informacja o tej wiadomości:**"
-		"\nTa wiadomość zawiera informacje dodatkowe umieszczone nad zastępstwami. Nie znaleziono dla Ciebie nowych zastępstw pasujących do Twoich filtrów."
+	embed = discord.Embed(
+		title="**Zastępstwa zostały zaktualizowane!**",
+		description=(
+			"**Informacje dodatkowe zastępstw:**"
+			f"\n{informacjeDodatkowe}"
+			"\n\n**Informacja o tej wiadomości:**"
+			"\nTa wiadomość zawiera informacje dodatkowe umieszczone nad zastępstwami. Nowe lub zmienione zastępstwa znajdują się pod tą wiadomością."
+			+ zwróćDopisekUsuniętych(liczbaUsuniętych)
+		),
+		color=Constants.KOLOR
 	)
-	opisDlaInformacjiDodatkowych = (
-		"**Informacje dodatkowe zastępstw:**"
-		f"\n{informacjeDodatkowe}"
-		"\n\n**Informacja o tej wiadomości:**"
-		"\nTa wiadomość zawiera informacje dodatkowe umieszczone nad zastępstwami. Wszystkie zastępstwa znajdują się pod tą wiadomością."
+	embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+
+	return embed
+
+
+def przygotujOsadzeniaNauczyciela(
+	tytuł: str,
+	wpisyZastępstw: list[str]
+) -> list[discord.Embed]:
+	"""
+	Buduje osadzenia z wpisami zastępstw jednego nauczyciela lub grupy zastępstw bez dołączonej klasy, dzieląc zbyt długi blok na kilka osadzeń.
+
+	Args:
+		tytuł (str): Tytuł grupy wpisów.
+		wpisyZastępstw (list[str]): Sformatowane wpisy zastępstw grupy.
+
+	Returns:
+		list[discord.Embed]: Osadzenia z wpisami zastępstw, z których każde mieści się w limicie długości opisu.
+	"""
+
+	if "Zastępstwa z nieprzypisanymi klasami!" in tytuł:
+		dopisek = (
+			"\n\n**Informacja o tej wiadomości:**"
+			"\nTe zastępstwa nie posiadają dołączonej klasy, więc zweryfikuj czy przypadkiem nie dotyczą one Ciebie!"
+		)
+		stopka = "Każdy nauczyciel, którego dotyczą zastępstwa bez dołączonej klasy, został załączony w tej wiadomości."
+	else:
+		dopisek = ""
+		stopka = "Każdy nauczyciel, którego dotyczą zastępstwa pasujące do Twoich filtrów, zostanie załączany w oddzielnej wiadomości."
+
+	limit = Constants.MAKSYMALNA_DŁUGOŚĆ_OPISU
+	opisy = []
+	bieżący = ""
+
+	for wpis in wpisyZastępstw:
+		# Pojedynczy wpis dłuższy niż limit opisu jest przycinany, aby zawsze zmieścił się w osadzeniu
+		wpis = wpis[:limit]
+
+		if bieżący and len(bieżący) + 2 + len(wpis) > limit:
+			opisy.append(bieżący)
+			bieżący = wpis
+		else:
+			bieżący = f"{bieżący}\n\n{wpis}" if bieżący else wpis
+
+	if len(bieżący) + len(dopisek) > limit:
+		opisy.append(bieżący)
+		bieżący = dopisek.strip()
+	else:
+		bieżący += dopisek
+
+	opisy.append(bieżący)
+	osadzenia = []
+
+	for indeks, opis in enumerate(opisy):
+		embed = discord.Embed(
+			title=f"**{tytuł}**" if indeks == 0 else f"**{tytuł} (cd.)**",
+			description=opis,
+			color=Constants.KOLOR
+		)
+
+		if indeks == len(opisy) - 1:
+			embed.set_footer(text=stopka)
+
+		osadzenia.append(embed)
+
+	return osadzenia
+
+
+def spakujOsadzenia(grupy: list[tuple[str, list[discord.Embed]]]) -> list[tuple[list[str], list[discord.Embed]]]:
+	"""
+	Pakuje osadzenia kolejnych grup do jak najmniejszej liczby wiadomości, przestrzegając limitu liczby osadzeń i łącznej długości osadzeń w jednej wiadomości. Osadzenia jednej grupy trafiają do jednej wiadomości, o ile się w niej mieszczą, a w przeciwnym razie są kontynuowane w kolejnych wiadomościach.
+
+	Args:
+		grupy (list[tuple[str, list[discord.Embed]]]): Osadzenia według tytułu grupy (pusty tytuł oznacza nagłówek).
+
+	Returns:
+		list[tuple[list[str], list[discord.Embed]]]: Kolejne wiadomości jako tytuły grup, których osadzenia znajdują się w wiadomości (grupa kontynuowana w kolejnej wiadomości ma w niej ponownie swój tytuł), i ich osadzenia.
+	"""
+
+	wiadomości = []
+	tytuły = []
+	osadzenia = []
+	długość = 0
+
+	def mieściSię(liczba: int, znaki: int) -> bool:
+		"""
+		Sprawdza, czy do bieżącej wiadomości można dołączyć podaną liczbę osadzeń o podanej długości.
+
+		Args:
+			liczba (int): Liczba dołączanych osadzeń.
+			znaki (int): Łączna długość dołączanych osadzeń.
+
+		Returns:
+			bool: True, jeśli osadzenia mieszczą się w limitach wiadomości.
+		"""
+
+		return len(osadzenia) + liczba <= Constants.MAKSYMALNA_LICZBA_EMBEDÓW and długość + znaki <= Constants.MAKSYMALNA_DŁUGOŚĆ_EMBEDÓW
+
+	for tytuł, osadzeniaGrupy in grupy:
+		długośćGrupy = sum(len(embed) for embed in osadzeniaGrupy)
+
+		if osadzenia and not mieściSię(len(osadzeniaGrupy), długośćGrupy):
+			wiadomości.append((tytuły, osadzenia))
+			tytuły, osadzenia, długość = [], [], 0
+
+		tytuły.append(tytuł)
+
+		for embed in osadzeniaGrupy:
+			if osadzenia and not mieściSię(1, len(embed)):
+				wiadomości.append((tytuły, osadzenia))
+				tytuły, osadzenia, długość = [tytuł], [], 0
+
+			osadzenia.append(embed)
+			długość += len(embed)
+
+	if osadzenia:
+		wiadomości.append((tytuły, osadzenia))
+
+	return wiadomości
+
+
+def przygotujOsadzenieUsuniętych(tytuł: str) -> discord.Embed:
+	"""
+	Buduje osadzenie zastępujące wcześniej wysłane wpisy grupy, która zniknęła ze strony.
+
+	Args:
+		tytuł (str): Tytuł grupy wpisów.
+
+	Returns:
+		discord.Embed: Osadzenie informujące o usunięciu zastępstw.
+	"""
+
+	embed = discord.Embed(
+		title=f"**{tytuł}**",
+		description="Zastępstwa, które znajdowały się w tej wiadomości, zostały usunięte ze strony i nie są już aktualne.",
+		color=Constants.KOLOR
 	)
+	embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
 
-	try:
-		ostatniaWiadomość = None
-		tytuł = ""
+	return embed
 
-		if informacjeDodatkowe and not aktualneWpisyZastępstw:
-			embed = discord.Embed(
-				title="**Zastępstwa zostały zaktualizowane!**",
-				description=opisTylkoDlaInformacjiDodatkowych,
-				color=Constants.KOLOR
-			)
-			embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
-			await ograniczWysyłanie(kanał, embed=embed)
-
-		elif (informacjeDodatkowe and aktualneWpisyZastępstw) or (aktualneWpisyZastępstw):
-			if kanał.permissions_for(kanał.guild.me).mention_everyone:
-				wzmianka = await ograniczWysyłanie(kanał, "@everyone Zastępstwa zostały zaktualizowane!", allowed_mentions=discord.AllowedMentions(everyone=True))
-				await asyncio.sleep(5)
-				try:
-					await ograniczUsuwanie(wzmianka)
-				except Exception:
-					pass
-			else:
-				logiKonsoli.warning(
-					f"Brak uprawnień do używania @everyone dla serwera o ID {identyfikatorSerwera}. Wzmianka została pominięta."
-				)
 
-			embed = discord.Embed(
-				title="**Zastępstwa zostały zaktualizowane!**",
-				description=opisDlaInformacjiDodatkowych,
-				color=Constants.KOLOR
+def zwróćDopisekUsuniętych(liczbaUsuniętych: int) -> str:
+	"""
+	Tworzy dopisek nagłówka informujący o liczbie zastępstw usuniętych od ostatniej aktualizacji.
+
+	Args:
+		liczbaUsuniętych (int): Liczba usuniętych zastępstw.
+
+	Returns:
+		str: Dopisek lub pusty ciąg znaków, jeśli nie usunięto żadnych zastępstw.
+	"""
+
+	if not liczbaUsuniętych:
+		return ""
+
+	return (
+		"\n\n**Usunięte zastępstwa:**"
+		f"\nOd ostatniej aktualizacji ze strony usunięto {liczbaUsuniętych} {odmieńZastępstwa(liczbaUsuniętych)}."
+	)
+
+
+def przygotujWiadomości(
+	informacjeDodatkowe: str,
+	aktualneWpisyZastępstw: Optional[list[tuple[str, list[str]]]],
+	liczbaUsuniętych: int = 0
+) -> PrzygotowaneWiadomości:
+	"""
+	Buduje i pakuje osadzenia aktualizacji zastępstw, które mogą zostać wysłane bez zmian na kanały wielu serwerów.
+
+	Args:
+		informacjeDodatkowe (str): Tekst informacji dodatkowych nad zastępstwami.
+		aktualneWpisyZastępstw (Optional[list[tuple[str, list[str]]]]): Lista nowych lub zmienionych zastępstw lub None, jeśli wysyłane są wyłącznie informacje dodatkowe.
+		liczbaUsuniętych (int, optional): Liczba zastępstw usuniętych od ostatniej aktualizacji, o których informuje dopisek w nagłówku. Domyślnie 0.
+
+	Returns:
+		PrzygotowaneWiadomości: Spakowane osadzenia wraz z informacją o wzmiance i reakcji.
+	"""
+
+	if (informacjeDodatkowe or liczbaUsuniętych) and not aktualneWpisyZastępstw:
+		if informacjeDodatkowe:
+			opis = (
+				"**Informacje dodatkowe zastępstw:**"
+				f"\n{informacjeDodatkowe}"
+				"\n\n**Informacja o tej wiadomości:**"
+				"\nTa wiadomość zawiera informacje dodatkowe umieszczone nad zastępstwami. Nie znaleziono dla Ciebie nowych zastępstw pasujących do Twoich filtrów."
+			)
+		else:
+			opis = (
+				"**Informacja o tej wiadomości:**"
+				"\nNie znaleziono dla Ciebie nowych zastępstw pasujących do Twoich filtrów."
 			)
-			embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
-			await ograniczWysyłanie(kanał, embed=embed)
-
-			for tytuł, wpisyZastępstw in aktualneWpisyZastępstw:
-				if "Zastępstwa z nieprzypisanymi klasami!" in tytuł:
-					tekstZastępstw = (
-						"\n\n".join(wpisyZastępstw)
-						+ "\n\n**Informacja o tej wiadomości:**"
-						+ "\nTe zastępstwa nie posiadają dołączonej klasy, więc zweryfikuj czy przypadkiem nie dotyczą one Ciebie!"
+
+		embed = discord.Embed(
+			title="**Zastępstwa zostały zaktualizowane!**",
+			description=opis + zwróćDopisekUsuniętych(liczbaUsuniętych),
+			color=Constants.KOLOR
+		)
+		embed.set_footer(text=Constants.KRÓTSZA_STOPKA)
+		return PrzygotowaneWiadomości(osadzenia=((embed,),), tytuły=(("",),), wzmianka=False, reakcja=False)
+
+	if not aktualneWpisyZastępstw:
+		return PrzygotowaneWiadomości(osadzenia=(), tytuły=(), wzmianka=False, reakcja=False)
+
+	grupy = [("", [przygotujNagłówek(informacjeDodatkowe, liczbaUsuniętych)])]
+	grupy += [(tytuł, przygotujOsadzeniaNauczyciela(tytuł, wpisyZastępstw)) for tytuł, wpisyZastępstw in aktualneWpisyZastępstw]
+	spakowane = spakujOsadzenia(grupy)
+
+	return PrzygotowaneWiadomości(
+		osadzenia=tuple(tuple(osadzenia) for _, osadzenia in spakowane),
+		tytuły=tuple(tuple(tytuły) for tytuły, _ in spakowane),
+		wzmianka=True,
+		reakcja=not "Zastępstwa z nieprzypisanymi klasami!" in aktualneWpisyZastępstw[-1][0]
+	)
+
+
+async def wyślijWzmiankę(
+	kanał: discord.TextChannel,
+	identyfikatorSerwera: int
+) -> None:
+	"""
+	Wysyła wzmiankę @everyone o aktualizacji zastępstw i usuwa ją po pięciu sekundach.
+
+	Args:
+		kanał (discord.TextChannel): Kanał tekstowy Discord, na który zostanie wysłana wzmianka.
+		identyfikatorSerwera (int): ID serwera Discord.
+	"""
+
+	if kanał.permissions_for(kanał.guild.me).mention_everyone:
+		wzmianka = await ograniczWysyłanie(kanał, "@everyone Zastępstwa zostały zaktualizowane!", allowed_mentions=discord.AllowedMentions(everyone=True))
+		zaplanujUsunięcie(wzmianka)
+	else:
+		logiKonsoli.warning(
+			f"Brak uprawnień do używania @everyone dla serwera o ID {identyfikatorSerwera}. Wzmianka została pominięta."
+		)
+
+
+def przygotujKrok(
+	rodzaj: str,
+	tytuły: tuple[str, ...] | list[str],
+	osadzenia: tuple[discord.Embed, ...] | list[discord.Embed],
+	sumyKontrolne: Optional[dict[str, str]],
+	data: str,
+	identyfikatorWiadomości: Optional[int] = None,
+	kontynuowane: set[str] = frozenset()
+) -> dict[str, Any]:
+	"""
+	Buduje krok skrzynki nadawczej wysyłający lub edytujący jedną wiadomość, z osadzeniami zapisanymi w formacie `JSON`, dzięki czemu ponowienie kroku nie wymaga ponownego budowania osadzeń.
+
+	Args:
+		rodzaj (str): Rodzaj kroku (`wyslij` lub `edytuj`).
+		tytuły (tuple[str, ...] | list[str]): Tytuły grup wpisów zawartych w wiadomości (pusty tytuł oznacza nagłówek).
+		osadzenia (tuple[discord.Embed, ...] | list[discord.Embed]): Osadzenia wiadomości.
+		sumyKontrolne (Optional[dict[str, str]]): Sumy kontrolne grup według tytułu. Jeśli None, ID wiadomości nie zostanie zapamiętane.
+		data (str): Data wiadomości w formacie ISO.
+		identyfikatorWiadomości (Optional[int], optional): ID edytowanej wiadomości. Domyślnie None.
+		kontynuowane (set[str], optional): Tytuły grup rozpoczętych we wcześniejszym kroku, których ID wiadomości zostanie dopisane do już zapamiętanych. Domyślnie pusty zbiór.
+
+	Returns:
+		dict[str, Any]: Krok skrzynki nadawczej.
+	"""
+
+	return {
+		"rodzaj": rodzaj,
+		"osadzenia": [osadzenie.to_dict() for osadzenie in osadzenia],
+		"tytuly": {tytuł: sumyKontrolne.get(tytuł, "") for tytuł in tytuły} if sumyKontrolne is not None else {},
+		"kontynuowane": [tytuł for tytuł in tytuły if tytuł in kontynuowane],
+		"data": data,
+		"reakcja": False,
+		"identyfikator-wiadomosci": identyfikatorWiadomości
+	}
+
+
+def zaplanujWysłanie(
+	wiadomości: PrzygotowaneWiadomości,
+	data: str,
+	sumyKontrolne: Optional[dict[str, str]] = None
+) -> list[dict[str, Any]]:
+	"""
+	Zamienia przygotowane wcześniej aktualizacje zastępstw na kroki skrzynki nadawczej, po kilka osadzeń w jednej wiadomości.
+
+	Args:
+		wiadomości (PrzygotowaneWiadomości): Osadzenia zbudowane i spakowane jednorazowo dla grupy serwerów o identycznych filtrach.
+		data (str): Data wiadomości w formacie ISO.
+		sumyKontrolne (Optional[dict[str, str]], optional): Sumy kontrolne grup według tytułu. Jeśli None, ID wysłanych wiadomości nie zostaną zapamiętane. Domyślnie None.
+
+	Returns:
+		list[dict[str, Any]]: Kroki skrzynki nadawczej.
+	"""
+
+	kroki = [{"rodzaj": "wzmianka"}] if wiadomości.wzmianka else []
+	rozpoczęte = set()
+
+	for tytuły, osadzenia in zip(wiadomości.tytuły, wiadomości.osadzenia):
+		kroki.append(przygotujKrok("wyslij", tytuły, osadzenia, sumyKontrolne, data, kontynuowane=rozpoczęte))
+		rozpoczęte.update(tytuły)
+
+	if wiadomości.reakcja and kroki and kroki[-1]["rodzaj"] == "wyslij":
+		kroki[-1]["reakcja"] = True
+
+	return kroki
+
+
+def zaplanujEdycję(
+	wiadomościDoEdycji: list[tuple[list[int], list[tuple[str, list[discord.Embed]]]]],
+	noweGrupy: list[tuple[str, list[discord.Embed]]],
+	wzmianka: bool,
+	sumyKontrolne: dict[str, str],
+	data: str
+) -> list[dict[str, Any]]:
+	"""
+	Zamienia zmienione wiadomości na kroki skrzynki nadawczej edytujące wcześniej wysłane wiadomości, a nowe grupy na kroki wysyłające nowe wiadomości. Wiadomości zestawu, które po zmianie nie są już potrzebne, są usuwane.
+
+	Args:
+		wiadomościDoEdycji (list[tuple[list[int], list[tuple[str, list[discord.Embed]]]]]): Zestawy powiązanych wiadomości jako ich ID (w kolejności na kanale) i pełna, aktualna zawartość ich grup.
+		noweGrupy (list[tuple[str, list[discord.Embed]]]): Osadzenia grup, które nie mają jeszcze swojej wiadomości.
+		wzmianka (bool): Informuje, czy przed zmianami należy wysłać wzmiankę @everyone.
+		sumyKontrolne (dict[str, str]): Sumy kontrolne grup według tytułu (pusty tytuł oznacza nagłówek).
+		data (str): Data wiadomości w formacie ISO.
+
+	Returns:
+		list[dict[str, Any]]: Kroki skrzynki nadawczej.
+	"""
+
+	kroki = [{"rodzaj": "wzmianka"}] if wzmianka else []
+	rozpoczęte = set()
+	przelane = []
+
+	for identyfikatory, grupy in wiadomościDoEdycji:
+		spakowane = spakujOsadzenia(grupy)
+
+		for (tytuły, osadzenia), identyfikatorWiadomości in zip(spakowane, identyfikatory):
+			kroki.append(przygotujKrok("edytuj", tytuły, osadzenia, sumyKontrolne, data, identyfikatorWiadomości, rozpoczęte))
+			rozpoczęte.update(tytuły)
+
+		# Wiadomości zestawu, których zawartość po zmianie zmieściła się we wcześniejszych wiadomościach, są usuwane
+		for identyfikatorWiadomości in identyfikatory[len(spakowane):]:
+			kroki.append({"rodzaj": "usun", "identyfikator-wiadomosci": identyfikatorWiadomości})
+
+		# Osadzenia, które po zmianie nie mieszczą się już w wiadomościach zestawu (także dalsze części grup), trafiają do nowych wiadomości w niezmienionej kolejności
+		przelane.extend(spakowane[len(identyfikatory):])
+
+	for tytuły, osadzenia in przelane + spakujOsadzenia(noweGrupy):
+		kroki.append(przygotujKrok("wyslij", tytuły, osadzenia, sumyKontrolne, data, kontynuowane=rozpoczęte))
+		rozpoczęte.update(tytuły)
+
+	return kroki
+
+
+async def wykonajKrok(
+	kanał: discord.TextChannel,
+	identyfikatorSerwera: str,
+	identyfikatorKroku: int,
+	krok: dict[str, Any]
+) -> Optional[int]:
+	"""
+	Wykonuje pojedynczy krok ze skrzynki nadawczej. ID wysłanej wiadomości jest zapisywane w kroku od razu po jej wysłaniu, więc jeśli nie udało się dodać reakcji lub zakończyć kroku, jego ponowienie nie wysyła wiadomości drugi raz, a jedynie edytuje ją lub dodaje reakcję.
+
+	Args:
+		kanał (discord.TextChannel): Kanał tekstowy Discord, na który dostarczany jest krok.
+		identyfikatorSerwera (str): ID serwera Discord.
+		identyfikatorKroku (int): ID kroku w skrzynce nadawczej.
+		krok (dict[str, Any]): Krok skrzynki nadawczej.
+
+	Returns:
+		Optional[int]: ID wysłanej lub edytowanej wiadomości, lub None dla wzmianki i usunięcia.
+	"""
+
+	rodzaj = krok.get("rodzaj", "")
+
+	if rodzaj == "wzmianka":
+		await wyślijWzmiankę(kanał, identyfikatorSerwera)
+		return None
+
+	if rodzaj == "usun":
+		with contextlib.suppress(discord.NotFound):
+			await ograniczUsuwanie(kanał.get_partial_message(krok["identyfikator-wiadomosci"]))
+		return None
+
+	osadzenia = [discord.Embed.from_dict(osadzenie) for osadzenie in krok.get("osadzenia", [])]
+	identyfikatorWiadomości = krok.get("identyfikator-wiadomosci")
+
+	if rodzaj == "edytuj":
+		try:
+			await ograniczEdytowanie(kanał.get_partial_message(identyfikatorWiadomości), embeds=osadzenia)
+			return identyfikatorWiadomości
+		except discord.NotFound:
+			# Wiadomość została usunięta z kanału, więc jej zawartość zostanie wysłana ponownie
+			identyfikatorWiadomości = None
+
+	if identyfikatorWiadomości is None:
+		identyfikatorWiadomości = (await ograniczWysyłanie(kanał, embeds=osadzenia)).id
+
+		# Zapamiętanie wysłanej wiadomości, aby ponowienie kroku nie wysłało jej drugi raz
+		krok["identyfikator-wiadomosci"] = identyfikatorWiadomości
+		await zaktualizujKrokSkrzynki(identyfikatorKroku, krok)
+
+	if krok.get("reakcja"):
+		with contextlib.suppress(discord.NotFound):
+			await ograniczReagowanie(kanał.get_partial_message(identyfikatorWiadomości), "❤️")
+
+	return identyfikatorWiadomości
+
+
+async def dostarczKroki(
+	bot: discord.Client,
+	identyfikatorSerwera: int | str
+) -> bool:
+	"""
+	Dostarcza kroki ze skrzynki nadawczej serwera, zaczynając od pierwszego niedostarczonego. Każdy dostarczony krok jest usuwany ze skrzynki wraz z zapisaniem ID jego wiadomości. Po nieudanej próbie krok otrzymuje wykładniczo wydłużany termin kolejnej próby, a dostarczanie zostaje wstrzymane, aby zachować kolejność wiadomości.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+		identyfikatorSerwera (int | str): ID serwera Discord.
+
+	Returns:
+		bool: True, jeśli skrzynka nadawcza serwera jest pusta, False w przeciwnym razie.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+
+	async with blokadaDostarczaniaNaSerwer[identyfikatorSerwera]:
+		for identyfikatorKroku, identyfikatorKanału, krok, próby, termin in await pobierzKrokiSkrzynki(identyfikatorSerwera):
+			if termin > time.time():
+				return False
+
+			try:
+				kanał = bot.get_channel(identyfikatorKanału)
+
+				if kanał is None:
+					raise LookupError(f"Nie znaleziono kanału o ID {identyfikatorKanału}.")
+
+				identyfikatorWiadomości = await wykonajKrok(kanał, identyfikatorSerwera, identyfikatorKroku, krok)
+			except Exception as e:
+				if próby + 1 >= maksymalnaLiczbaPrób:
+					logiKonsoli.exception(
+						f"Nie udało się dostarczyć wiadomości do serwera o ID {identyfikatorSerwera} po {maksymalnaLiczbaPrób} próbach. Wiadomość zostanie pominięta. Więcej informacji: {e}"
 					)
-				else:
-					tekstZastępstw = "\n\n".join(wpisyZastępstw)
+					await zakończKrokSkrzynki(identyfikatorSerwera, identyfikatorKroku)
+					continue
 
-				embed = discord.Embed(
-					title=f"**{tytuł}**",
-					description=tekstZastępstw,
-					color=Constants.KOLOR
+				opóźnienie = min(maksymalneOpóźnienie, podstawaOpóźnienia * 2 ** próby)
+				logiKonsoli.warning(
+					f"Nie udało się dostarczyć wiadomości do serwera o ID {identyfikatorSerwera}. Kolejna próba nastąpi za {opóźnienie} s. Więcej informacji: {e}"
 				)
+				await zaktualizujKrokSkrzynki(identyfikatorKroku, krok, próby + 1, time.time() + opóźnienie)
+				return False
 
-				if not "Zastępstwa z nieprzypisanymi klasami!" in tytuł:
-					embed.set_footer(text="Każdy nauczyciel, którego dotyczą zastępstwa pasujące do Twoich filtrów, zostanie załączany w oddzielnej wiadomości.")
-				else:
-					embed.set_footer(text="Każdy nauczyciel, którego dotyczą zastępstwa bez dołączonej klasy, został załączony w tej wiadomości.")
+			dane = None
 
-				ostatniaWiadomość = await ograniczWysyłanie(kanał, embed=embed)
+			if krok.get("tytuly"):
+				# Zapamiętywane są ID wszystkich wiadomości bieżącego dnia zajmowanych przez blok oraz jego suma kontrolna
+				dane = await zarządzajPlikiemDanych(identyfikatorSerwera)
+				wysłaneWiadomości = dane.get("wiadomosci-zastepstw", {}) if dane.get("data-wiadomosci", "") == krok["data"] else {}
 
-		if ostatniaWiadomość and not "Zastępstwa z nieprzypisanymi klasami!" in tytuł:
-			await ograniczReagowanie(ostatniaWiadomość, "❤️")
+				for tytuł, sumaKontrolna in krok["tytuly"].items():
+					if tytuł in krok.get("kontynuowane", []) and tytuł in wysłaneWiadomości:
+						if identyfikatorWiadomości not in wysłaneWiadomości[tytuł][0]:
+							wysłaneWiadomości[tytuł][0].append(identyfikatorWiadomości)
+					else:
+						wysłaneWiadomości[tytuł] = [[identyfikatorWiadomości], sumaKontrolna]
 
-	except discord.DiscordException as e:
-		logiKonsoli.exception(
-			f"Wystąpił błąd podczas wysyłania wiadomości do serwera o ID {identyfikatorSerwera}. Więcej informacji: {e}"
-		)
-	except Exception as e:
-		logiKonsoli.exception(
-			f"Wystąpił nieoczekiwany błąd podczas wysyłania wiadomości do serwera o ID {identyfikatorSerwera}. Więcej informacji: {e}"
-		)
\ No newline at end of file
+				dane["wiadomosci-zastepstw"] = wysłaneWiadomości
+				dane["data-wiadomosci"] = krok["data"]
+
+			await zakończKrokSkrzynki(identyfikatorSerwera, identyfikatorKroku, dane)
+
+	return True
\ No newline at end of file
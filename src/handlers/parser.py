@@ -11,132 +11,511 @@
 #
 
 # Standardowe biblioteki
+import codecs
 from collections import defaultdict
+from html.parser import HTMLParser
 import re
 from typing import (
+	Any,
 	Iterable,
+	Iterator,
 	Optional
 )
 
 # Zewnętrzne biblioteki
 from bs4 import (
 	BeautifulSoup,
+	CData,
 	NavigableString,
 	Tag
 )
 
+try:
+	import lxml.html
+except ImportError:
+	lxml = None
+
 # Wewnętrzne importy
+from src.classes.substitution import (
+	FiltrZastępstw,
+	KomórkaTabeli,
+	WpisZastępstwa
+)
 from src.handlers.logging import logiKonsoli
 from src.helpers.helpers import (
 	normalizujTekst,
 	zwróćNazwyKluczy
 )
 
-def wyodrębnijDane(
-	zawartośćStrony: Optional[BeautifulSoup],
-	wybraneKlasy: Optional[list[str]],
-	wybraniNauczyciele: Optional[list[str]],
-	listaKlas: Optional[list[str]]
-) -> tuple[str, list[tuple[str, list[str]]]]:
+# Dostępne parsery HTML, które mogą zostać wybrane dla szkoły w pliku konfiguracyjnym
+dostępneParsery = ("html.parser", "lxml", "strumieniowy")
+
+# Typy węzłów tekstowych uwzględniane podczas wyodrębniania tekstu (bez komentarzy, deklaracji itp.)
+typyTekstu = (NavigableString, CData)
+
+# Tablica usuwająca białe znaki ASCII, używana do wykrywania fragmentów tekstu złożonych wyłącznie z białych znaków
+tablicaBiałychZnaków = str.maketrans("", "", " \n\t\x0c\r")
+
+# Wstępnie skompilowane wzorce czyszczenia tekstu komórek
+wzórZnakówWokółNowejLinii = re.compile(r"[ \t]*\n[ \t]*")
+wzórWielokrotnychSpacji = re.compile(r"[ \t]{2,}")
+wzórPodwójnejNowejLinii = re.compile(r"\n\n")
+wzórWielokrotnejNowejLinii = re.compile(r"\n{3,}")
+
+def wyczyśćTekst(tekst: str) -> str:
 	"""
-	Wyodrębnia, przetwarza i filtruje dane zastępstw z pobranego pliku strony internetowej.
+	Czyści i normalizuje surowy tekst komórki strony internetowej.
 
 	Args:
-		zawartośćStrony (Optional[BeautifulSoup]): Obiekt BeautifulSoup reprezentujący stronę HTML.
-		wybraneKlasy (Optional[list[str]]): Lista wybranych klas, które mają być wykorzystane do filtracji.
-		wybraniNauczyciele (Optional[list[str]]): Lista wybranych nauczycieli, którzy mają być wykorzystani do filtracji.
-		listaKlas (Optional[list[str]]): Lista wszystkich klas wprowadzonych w pliku konfiguracyjnym.
+		tekst (str): Surowy tekst komórki, w którym znaczniki <br> zostały zamienione na znaki nowej linii.
 
 	Returns:
-		tuple[str, list[tuple[str, list[str]]]]:
-			informacjeDodatkowe: Informacje znajdujące się nad zastępstwami.
-			wpisyZastępstw: Wpisy zastępstw sortowane według nauczyciela.
+		str: Oczyszczony i znormalizowany tekst.
+	"""
+
+	if not tekst:
+		return ""
+
+	tekst = tekst.replace("\r\n", "\n").replace("\r", "\n")
+	tekst = tekst.replace("\xa0", " ")
+	tekst = wzórZnakówWokółNowejLinii.sub("\n", tekst)
+	tekst = wzórWielokrotnychSpacji.sub(" ", tekst)
+	tekst = wzórPodwójnejNowejLinii.sub("\n", tekst)
+	tekst = wzórWielokrotnejNowejLinii.sub("\n\n", tekst)
+
+	return tekst.strip("\n ")
+
+
+def ujednolićFragment(tekst: str) -> str:
+	"""
+	Zwija fragment tekstu złożony wyłącznie z białych znaków tak samo, jak robi to BeautifulSoup, aby wszystkie parsery zwracały identyczny tekst.
+
+	Args:
+		tekst (str): Ciągły fragment tekstu znajdujący się pomiędzy znacznikami.
+
+	Returns:
+		str: Niezmieniony fragment lub pojedynczy znak nowej linii albo spacji.
+	"""
+
+	if not tekst or tekst.translate(tablicaBiałychZnaków):
+		return tekst
+
+	return "\n" if "\n" in tekst else " "
+
+
+def utwórzKomórkę(
+	części: list[str],
+	klasy: tuple[str, ...],
+	odnośnik: Optional[tuple[int, int, Optional[str]]]
+) -> KomórkaTabeli:
+	"""
+	Tworzy komórkę tabeli z zebranych fragmentów tekstu, zapisując pierwszy odnośnik komórki w formacie Markdown.
+
+	Args:
+		części (list[str]): Fragmenty surowego tekstu komórki w kolejności występowania.
+		klasy (tuple[str, ...]): Klasy HTML komórki.
+		odnośnik (Optional[tuple[int, int, Optional[str]]]): Zakres fragmentów tekstu pierwszego odnośnika komórki i jego adres URL.
+
+	Returns:
+		KomórkaTabeli: Komórka tabeli niezależna od wykorzystanego parsera HTML.
+	"""
+
+	tekst = wyczyśćTekst("".join(części))
+	tekstZOdnośnikiem = tekst
+
+	if odnośnik and odnośnik[2]:
+		początek, koniec, urlLinku = odnośnik
+		tekstLinku = wyczyśćTekst("".join(części[początek:koniec]))
+		tekstZOdnośnikiem = wyczyśćTekst("".join(części[:początek]) + f"[{tekstLinku}]({urlLinku})" + "".join(części[koniec:]))
+
+	return KomórkaTabeli(tekst=tekst, klasy=klasy, tekstZOdnośnikiem=tekstZOdnośnikiem)
+
+
+def wyodrębnijWierszeBeautifulSoup(zawartośćStrony: BeautifulSoup) -> list[list[KomórkaTabeli]]:
 	"""
+	Wyodrębnia wiersze tabeli zastępstw z drzewa BeautifulSoup.
 
-	def wyczyśćTekst(węzeł: Optional[Tag | str]) -> str:
+	Args:
+		zawartośćStrony (BeautifulSoup): Obiekt BeautifulSoup reprezentujący stronę HTML.
+
+	Returns:
+		list[list[KomórkaTabeli]]: Wiersze (<tr>) tabeli z ich komórkami (<td>).
+	"""
+
+	def zbierzTekst(
+		węzeł: Tag,
+		części: list[str],
+		odnośnik: dict[str, Any]
+	) -> None:
 		"""
-		Czyści i normalizuje zawartość pobranego pliku strony internetowej.
+		Zbiera fragmenty tekstu węzła w jednym przejściu po jego potomkach, zamieniając znaczniki <br> na znaki nowej linii.
 
 		Args:
-			węzeł (Optional[Tag | str]): Element strony internetowej do przetworzenia.
+			węzeł (Tag): Element strony internetowej do przetworzenia.
+			części (list[str]): Lista, do której dopisywane są fragmenty tekstu.
+			odnośnik (dict[str, Any]): Stan pierwszego odnośnika komórki, uzupełniany podczas przejścia.
+		"""
+
+		for dziecko in węzeł.children:
+			if type(dziecko) in typyTekstu:
+				części.append(dziecko)
+			elif isinstance(dziecko, Tag):
+				if dziecko.name == "br":
+					części.append("\n")
+				elif dziecko.name == "a" and "początek" not in odnośnik:
+					odnośnik["początek"] = len(części)
+					zbierzTekst(dziecko, części, odnośnik)
+					odnośnik["koniec"] = len(części)
+					odnośnik["url"] = dziecko.get("href")
+				else:
+					zbierzTekst(dziecko, części, odnośnik)
+
+	wiersze = []
+
+	for wiersz in zawartośćStrony.find_all("tr"):
+		komórki = []
+
+		for komórka in wiersz.find_all("td"):
+			części = []
+			odnośnik = {}
+			klasy = komórka.get("class", [])
+
+			if isinstance(klasy, str):
+				klasy = [klasy]
+
+			zbierzTekst(komórka, części, odnośnik)
+			komórki.append(utwórzKomórkę(części, tuple(klasy), (odnośnik["początek"], odnośnik["koniec"], odnośnik["url"]) if odnośnik else None))
+
+		wiersze.append(komórki)
+
+	return wiersze
+
+
+def wyodrębnijWierszeLxml(tekst: str) -> list[list[KomórkaTabeli]]:
+	"""
+	Wyodrębnia wiersze tabeli zastępstw bezpośrednio z drzewa biblioteki lxml, bez tworzenia obiektów BeautifulSoup.
+
+	Args:
+		tekst (str): Zdekodowana treść strony HTML.
+
+	Returns:
+		list[list[KomórkaTabeli]]: Wiersze (<tr>) tabeli z ich komórkami (<td>).
+	"""
+
+	def zbierzTekst(
+		element: Any,
+		części: list[str],
+		odnośnik: dict[str, Any]
+	) -> None:
+		"""
+		Zbiera fragmenty tekstu elementu lxml, zamieniając znaczniki <br> na znaki nowej linii i pomijając komentarze.
+
+		Args:
+			element (Any): Element drzewa lxml do przetworzenia.
+			części (list[str]): Lista, do której dopisywane są fragmenty tekstu.
+			odnośnik (dict[str, Any]): Stan pierwszego odnośnika komórki, uzupełniany podczas przejścia.
+		"""
+
+		if element.text:
+			części.append(ujednolićFragment(element.text))
+
+		for dziecko in element:
+			if isinstance(dziecko.tag, str):
+				if dziecko.tag == "br":
+					części.append("\n")
+				elif dziecko.tag == "a" and "początek" not in odnośnik:
+					odnośnik["początek"] = len(części)
+					zbierzTekst(dziecko, części, odnośnik)
+					odnośnik["koniec"] = len(części)
+					odnośnik["url"] = dziecko.get("href")
+				else:
+					zbierzTekst(dziecko, części, odnośnik)
+
+			if dziecko.tail:
+				części.append(ujednolićFragment(dziecko.tail))
+
+	wiersze = []
+
+	for wiersz in lxml.html.document_fromstring(tekst).iter("tr"):
+		komórki = []
+
+		for komórka in wiersz.iter("td"):
+			części = []
+			odnośnik = {}
+
+			zbierzTekst(komórka, części, odnośnik)
+			komórki.append(utwórzKomórkę(części, tuple((komórka.get("class") or "").split()), (odnośnik["początek"], odnośnik["koniec"], odnośnik["url"]) if odnośnik else None))
+
+		wiersze.append(komórki)
+
+	return wiersze
+
+
+class CzytnikTabeli(HTMLParser):
+	"""
+	Strumieniowy tokenizer HTML, który wyodrębnia wyłącznie wiersze (<tr>) i komórki (<td>) tabeli zastępstw wraz z ich klasami.
+	Może być zasilany fragmentami treści strony, a zamknięte wiersze odbierane są na bieżąco przez `pobierzWiersze`.
+
+	Attributes:
+		wiersze (list[list[KomórkaTabeli]]): Wiersze tabeli zamknięte i jeszcze nieodebrane.
+	"""
+
+	def __init__(self) -> None:
+		super().__init__(convert_charrefs=True)
+		self.wiersze = []
+		self.wiersz = None
+		self.części = None
+		self.bufor = []
+		self.klasy = ()
+		self.odnośnik = None
+		self.wOdnośniku = False
+
+	def opróżnijBufor(self) -> None:
+		"""
+		Dopisuje zbuforowany ciągły fragment tekstu do aktualnej komórki, ponieważ tokenizer może dostarczyć go w kilku częściach.
+		"""
+
+		if self.bufor:
+			self.części.append(ujednolićFragment("".join(self.bufor)))
+			self.bufor = []
+
+	def pobierzWiersze(self) -> list[list[KomórkaTabeli]]:
+		"""
+		Zwraca wiersze zamknięte od ostatniego wywołania i usuwa je z tokenizera.
 
 		Returns:
-			str: Oczyszczony i znormalizowany tekst.
+			list[list[KomórkaTabeli]]: Zamknięte wiersze tabeli.
 		"""
 
-		if not węzeł:
-			return ""
+		wiersze, self.wiersze = self.wiersze, []
+		return wiersze
 
-		tymczasowy = BeautifulSoup(str(węzeł), "html.parser")
+	def zamknijKomórkę(self) -> None:
+		"""
+		Zamyka aktualnie otwartą komórkę i dodaje ją do aktualnego wiersza.
+		"""
 
-		try:
-			for br in tymczasowy.find_all("br"):
-				br.replace_with(NavigableString("\n"))
+		if self.części is None:
+			return
+
+		self.opróżnijBufor()
+
+		if self.wOdnośniku:
+			self.odnośnik[1] = len(self.części)
+			self.wOdnośniku = False
+
+		self.wiersz.append(utwórzKomórkę(self.części, self.klasy, tuple(self.odnośnik) if self.odnośnik else None))
+		self.części = None
+		self.odnośnik = None
+
+	def zamknijWiersz(self) -> None:
+		"""
+		Zamyka aktualnie otwarty wiersz wraz z jego ostatnią komórką.
+		"""
+
+		self.zamknijKomórkę()
+
+		if self.wiersz is not None:
+			self.wiersze.append(self.wiersz)
+			self.wiersz = None
+
+	def handle_starttag(
+		self,
+		tag: str,
+		attrs: list[tuple[str, Optional[str]]]
+	) -> None:
+		if self.części is not None:
+			self.opróżnijBufor()
+
+		if tag == "tr":
+			self.zamknijWiersz()
+			self.wiersz = []
+
+		elif tag == "td" and self.wiersz is not None:
+			self.zamknijKomórkę()
+			self.części = []
+			self.klasy = tuple((dict(attrs).get("class") or "").split())
+
+		elif self.części is not None:
+			if tag == "br":
+				self.części.append("\n")
+			elif tag == "a" and self.odnośnik is None:
+				self.odnośnik = [len(self.części), len(self.części), dict(attrs).get("href")]
+				self.wOdnośniku = True
+
+	def handle_endtag(self, tag: str) -> None:
+		if self.części is not None:
+			self.opróżnijBufor()
+
+		if tag == "a" and self.wOdnośniku:
+			self.odnośnik[1] = len(self.części)
+			self.wOdnośniku = False
+
+		elif tag == "td":
+			self.zamknijKomórkę()
+
+		elif tag in ("tr", "table"):
+			self.zamknijWiersz()
+
+	def handle_data(self, data: str) -> None:
+		if self.części is not None:
+			self.bufor.append(data)
+
+	def handle_comment(self, data: str) -> None:
+		if self.części is not None:
+			self.opróżnijBufor()
+
+	def close(self) -> None:
+		super().close()
+		self.zamknijWiersz()
+
+
+def czytajWiersze(fragmenty: Iterable[str]) -> Iterator[list[KomórkaTabeli]]:
+	"""
+	Zwraca wiersze tabeli zastępstw na bieżąco, w miarę zasilania tokenizera kolejnymi fragmentami treści strony.
+
+	Args:
+		fragmenty (Iterable[str]): Kolejne zdekodowane fragmenty treści strony HTML.
+
+	Yields:
+		list[KomórkaTabeli]: Kolejny zamknięty wiersz (<tr>) tabeli z jego komórkami (<td>).
+	"""
+
+	czytnik = CzytnikTabeli()
+
+	for fragment in fragmenty:
+		czytnik.feed(fragment)
+		yield from czytnik.pobierzWiersze()
+
+	czytnik.close()
+	yield from czytnik.pobierzWiersze()
+
+
+def czytajWierszeStrumieniowo(
+	fragmenty: Iterable[bytes],
+	kodowanie: str
+) -> Iterator[list[KomórkaTabeli]]:
+	"""
+	Dekoduje i tokenizuje surowe fragmenty treści strony dopiero podczas iteracji, zwracając wiersze tabeli zastępstw bez budowania pełnego tekstu strony ani drzewa DOM. Tokenizacja odbywa się w wątku, który konsumuje wiersze.
+
+	Args:
+		fragmenty (Iterable[bytes]): Kolejne surowe fragmenty treści odpowiedzi HTTP.
+		kodowanie (str): Kodowanie użyte do odczytu treści strony internetowej.
+
+	Yields:
+		list[KomórkaTabeli]: Kolejny zamknięty wiersz (<tr>) tabeli z jego komórkami (<td>).
+	"""
+
+	dekoder = codecs.getincrementaldecoder(kodowanie)(errors="ignore")
+
+	def dekoduj() -> Iterator[str]:
+		"""
+		Funkcja pomocnicza dekodująca kolejne fragmenty z zachowaniem znaków podzielonych pomiędzy fragmentami.
+
+		Yields:
+			str: Kolejny zdekodowany fragment treści strony.
+		"""
+
+		for fragment in fragmenty:
+			yield dekoder.decode(fragment)
+
+		yield dekoder.decode(b"", final=True)
+
+	yield from czytajWiersze(dekoduj())
+
+
+def wyodrębnijWiersze(
+	tekst: str,
+	parser: str = "html.parser"
+) -> list[list[KomórkaTabeli]]:
+	"""
+	Wyodrębnia wiersze tabeli zastępstw z treści strony przy pomocy wybranego parsera HTML.
+
+	Args:
+		tekst (str): Zdekodowana treść strony HTML.
+		parser (str, optional): Nazwa parsera (`html.parser`, `lxml` lub `strumieniowy`). Domyślnie `html.parser`.
+
+	Returns:
+		list[list[KomórkaTabeli]]: Wiersze (<tr>) tabeli z ich komórkami (<td>).
+	"""
+
+	if parser not in dostępneParsery:
+		logiKonsoli.warning(
+			f"Nieznany parser HTML ({parser}). Dostępne parsery: {', '.join(dostępneParsery)}. Zostanie użyty parser html.parser."
+		)
+		parser = "html.parser"
 
-			for tag in tymczasowy.find_all(True):
-				tag.unwrap()
+	if parser == "lxml" and lxml is None:
+		logiKonsoli.warning(
+			"Biblioteka lxml nie jest zainstalowana. Zostanie użyty parser html.parser."
+		)
+		parser = "html.parser"
+
+	if parser == "lxml":
+		try:
+			return wyodrębnijWierszeLxml(tekst)
 		except Exception as e:
 			logiKonsoli.exception(
-				f"Wystąpił błąd podczas rozpakowywania tagów. Więcej informacji: {e}"
+				f"Wystąpił błąd podczas przetwarzania strony parserem lxml. Zostanie użyty parser html.parser. Więcej informacji: {e}"
 			)
 
-		tekst = tymczasowy.get_text(separator="")
-		tekst = tekst.replace("\r\n", "\n").replace("\r", "\n")
-		tekst = tekst.replace("\xa0", " ")
-		tekst = re.sub(r"[ \t]*\n[ \t]*", "\n", tekst)
-		tekst = re.sub(r"[ \t]{2,}", " ", tekst)
-		tekst = re.sub(r"\n\n", "\n", tekst)
-		tekst = re.sub(r"\n{3,}", "\n\n", tekst)
+	if parser == "strumieniowy":
+		return list(czytajWiersze([tekst]))
 
-		return tekst.strip("\n ")
+	return wyodrębnijWierszeBeautifulSoup(BeautifulSoup(tekst, "html.parser"))
 
-	def sprawdźKlasyKomórki(
-		komórka: Tag,
-		nazwy: Iterable[str]
-	) -> bool:
+
+def wyodrębnijDaneSzkoły(
+	wiersze: Optional[Iterable[list[KomórkaTabeli]]],
+	listaKlas: Optional[list[str]]
+) -> tuple[str, list[WpisZastępstwa]]:
+	"""
+	Wyodrębnia i przetwarza dane zastępstw z wierszy tabeli strony internetowej jednorazowo dla całej szkoły, bez filtracji.
+
+	Args:
+		wiersze (Optional[Iterable[list[KomórkaTabeli]]]): Wiersze tabeli zastępstw wyodrębnione przez wybrany parser HTML (lista lub generator).
+		listaKlas (Optional[list[str]]): Lista wszystkich klas wprowadzonych w pliku konfiguracyjnym dla szkoły.
+
+	Returns:
+		tuple[str, list[WpisZastępstwa]]:
+			informacjeDodatkowe: Informacje znajdujące się nad zastępstwami.
+			wpisy: Ustrukturyzowane wiersze zastępstw w kolejności występowania na stronie.
+	"""
+
+	def sprawdźPusty(tekst: str) -> bool:
 		"""
-		Sprawdza, czy dana komórka HTML zawiera przynajmniej jedną z podanych klas `(np. class=st0)`.
+		Sprawdza, czy tekst komórki jest pusty.
 
 		Args:
-			komórka (Tag): Element HTML (np. <td>) do sprawdzenia.
-			nazwy (Iterable[str]): Kolekcja nazw klas (lista, zbiór itp.) do dopasowania.
+			tekst (str): Oczyszczony tekst komórki.
 
 		Returns:
-			bool: True, jeśli komórka zawiera którąkolwiek z klas, False w przeciwnym razie.
+			bool: True, jeśli tekst jest pusty lub zawiera wyłącznie `&nbsp;`, False w przeciwnym razie.
 		"""
 
-		klasy = komórka.get("class", [])
-
-		if isinstance(klasy, str):
-			klasy = [klasy]
+		tymczasowy = tekst.strip()
+		return not tymczasowy or tymczasowy == "&nbsp;"
 
-		return any(klasa in nazwy for klasa in klasy)
-
-	def sprawdźIstnienieZastępstw(wiersze: list[Tag]) -> bool:
+	def sprawdźZastępstwo(komórki: list[KomórkaTabeli]) -> bool:
 		"""
-		Sprawdza, czy w tabeli HTML istnieje przynajmniej jeden wiersz z realnym zastępstwem.
+		Sprawdza, czy wiersz tabeli zawiera realne zastępstwo.
 
 		Args:
-			wiersze (list[Tag]): Lista wierszy (<tr>) pobranych z obiektu BeautifulSoup.
+			komórki (list[KomórkaTabeli]): Komórki wiersza tabeli zastępstw.
 
 		Returns:
-			bool: True, jeśli przynajmniej jeden wiersz zawiera dane zastępstwo, False w przeciwnym razie.
+			bool: True, jeśli wiersz zawiera dane zastępstwo, False w przeciwnym razie.
 		"""
 
-		nagłówki = {"lekcja", "opis", "zastępca", "uwagi"}
-
-		for wiersz in wiersze:
-			komórki = wiersz.find_all("td")
-
-			if len(komórki) >= 4:
-				teksty = [wyczyśćTekst(td).lower() for td in komórki[:4]]
-				jestPuste = all(tekst == "" or tekst == "&nbsp;" for tekst in teksty)
-				jestNagłówek = set(tekst.strip().lower() for tekst in teksty) <= nagłówki
+		if len(komórki) < 4:
+			return False
 
-				if not jestPuste and not jestNagłówek:
-					return True
+		nagłówki = {"lekcja", "opis", "zastępca", "uwagi"}
+		teksty = [komórka.tekst.lower() for komórka in komórki[:4]]
+		jestPuste = all(tekst == "" or tekst == "&nbsp;" for tekst in teksty)
+		jestNagłówek = set(tekst.strip().lower() for tekst in teksty) <= nagłówki
 
-		return False
+		return not jestPuste and not jestNagłówek
 
 	def sprawdźPrzydatne(
 		wartość: str,
@@ -186,154 +565,120 @@ def wyodrębnijDane(
 
 		return wyodrębnieniNauczyciele
 
-	def sprawdźNauczyciela(
-		wyodrębnieniNauczyciele: set[str],
-		wybraniNauczyciele: list[str]
-	) -> bool:
+	def przygotujTekstKlas(komórkiWiersza: list[str]) -> str:
 		"""
-		Sprawdza, czy którykolwiek z wyodrębnionych nauczycieli znajduje się na liście wybranych nauczycieli.
+		Przygotowuje znormalizowany tekst wiersza, w którym wyszukiwane są wybrane klasy.
 
 		Args:
-			wyodrębnieniNauczyciele (set[str]): Zbiór nazwisk nauczycieli wyodrębnionych z wiersza zastępstwa.
-			wybraniNauczyciele (list[str]): Lista nauczycieli, których dopasowujemy.
+			komórkiWiersza (list[str]): Lista wartości z wiersza tabeli (np. lekcja, opis, zastępca, uwagi).
 
 		Returns:
-			bool: True, jeśli przynajmniej jeden wyodrębniony nauczyciel pasuje do listy wybranych, False w przeciwnym razie.
+			str: Znormalizowany tekst wiersza bez uwag i bez części opisu występującej po myślniku.
 		"""
 
-		zbiórKluczy = set()
-		kluczeWybranychNauczycieli = set()
-
-		if not wybraniNauczyciele:
-			return False
+		komórki = komórkiWiersza[:]
 
-		for dopasowanie in wyodrębnieniNauczyciele:
-			zbiórKluczy |= zwróćNazwyKluczy(dopasowanie)
+		if len(komórki) > 1 and komórki[1]:
+			komórki[1] = komórki[1].split("-", 1)[0]
 
-		for nauczyciel in wybraniNauczyciele:
-			kluczeWybranychNauczycieli |= zwróćNazwyKluczy(nauczyciel)
+		tekst = " ".join(komórka or "" for komórka in komórki[:-1])
+		tekst = normalizujTekst(tekst)
+		tekst = re.sub(r"[\(\)]", " ", tekst)
+		tekst = re.sub(r"\s+", " ", tekst)
 
-		return bool(zbiórKluczy & kluczeWybranychNauczycieli)
+		return tekst
 
-	def sprawdźKlasę(
-		komórkiWiersza: list[str],
-		wybraneKlasy: list[str]
-	) -> bool:
+	def znajdźKomórkę(
+		komórki: list[KomórkaTabeli],
+		nazwaKlasy: str
+	) -> Optional[KomórkaTabeli]:
 		"""
-		Sprawdza, czy wiersz HTML (lista wartości z wiersza tabeli) odpowiada którejkolwiek z wybranych klas.
+		Wyszukuje w wierszu pierwszą niepustą komórkę z podaną klasą HTML.
 
 		Args:
-			komórkiWiersza (list[str]): Lista wartości z wiersza tabeli (np. lekcja, opis, zastępca, uwagi).
-			wybraneKlasy (list[str]): Lista klas, które mają zostać dopasowane.
+			komórki (list[KomórkaTabeli]): Komórki wiersza tabeli zastępstw.
+			nazwaKlasy (str): Nazwa klasy komórki (np. `st0` lub `st1`).
 
 		Returns:
-			bool: True, jeśli wiersz pasuje do przynajmniej jednej z wybranych klas, False w przeciwnym razie.
+			Optional[KomórkaTabeli]: Znaleziona komórka lub None, jeśli komórki nie znaleziono.
 		"""
 
-		komórki = komórkiWiersza[:]
+		for komórka in komórki:
+			if nazwaKlasy in komórka.klasy and not sprawdźPusty(komórka.tekst):
+				return komórka
 
-		if not wybraneKlasy:
-			return False
+		return None
 
-		if len(komórki) > 1 and komórki[1]:
-			komórki[1] = komórki[1].split("-", 1)[0]
+	def sformatujInformacje(komórka: Optional[KomórkaTabeli]) -> str:
+		"""
+		Formatuje tekst komórki z informacjami dodatkowymi, dołączając odnośnik w formacie Markdown.
 
-		tekst = " ".join(komórka or "" for komórka in komórki[:-1])
-		tekst = normalizujTekst(tekst)
-		tekst = re.sub(r"[\(\)]", " ", tekst)
-		tekst = re.sub(r"\s+", " ", tekst)
+		Args:
+			komórka (Optional[KomórkaTabeli]): Komórka z informacjami dodatkowymi.
+
+		Returns:
+			str: Sformatowany tekst komórki lub pusty ciąg znaków, jeśli komórki nie znaleziono.
+		"""
 
-		for klasa in wybraneKlasy:
-			normaKlasy = normalizujTekst(klasa)
-			części = normaKlasy.split()
-			wzór = r"\b" + r"\s*".join(map(re.escape, części)) + r"\b"
+		if not komórka:
+			return ""
 
-			if re.search(wzór, tekst):
-				return True
+		tekst = re.sub(r"[ \t]+", " ", komórka.tekstZOdnośnikiem)
+		tekst = re.sub(r"\n+\[", " [", tekst)
 
-		return False
+		return tekst
 
-	if not zawartośćStrony:
+	if wiersze is None:
 		logiKonsoli.warning(
 			"Brak treści pobranej ze strony. Zwracanie pustej zawartości."
 		)
 		return "", []
 
 	try:
-		informacjeDodatkowe = ""
-		wiersze = zawartośćStrony.find_all("tr")
-		zgrupowane = defaultdict(list)
+		wpisy = []
 		aktualnyNauczyciel = None
 		komórkaST0 = None
 		komórkaST1 = None
+		istniejąZastępstwa = False
 
-		for wiersz in wiersze:
-			for komórka in wiersz.find_all("td"):
-
-				if sprawdźKlasyKomórki(komórka, {"st0"}):
-					tymczasowy = wyczyśćTekst(komórka).strip()
-
-					if tymczasowy and tymczasowy != "&nbsp;":
-						komórkaST0 = komórka
-						break
-
-			if komórkaST0:
-				break
-
-		if komórkaST0:
-			link = komórkaST0.find("a")
-
-			if link and link.get("href"):
-				tekstLinku = wyczyśćTekst(link)
-				urlLinku = link.get("href")
-				link.replace_with(NavigableString(f"[{tekstLinku}]({urlLinku})"))
-
-			tekstST0 = wyczyśćTekst(komórkaST0)
-			tekstST0 = re.sub(r"[ \t]+", " ", tekstST0)
-			tekstST0 = re.sub(r"\n+\[", " [", tekstST0)
-
-			informacjeDodatkowe = tekstST0
-
-		for wiersz in wiersze:
-			komórki = wiersz.find_all("td")
+		# Wiersze są przetwarzane w jednym przejściu, więc mogą pochodzić z generatora zasilanego w trakcie pobierania strony
+		for komórki in wiersze:
+			komórkaST0 = komórkaST0 or znajdźKomórkę(komórki, "st0")
+			komórkaST1 = komórkaST1 or znajdźKomórkę(komórki, "st1")
+			istniejąZastępstwa = istniejąZastępstwa or sprawdźZastępstwo(komórki)
 
 			if len(komórki) == 1:
-				aktualnyNauczyciel = wyczyśćTekst(komórki[0])
+				aktualnyNauczyciel = komórki[0].tekstZOdnośnikiem if komórki[0] is komórkaST0 else komórki[0].tekst
 				continue
 
-			if komórki and sprawdźKlasyKomórki(komórki[0], {"st0"}):
+			if komórki and "st0" in komórki[0].klasy:
 				continue
 
 			if len(komórki) >= 4:
-				teksty = [wyczyśćTekst(komórka) for komórka in komórki[:4]]
-				lekcja, opis, zastępca, uwagi = teksty
+				lekcja, opis, zastępca, uwagi = [komórka.tekst for komórka in komórki[:4]]
 				pola = [lekcja, opis, zastępca, uwagi]
 				etykiety = ["Lekcja", "Opis", "Zastępca", "Uwagi"]
 
 				if not any(sprawdźPrzydatne(wartość, etykieta) for wartość, etykieta in zip(pola, etykiety)):
 					continue
 
-				komórkiWiersza = [lekcja, opis, zastępca, uwagi]
-				dopasowaneDoKlasy = sprawdźKlasę(komórkiWiersza, wybraneKlasy)
 				wyodrębnieniNauczyciele = wyodrębnijNauczycieli(aktualnyNauczyciel, zastępca)
-				dopasowaneDoNauczyciela = sprawdźNauczyciela(wyodrębnieniNauczyciele, wybraniNauczyciele)
-				zastępstwoBezKlasy = False
+				kluczeNauczycieli = set()
 
-				if wybraneKlasy:
-					pełnyTekst = " ".join(komórkiWiersza)
+				for nauczyciel in wyodrębnieniNauczyciele:
+					kluczeNauczycieli |= zwróćNazwyKluczy(nauczyciel)
 
-					if listaKlas:
-						znalezionoKlasy = any(re.search(r"\b" + re.escape(normalizujTekst(klasa)) + r"\b", normalizujTekst(pełnyTekst)) for klasa in listaKlas)
-						zastępstwoBezKlasy = not znalezionoKlasy
-					else:
-						if not re.search(r"\d", pełnyTekst):
-							zastępstwoBezKlasy = True
+				pełnyTekst = " ".join(pola)
 
-				wierszeWpisówZastępstw = []
-				nazwaNauczyciela = aktualnyNauczyciel or ", ".join(wyodrębnieniNauczyciele)
+				if listaKlas:
+					normaPełnegoTekstu = normalizujTekst(pełnyTekst)
+					klasy = frozenset(klasa for klasa in listaKlas if re.search(r"\b" + re.escape(normalizujTekst(klasa)) + r"\b", normaPełnegoTekstu))
+					bezKlasy = not klasy
+				else:
+					klasy = frozenset()
+					bezKlasy = not re.search(r"\d", pełnyTekst)
 
-				if zastępstwoBezKlasy:
-					wierszeWpisówZastępstw.append(f"**Nauczyciel:** {nazwaNauczyciela}")
+				wierszeWpisówZastępstw = []
 
 				for wartość, etykieta in zip(pola, etykiety):
 					if sprawdźPrzydatne(wartość, etykieta):
@@ -341,49 +686,72 @@ def wyodrębnijDane(
 					else:
 						wierszeWpisówZastępstw.append(f"**{etykieta}:** Brak")
 
-				tekstWpisówZastępstw = "\n".join(wierszeWpisówZastępstw).strip()
-
-				if not tekstWpisówZastępstw:
-					continue
+				wpisy.append(WpisZastępstwa(
+					nauczyciel=aktualnyNauczyciel or ", ".join(wyodrębnieniNauczyciele),
+					lekcja=lekcja,
+					opis=opis,
+					zastępca=zastępca,
+					uwagi=uwagi,
+					treść="\n".join(wierszeWpisówZastępstw).strip(),
+					tekstKlas=przygotujTekstKlas(pola),
+					klasy=klasy,
+					bezKlasy=bezKlasy,
+					kluczeNauczycieli=frozenset(kluczeNauczycieli)
+				))
+
+		informacjeDodatkowe = sformatujInformacje(komórkaST0)
+
+		if not informacjeDodatkowe and not istniejąZastępstwa:
+			informacjeDodatkowe = sformatujInformacje(komórkaST1)
+
+		return informacjeDodatkowe, wpisy
+	except Exception as e:
+		logiKonsoli.exception(
+			f"Wystąpił błąd podczas przetwarzania HTML. Więcej informacji: {e}"
+		)
+		return "", []
 
-				if (wybraneKlasy or wybraniNauczyciele) and (dopasowaneDoKlasy or dopasowaneDoNauczyciela or zastępstwoBezKlasy):
-					domyślnyTytuł = "Zastępstwa z nieprzypisanymi klasami!" if zastępstwoBezKlasy else nazwaNauczyciela
-					zgrupowane[domyślnyTytuł].append(tekstWpisówZastępstw)
 
-		wpisyZastępstw = [(nauczyciel, zgrupowane[nauczyciel]) for nauczyciel in zgrupowane if zgrupowane[nauczyciel]]
-		wpisyZastępstw.sort(key=lambda x: 0 if "Zastępstwa z nieprzypisanymi klasami!" in x[0] else 1)
+def filtrujWpisy(
+	wpisy: list[WpisZastępstwa],
+	filtr: FiltrZastępstw
+) -> list[tuple[str, list[str]]]:
+	"""
+	Filtruje wyodrębnione wcześniej wpisy zastępstw szkoły według skompilowanego filtru serwera.
 
-		if not informacjeDodatkowe and not sprawdźIstnienieZastępstw(wiersze):
-			for wiersz in wiersze:
-				for komórka in wiersz.find_all("td"):
+	Args:
+		wpisy (list[WpisZastępstwa]): Ustrukturyzowane wiersze zastępstw szkoły.
+		filtr (FiltrZastępstw): Skompilowany filtr wybranych klas i nauczycieli serwera.
 
-					if sprawdźKlasyKomórki(komórka, {"st1"}):
-						tymczasowy = wyczyśćTekst(komórka).strip()
+	Returns:
+		list[tuple[str, list[str]]]: Wpisy zastępstw sortowane według nauczyciela.
+	"""
 
-						if tymczasowy and tymczasowy != "&nbsp;":
-							komórkaST1 = komórka
-							break
+	if filtr.wzórKlas is None and not filtr.kluczeNauczycieli:
+		return []
 
-				if komórkaST1:
-					break
+	try:
+		zgrupowane = defaultdict(list)
 
-			if komórkaST1:
-				link = komórkaST1.find("a")
+		for wpis in wpisy:
+			dopasowaneDoKlasy = filtr.wzórKlas is not None and filtr.wzórKlas.search(wpis.tekstKlas) is not None
+			dopasowaneDoNauczyciela = not filtr.kluczeNauczycieli.isdisjoint(wpis.kluczeNauczycieli)
+			zastępstwoBezKlasy = filtr.wzórKlas is not None and wpis.bezKlasy
 
-				if link and link.get("href"):
-					tekstLinku = wyczyśćTekst(link)
-					urlLinku = link.get("href")
-					link.replace_with(NavigableString(f"[{tekstLinku}]({urlLinku})"))
+			if not (dopasowaneDoKlasy or dopasowaneDoNauczyciela or zastępstwoBezKlasy):
+				continue
 
-				tekstST1 = wyczyśćTekst(komórkaST1)
-				tekstST1 = re.sub(r"[ \t]+", " ", tekstST1)
-				tekstST1 = re.sub(r"\n+\[", " [", tekstST1)
+			if zastępstwoBezKlasy:
+				zgrupowane["Zastępstwa z nieprzypisanymi klasami!"].append(f"**Nauczyciel:** {wpis.nauczyciel}\n{wpis.treść}")
+			else:
+				zgrupowane[wpis.nauczyciel].append(wpis.treść)
 
-				informacjeDodatkowe = tekstST1
+		wpisyZastępstw = [(nauczyciel, zgrupowane[nauczyciel]) for nauczyciel in zgrupowane if zgrupowane[nauczyciel]]
+		wpisyZastępstw.sort(key=lambda x: 0 if "Zastępstwa z nieprzypisanymi klasami!" in x[0] else 1)
 
-		return informacjeDodatkowe, wpisyZastępstw
+		return wpisyZastępstw
 	except Exception as e:
 		logiKonsoli.exception(
-			f"Wystąpił błąd podczas przetwarzania HTML. Więcej informacji: {e}"
+			f"Wystąpił błąd podczas filtrowania zastępstw. Więcej informacji: {e}"
 		)
-		return "", []
\ No newline at end of file
+		return []
\ No newline at end of file
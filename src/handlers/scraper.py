@@ -13,50 +13,249 @@
 # Standardowe biblioteki
 import aiohttp
 import asyncio
-from typing import Optional
+import hashlib
+import random
+import time
+from typing import (
+	Any,
+	Iterable,
+	Optional
+)
 
 # Zewnętrzne biblioteki
-from bs4 import BeautifulSoup
 import discord
 
 # Wewnętrzne importy
+from src.classes.substitution import KomórkaTabeli
+from src.handlers.configuration import konfiguracja
 from src.handlers.logging import logiKonsoli
+from src.handlers.parser import (
+	czytajWierszeStrumieniowo,
+	wyodrębnijWiersze
+)
 
-async def pobierzZawartośćStrony(
+# Rozmiar fragmentu odpowiedzi HTTP odczytywanego dla parsera strumieniowego
+rozmiarFragmentu = 16 * 1024
+
+# Walidatory ostatniej pobranej wersji strony (ETag, Last-Modified i suma kontrolna treści) per adres URL
+walidatoryStron: dict[str, dict[str, str]] = {}
+
+# Wyłączniki awaryjne stron szkół per adres URL (liczba kolejnych nieudanych sprawdzeń, termin próbnego pobrania i ostatni błąd)
+wyłącznikiStron: dict[str, dict[str, Any]] = {}
+
+# Najkrótsze opóźnienie ponownej próby pobrania strony w ramach jednego sprawdzenia (w sekundach)
+podstawaOpóźnienia = 1.0
+
+# Najdłuższe opóźnienie ponownej próby pobrania strony w ramach jednego sprawdzenia (w sekundach)
+maksymalneOpóźnienie = 15.0
+
+def czyBłądPrzejściowy(błąd: Exception) -> bool:
+	"""
+	Sprawdza, czy błąd pobierania strony może ustąpić przy ponownej próbie (przekroczenie czasu, błąd połączenia, błąd serwera lub zbyt wiele żądań).
+
+	Args:
+		błąd (Exception): Błąd zgłoszony podczas pobierania strony.
+
+	Returns:
+		bool: True, jeśli pobranie warto ponowić, False w przeciwnym razie.
+	"""
+
+	if isinstance(błąd, aiohttp.ClientResponseError):
+		return błąd.status >= 500 or błąd.status == 429
+
+	return isinstance(błąd, (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError))
+
+
+def zwróćStanWyłącznika(url: str) -> dict[str, Any]:
+	"""
+	Zwraca stan wyłącznika awaryjnego strony na potrzeby diagnostyki.
+
+	Args:
+		url (str): Adres strony internetowej.
+
+	Returns:
+		dict[str, Any]: Stan wyłącznika (`zamknięty`, `otwarty` lub `półotwarty`), liczba kolejnych nieudanych sprawdzeń, czas uniksowy próbnego pobrania i ostatni błąd.
+	"""
+
+	wyłącznik = wyłącznikiStron.get(url, {})
+	kolejneBłędy = int(wyłącznik.get("kolejne-błędy", 0))
+	otwartyDo = float(wyłącznik.get("otwarty-do", 0.0))
+
+	if kolejneBłędy < max(1, int(konfiguracja.get("prog-wylacznika-awaryjnego", 3))):
+		stan = "zamknięty"
+	elif otwartyDo > time.time():
+		stan = "otwarty"
+	else:
+		stan = "półotwarty"
+
+	return {
+		"stan": stan,
+		"kolejne-błędy": kolejneBłędy,
+		"otwarty-do": otwartyDo,
+		"ostatni-błąd": wyłącznik.get("ostatni-błąd", "")
+	}
+
+
+async def pobierzStronę(
 	bot: discord.Client,
 	url: str,
-	kodowanie: str
-) -> Optional[BeautifulSoup]:
+	kodowanie: str,
+	parser: str
+) -> tuple[Optional[Iterable[list[KomórkaTabeli]]], bool]:
 	"""
-	Pobiera zawartość strony internetowej.
+	Jednorazowo pobiera zawartość strony internetowej warunkowo, zgłaszając błędy połączenia i odpowiedzi HTTP.
 
 	Args:
 		bot (discord.Client): Instancja klienta Discord, z której wykorzystywane jest aktywne połączenie HTTP.
 		url (str): Adres strony internetowej do pobrania.
 		kodowanie (str): Kodowanie użyte do odczytu treści strony internetowej.
+		parser (str): Nazwa parsera HTML (`html.parser`, `lxml` lub `strumieniowy`).
 
 	Returns:
-		Optional[BeautifulSoup]: Obiekt BeautifulSoup ze strukturą HTML lub None w przypadku błędu.
+		tuple[Optional[Iterable[list[KomórkaTabeli]]], bool]:
+			wiersze: Wiersze tabeli zastępstw (dla parsera strumieniowego generator tokenizujący stronę podczas iteracji) lub None w przypadku braku zmian.
+			niezmieniona: True, jeśli serwer zwrócił kod 304 lub treść strony jest identyczna z poprzednio pobraną.
 	"""
 
-	try:
-		async with bot.połączenieHTTP.get(url) as odpowiedź:
-			odpowiedź.raise_for_status()
+	walidatory = walidatoryStron.get(url, {})
+	nagłówki = {}
+
+	if walidatory.get("etag"):
+		nagłówki["If-None-Match"] = walidatory["etag"]
+
+	if walidatory.get("last-modified"):
+		nagłówki["If-Modified-Since"] = walidatory["last-modified"]
+
+	async with bot.połączenieHTTP.get(url, headers=nagłówki) as odpowiedź:
+		if odpowiedź.status == 304:
+			logiKonsoli.debug(
+				f"Strona nie uległa zmianie od ostatniego pobrania (HTTP 304) ({url})."
+			)
+			return None, True
+
+		odpowiedź.raise_for_status()
+
+		if parser == "strumieniowy":
+			# Surowe fragmenty są buforowane razem z bieżącym obliczaniem sumy kontrolnej, a tokenizowane dopiero wtedy, gdy treść strony uległa zmianie
+			skrót = hashlib.sha256()
+			fragmenty = []
+
+			async for fragment in odpowiedź.content.iter_chunked(rozmiarFragmentu):
+				skrót.update(fragment)
+				fragmenty.append(fragment)
 
-			tekst = await odpowiedź.text(encoding=kodowanie, errors="ignore")
+			sumaKontrolna = skrót.hexdigest()
+		else:
+			surowaTreść = await odpowiedź.read()
+			sumaKontrolna = hashlib.sha256(surowaTreść).hexdigest()
+
+		noweWalidatory = {
+			"etag": odpowiedź.headers.get("ETag", ""),
+			"last-modified": odpowiedź.headers.get("Last-Modified", ""),
+			"suma-kontrolna": sumaKontrolna
+		}
+
+		if sumaKontrolna == walidatory.get("suma-kontrolna"):
+			walidatoryStron[url] = noweWalidatory
+			logiKonsoli.debug(
+				f"Treść strony jest identyczna z poprzednio pobraną ({url})."
+			)
+			return None, True
+
+		if parser == "strumieniowy":
+			# Wiersze odczytywane są leniwie przez generator, konsumowany poza pętlą zdarzeń razem z wyodrębnianiem danych szkoły
+			wiersze = czytajWierszeStrumieniowo(fragmenty, kodowanie)
+		else:
+			tekst = surowaTreść.decode(kodowanie, errors="ignore")
 			pętla = asyncio.get_running_loop()
+			wiersze = await pętla.run_in_executor(None, wyodrębnijWiersze, tekst, parser)
+
+		walidatoryStron[url] = noweWalidatory
+
+		return wiersze, False
+
+
+async def pobierzZawartośćStrony(
+	bot: discord.Client,
+	url: str,
+	kodowanie: str,
+	parser: str = "html.parser"
+) -> tuple[Optional[Iterable[list[KomórkaTabeli]]], bool]:
+	"""
+	Pobiera zawartość strony internetowej warunkowo, pomijając przetwarzanie, jeśli strona nie uległa zmianie od ostatniego pobrania. Przejściowe błędy są ponawiane z opóźnieniem o rozrzucie dekorelowanym, a po kilku kolejnych nieudanych sprawdzeniach wyłącznik awaryjny wstrzymuje pobieranie strony do czasu pojedynczej próby wykonywanej w wydłużonym odstępie.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord, z której wykorzystywane jest aktywne połączenie HTTP.
+		url (str): Adres strony internetowej do pobrania.
+		kodowanie (str): Kodowanie użyte do odczytu treści strony internetowej.
+		parser (str, optional): Nazwa parsera HTML (`html.parser`, `lxml` lub `strumieniowy`). Domyślnie `html.parser`.
 
-			return await pętla.run_in_executor(None, lambda: BeautifulSoup(tekst, "html.parser"))
-	except asyncio.TimeoutError:
+	Returns:
+		tuple[Optional[Iterable[list[KomórkaTabeli]]], bool]:
+			wiersze: Wiersze tabeli zastępstw (dla parsera strumieniowego generator tokenizujący stronę podczas iteracji) lub None w przypadku błędu albo braku zmian.
+			niezmieniona: True, jeśli serwer zwrócił kod 304 lub treść strony jest identyczna z poprzednio pobraną.
+	"""
+
+	wyłącznik = wyłącznikiStron.setdefault(url, {"kolejne-błędy": 0, "otwarty-do": 0.0, "ostatni-błąd": ""})
+	próg = max(1, int(konfiguracja.get("prog-wylacznika-awaryjnego", 3)))
+
+	if wyłącznik["otwarty-do"] > time.time():
+		logiKonsoli.debug(
+			f"Pominięto pobieranie strony, ponieważ wyłącznik awaryjny jest otwarty ({url})."
+		)
+		return None, False
+
+	# Przy otwartym wyłączniku wykonywana jest wyłącznie jedna próba pobrania, bez ponowień
+	liczbaPrób = 1 if wyłącznik["kolejne-błędy"] >= próg else max(1, int(konfiguracja.get("liczba-prob-pobrania", 3)))
+	opóźnienie = podstawaOpóźnienia
+	błąd = None
+
+	for próba in range(liczbaPrób):
+		try:
+			wynik = await pobierzStronę(bot, url, kodowanie, parser)
+		except Exception as e:
+			błąd = e
+
+			if próba + 1 >= liczbaPrób or not czyBłądPrzejściowy(e):
+				break
+
+			opóźnienie = min(maksymalneOpóźnienie, random.uniform(podstawaOpóźnienia, opóźnienie * 3))
+			logiKonsoli.debug(
+				f"Nie udało się pobrać strony ({url}). Kolejna próba nastąpi za {opóźnienie:.1f} s. Więcej informacji: {e!r}"
+			)
+			await asyncio.sleep(opóźnienie)
+		else:
+			if wyłącznik["kolejne-błędy"] >= próg:
+				logiKonsoli.info(
+					f"Strona ponownie odpowiada, wyłącznik awaryjny został zamknięty ({url})."
+				)
+
+			wyłącznik.update({"kolejne-błędy": 0, "otwarty-do": 0.0, "ostatni-błąd": ""})
+			return wynik
+
+	if isinstance(błąd, asyncio.TimeoutError):
 		logiKonsoli.warning(
 			f"Przekroczono czas oczekiwania na połączenie ({url})."
 		)
-	except aiohttp.ClientError as e:
-		logiKonsoli.exception(
-			f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {e}"
+	elif isinstance(błąd, aiohttp.ClientError):
+		logiKonsoli.error(
+			f"Wystąpił błąd klienta HTTP podczas pobierania strony. Więcej informacji: {błąd}",
+			exc_info=błąd
+		)
+	else:
+		logiKonsoli.error(
+			f"Wystąpił błąd podczas pobierania strony. Więcej informacji: {błąd}",
+			exc_info=błąd
 		)
-	except Exception as e:
-		logiKonsoli.exception(
-			f"Wystąpił błąd podczas pobierania strony. Więcej informacji: {e}"
+
+	wyłącznik["kolejne-błędy"] += 1
+	wyłącznik["ostatni-błąd"] = str(błąd) or type(błąd).__name__
+
+	if wyłącznik["kolejne-błędy"] >= próg:
+		interwałPróby = max(1, int(konfiguracja.get("interwal-proby-wylacznika", 900)))
+		wyłącznik["otwarty-do"] = time.time() + interwałPróby
+		logiKonsoli.warning(
+			f"Strona nie odpowiada od {wyłącznik['kolejne-błędy']} kolejnych sprawdzeń, wyłącznik awaryjny został otwarty. Próbne pobranie nastąpi za {interwałPróby} s ({url})."
 		)
-	return None
\ No newline at end of file
+
+	return None, False
\ No newline at end of file
@@ -13,28 +13,212 @@
 # Standardowe biblioteki
 import asyncio
 from collections import defaultdict
-import copy
+from datetime import (
+	date,
+	timedelta
+)
 import difflib
+import functools
 import hashlib
+import heapq
+import itertools
+import json
 import re
-from typing import Any
+import time
+from types import MappingProxyType
+from typing import (
+	Any,
+	Awaitable,
+	Callable,
+	Iterable,
+	Mapping,
+	Optional
+)
 import unicodedata
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
+from src.classes.substitution import (
+	FiltrZastępstw,
+	IndeksDopasowań,
+	RankingNauczycieli,
+	SubskrypcjaSzkoły
+)
 from src.handlers.configuration import (
 	blokadaKonfiguracji,
 	konfiguracja,
-	zapiszKonfiguracje
+	oznaczZmianęKonfiguracji
 )
 
-# Ograniczenie wykonywania jednoczesnych operacji dla serwera do trzech wątków
-blokadaNaSerwer = asyncio.Semaphore(3)
+# Kolejki FIFO operacji oczekujących na wykonanie na poszczególnych kanałach (usuwane po opróżnieniu)
+kolejkiKanałów: dict[int, asyncio.Queue[tuple[Callable[[], Awaitable[Any]], asyncio.Future]]] = {}
+
+# Kanały z oczekującymi operacjami, przydzielane kolejno pracownikom puli dostarczającej
+kanałyGotowe: asyncio.Queue[int] = asyncio.Queue()
+
+# Kanały znajdujące się w kolejce gotowych lub obsługiwane w danej chwili przez pracownika
+zaplanowaneKanały: set[int] = set()
+
+# Zadania pracowników puli dostarczającej wiadomości
+pracownicyDostarczania: list[asyncio.Task] = []
+
+# Kopiec zaplanowanych usunięć wiadomości (termin, kolejność, ID kanału, ID wiadomości, liczba prób)
+zaplanowaneUsunięcia: list[tuple[float, int, int, int, int]] = []
+
+# Licznik zachowujący kolejność usunięć o identycznym terminie
+kolejnośćUsunięć = itertools.count()
+
+# Zdarzenie budzące zadanie usuwające wiadomości po zaplanowaniu nowego usunięcia
+nowoZaplanowaneUsunięcie = asyncio.Event()
+
+# Skompilowane filtry zastępstw według odcisku konfiguracji filtrów (współdzielone przez serwery o identycznych filtrach)
+skompilowaneFiltry: dict[str, FiltrZastępstw] = {}
+
+# Odciski filtrów przypisane do serwerów, usuwane po każdej zmianie konfiguracji serwera
+odciskiFiltrówSerwerów: dict[str, str] = {}
+
+# Niezmienny indeks subskrypcji serwerów według szkół, budowany przy pierwszym odczycie i podmieniany w całości przy każdej zmianie konfiguracji serwera
+indeksSerwerówSzkół: Optional[Mapping[str, tuple[SubskrypcjaSzkoły, ...]]] = None
+
+# Szkoły, pod którymi serwery znajdują się w indeksie serwerów według szkół
+szkołySerwerów: dict[str, str] = {}
+
+# Indeksy wyszukiwania list klas i nauczycieli według zawartości listy (lista zmieniona w konfiguracji otrzymuje nowy indeks)
+indeksyDopasowań: dict[tuple[str, ...], IndeksDopasowań] = {}
+
+# Maksymalna liczba przechowywanych indeksów wyszukiwania (najstarszy jest usuwany jako pierwszy)
+maksymalnaLiczbaIndeksówDopasowań = 64
+
+# Maksymalna liczba podpowiedzi zwracanych w autouzupełnianiu (limit Discorda)
+maksymalnaLiczbaPodpowiedzi = 25
+
+# Maksymalna liczba zapamiętanych wyników normalizacji tekstu i kluczy nazw
+rozmiarPamięciNormalizacji = 8192
+
+# Tablica translacji polskich liter na litery bez znaków diakrytycznych (bez „ł”, której NFKD nie rozkłada)
+tablicaPolskichZnaków = str.maketrans("ąćęńóśźżĄĆĘŃÓŚŹŻ", "acenoszzACENOSZZ")
+
+# Znaki wymagające ogólnego rozkładu NFKD po zastosowaniu tablicy translacji
+wzórZnakówDoRozkładu = re.compile(r"[^\x00-\x7fłŁ]")
+
+# Ciągi białych znaków zastępowane pojedynczą spacją
+wzórBiałychZnaków = re.compile(r"\s+")
+
+# Rankingi nauczycieli z największą liczbą zastępstw według serwerów
+rankingiNauczycieli: dict[str, RankingNauczycieli] = {}
+
+# Maksymalna liczba pozycji rankingu (limit pól osadzenia Discorda)
+maksymalnaLiczbaPozycjiRankingu = 25
+
+async def pracownikDostarczania() -> None:
+	"""
+	Pobiera kolejne kanały z oczekującymi operacjami i wykonuje po jednej operacji na kanał, po czym oddaje kanał na koniec kolejki gotowych. Kanał jest obsługiwany w danej chwili przez co najwyżej jednego pracownika, więc operacje na nim wykonują się w kolejności zlecenia, a kolejka pustego kanału jest usuwana.
+	"""
+
+	while True:
+		identyfikatorKanału = await kanałyGotowe.get()
+		kolejka = kolejkiKanałów.get(identyfikatorKanału)
+
+		if kolejka is None or kolejka.empty():
+			zaplanowaneKanały.discard(identyfikatorKanału)
+			kolejkiKanałów.pop(identyfikatorKanału, None)
+			continue
+
+		operacja, przyszłość = kolejka.get_nowait()
+
+		if not przyszłość.cancelled():
+			try:
+				wynik = await operacja()
+
+				if not przyszłość.cancelled():
+					przyszłość.set_result(wynik)
+			except asyncio.CancelledError:
+				przyszłość.cancel()
+				raise
+			except Exception as e:
+				if not przyszłość.cancelled():
+					przyszłość.set_exception(e)
+
+		if kolejka.empty():
+			zaplanowaneKanały.discard(identyfikatorKanału)
+			kolejkiKanałów.pop(identyfikatorKanału, None)
+		else:
+			kanałyGotowe.put_nowait(identyfikatorKanału)
+
+
+def uruchomPracownikówDostarczania() -> None:
+	"""
+	Uruchamia brakujących pracowników puli dostarczającej wiadomości, aż do liczby określonej w konfiguracji.
+	"""
+
+	pracownicyDostarczania[:] = [zadanie for zadanie in pracownicyDostarczania if not zadanie.done()]
+	liczbaPracowników = max(1, int(konfiguracja.get("liczba-pracownikow-dostarczania", 16)))
+
+	while len(pracownicyDostarczania) < liczbaPracowników:
+		pracownicyDostarczania.append(asyncio.create_task(pracownikDostarczania()))
+
+
+async def zatrzymajPracowników() -> None:
+	"""
+	Zatrzymuje pracowników puli dostarczającej wiadomości i anuluje operacje, które nie zostały jeszcze wykonane.
+	"""
+
+	for zadanie in pracownicyDostarczania:
+		zadanie.cancel()
+
+	await asyncio.gather(*pracownicyDostarczania, return_exceptions=True)
+	pracownicyDostarczania.clear()
+
+	for kolejka in kolejkiKanałów.values():
+		while not kolejka.empty():
+			kolejka.get_nowait()[1].cancel()
+
+	kolejkiKanałów.clear()
+	zaplanowaneKanały.clear()
+
+	while not kanałyGotowe.empty():
+		kanałyGotowe.get_nowait()
+
+
+async def zlećOperację(
+	identyfikatorKanału: int,
+	operacja: Callable[[], Awaitable[Any]]
+) -> Any:
+	"""
+	Dodaje operację do kolejki kanału i czeka na jej wykonanie przez pulę pracowników. Przy pełnej kolejce kanału czeka na zwolnienie miejsca. Limity żądań Discorda (per trasa i globalny, odczytywane z nagłówków odpowiedzi) obsługuje klient HTTP discord.py, więc pracownicy wykonują operacje tak szybko, jak pozwala na to Discord.
+
+	Args:
+		identyfikatorKanału (int): ID kanału, na którym zostanie wykonana operacja.
+		operacja (Callable[[], Awaitable[Any]]): Funkcja zwracająca korutynę wykonującą operację.
+
+	Returns:
+		Any: Wynik operacji.
+	"""
+
+	uruchomPracownikówDostarczania()
+	przyszłość = asyncio.get_running_loop().create_future()
+	rozmiarKolejki = max(1, int(konfiguracja.get("rozmiar-kolejki-kanalu", 100)))
+
+	while True:
+		kolejka = kolejkiKanałów.get(identyfikatorKanału)
+
+		if kolejka is None:
+			kolejka = kolejkiKanałów[identyfikatorKanału] = asyncio.Queue(rozmiarKolejki)
+
+		await kolejka.put((operacja, przyszłość))
+
+		# Kolejka mogła zostać usunięta jako pusta podczas oczekiwania na wolne miejsce
+		if kolejkiKanałów.get(identyfikatorKanału) is kolejka:
+			break
+
+	if identyfikatorKanału not in zaplanowaneKanały:
+		zaplanowaneKanały.add(identyfikatorKanału)
+		kanałyGotowe.put_nowait(identyfikatorKanału)
+
+	return await przyszłość
 
-# Zapewnienie, że wysyłanie, usuwanie i reagowanie wiadomości na danym kanale jest sekwencyjne
-blokadaNaKanał = defaultdict(lambda: asyncio.Lock())
 
 async def ograniczWysyłanie(
 	kanał: discord.TextChannel,
@@ -53,10 +237,7 @@ async def ograniczWysyłanie(
 		discord.Message: Obiekt wiadomości wysłanej na kanał.
 	"""
 
-	async with blokadaNaKanał[kanał.id]:
-		wiadomość = await kanał.send(*args, **kwargs)
-
-		return wiadomość
+	return await zlećOperację(kanał.id, lambda: kanał.send(*args, **kwargs))
 
 
 async def ograniczUsuwanie(wiadomość: discord.Message) -> None:
@@ -67,8 +248,41 @@ async def ograniczUsuwanie(wiadomość: discord.Message) -> None:
 		wiadomość (discord.Message): Wiadomość do usunięcia.
 	"""
 
-	async with blokadaNaKanał[wiadomość.channel.id]:
-		await wiadomość.delete()
+	await zlećOperację(wiadomość.channel.id, wiadomość.delete)
+
+
+async def ograniczEdytowanie(
+	wiadomość: discord.Message | discord.PartialMessage,
+	**kwargs: Any
+) -> discord.Message:
+	"""
+	Edytuje wiadomość w bezpieczny, sekwencyjny sposób.
+
+	Args:
+		wiadomość (discord.Message | discord.PartialMessage): Wiadomość do edycji.
+		**kwargs (Any): Argumenty nazwane przekazywane do `wiadomość.edit`.
+
+	Returns:
+		discord.Message: Obiekt edytowanej wiadomości.
+	"""
+
+	return await zlećOperację(wiadomość.channel.id, lambda: wiadomość.edit(**kwargs))
+
+
+def zaplanujUsunięcie(
+	wiadomość: discord.Message,
+	opóźnienie: float = 5
+) -> None:
+	"""
+	Planuje usunięcie wiadomości po upływie podanego czasu, bez wstrzymywania bieżącego zadania.
+
+	Args:
+		wiadomość (discord.Message): Wiadomość do usunięcia.
+		opóźnienie (float, optional): Liczba sekund, po której wiadomość zostanie usunięta. Domyślnie 5.
+	"""
+
+	heapq.heappush(zaplanowaneUsunięcia, (time.monotonic() + opóźnienie, next(kolejnośćUsunięć), wiadomość.channel.id, wiadomość.id, 0))
+	nowoZaplanowaneUsunięcie.set()
 
 
 async def ograniczReagowanie(
@@ -83,8 +297,7 @@ async def ograniczReagowanie(
 		emoji (str): Emoji, które ma zostać dodane jako reakcja.
 	"""
 
-	async with blokadaNaKanał[wiadomość.channel.id]:
-		await wiadomość.add_reaction(emoji)
+	await zlećOperację(wiadomość.channel.id, lambda: wiadomość.add_reaction(emoji))
 
 
 def obliczSumęKontrolną(dane: Any) -> str:
@@ -141,6 +354,33 @@ def odmieńZastępstwa(licznik: int) -> str:
 	return "zastępstw"
 
 
+@functools.lru_cache(maxsize=rozmiarPamięciNormalizacji)
+def normalizujTekstZPamięci(tekst: str) -> str:
+	"""
+	Normalizuje tekst, zapamiętując wyniki dla ostatnio używanych tekstów. Tekst złożony wyłącznie ze znaków ASCII, polskich liter i litery „ł” (której NFKD nie rozkłada) jest przetwarzany tablicą translacji, a rozkład NFKD jest wykonywany tylko dla pozostałych znaków.
+
+	Args:
+		tekst (str): Tekst wejściowy do normalizacji.
+
+	Returns:
+		str: Oczyszczony i znormalizowany tekst.
+	"""
+
+	tekst = tekst.strip()
+
+	if not tekst.isascii():
+		tekst = tekst.translate(tablicaPolskichZnaków)
+
+		if wzórZnakówDoRozkładu.search(tekst):
+			tekst = unicodedata.normalize("NFKD", tekst)
+			tekst = "".join(znak for znak in tekst if not unicodedata.combining(znak))
+
+	tekst = tekst.replace(".", " ")
+	tekst = wzórBiałychZnaków.sub(" ", tekst)
+
+	return tekst.lower()
+
+
 def normalizujTekst(tekst: str) -> str:
 	"""
 	Normalizuje tekst w celu ujednolicenia go do porównań i filtracji.
@@ -155,30 +395,25 @@ def normalizujTekst(tekst: str) -> str:
 	if not tekst or not isinstance(tekst, str):
 		return ""
 
-	tekst = tekst.strip()
-	tekst = unicodedata.normalize("NFKD", tekst)
-	tekst = "".join(znak for znak in tekst if not unicodedata.combining(znak))
-	tekst = tekst.replace(".", " ")
-	tekst = re.sub(r"\s+", " ", tekst)
-
-	return tekst.lower()
+	return normalizujTekstZPamięci(tekst)
 
 
-def zwróćNazwyKluczy(nazwa: str) -> set[str]:
+@functools.lru_cache(maxsize=rozmiarPamięciNormalizacji)
+def zwróćNazwyKluczy(nazwa: str) -> frozenset[str]:
 	"""
-	Tworzy zestaw kluczy dopasowań dla podanej nazwy.
+	Tworzy zestaw kluczy dopasowań dla podanej nazwy. Wyniki są zapamiętywane, więc zwracany zestaw jest niezmienny.
 
 	Args:
 		nazwa (str): Tekst nazwy do przetworzenia.
 
 	Returns:
-		set[str]: Zestaw ciągów znaków używanych jako klucze dopasowań.
+		frozenset[str]: Zestaw ciągów znaków używanych jako klucze dopasowań.
 	"""
 
 	norma = normalizujTekst(nazwa)
 
 	if not norma:
-		return set()
+		return frozenset()
 
 	części = norma.split()
 	klucze = {norma}
@@ -190,7 +425,359 @@ def zwróćNazwyKluczy(nazwa: str) -> set[str]:
 		klucze.add(f"{części[0][0]} {części[-1]}")
 		klucze.add(f"{części[0][0]}{części[-1]}")
 
-	return klucze
+	return frozenset(klucze)
+
+
+def zwróćStatystykiNormalizacji() -> dict[str, int]:
+	"""
+	Zwraca liczniki trafień i chybień pamięci podręcznej normalizacji tekstu i kluczy nazw.
+
+	Returns:
+		dict[str, int]: Łączna liczba trafień, chybień i zapamiętanych wyników.
+	"""
+
+	statystyki = [normalizujTekstZPamięci.cache_info(), zwróćNazwyKluczy.cache_info()]
+
+	return {
+		"trafienia": sum(informacje.hits for informacje in statystyki),
+		"chybienia": sum(informacje.misses for informacje in statystyki),
+		"rozmiar": sum(informacje.currsize for informacje in statystyki)
+	}
+
+
+def zwróćOdciskFiltru(
+	wybraneKlasy: Optional[list[str]],
+	wybraniNauczyciele: Optional[list[str]]
+) -> str:
+	"""
+	Oblicza odcisk znormalizowanej konfiguracji filtrów, pod którym przechowywany jest skompilowany filtr zastępstw. Kolejność, wielkość liter i duplikaty wpisów nie wpływają na odcisk.
+
+	Args:
+		wybraneKlasy (Optional[list[str]]): Lista wybranych klas.
+		wybraniNauczyciele (Optional[list[str]]): Lista wybranych nauczycieli.
+
+	Returns:
+		str: Suma kontrolna (SHA-256) konfiguracji filtrów.
+	"""
+
+	klasy = sorted({normalizujTekst(klasa) for klasa in wybraneKlasy or []})
+	nauczyciele = sorted({normalizujTekst(nauczyciel) for nauczyciel in wybraniNauczyciele or []})
+
+	return obliczSumęKontrolną(json.dumps([klasy, nauczyciele], ensure_ascii=False))
+
+
+def zbudujFiltr(
+	wybraneKlasy: Optional[list[str]],
+	wybraniNauczyciele: Optional[list[str]]
+) -> FiltrZastępstw:
+	"""
+	Kompiluje filtr zastępstw z wybranych klas i nauczycieli.
+
+	Args:
+		wybraneKlasy (Optional[list[str]]): Lista wybranych klas.
+		wybraniNauczyciele (Optional[list[str]]): Lista wybranych nauczycieli.
+
+	Returns:
+		FiltrZastępstw: Filtr z jednym wyrażeniem regularnym dla wszystkich klas i zestawem kluczy nauczycieli.
+	"""
+
+	wzoryKlas = []
+	kluczeNauczycieli = set()
+
+	for klasa in wybraneKlasy or []:
+		części = normalizujTekst(klasa).split()
+		wzoryKlas.append(r"\s*".join(map(re.escape, części)))
+
+	for nauczyciel in wybraniNauczyciele or []:
+		kluczeNauczycieli |= zwróćNazwyKluczy(nauczyciel)
+
+	return FiltrZastępstw(
+		odcisk=zwróćOdciskFiltru(wybraneKlasy, wybraniNauczyciele),
+		wzórKlas=re.compile(r"\b(?:" + "|".join(wzoryKlas) + r")\b") if wzoryKlas else None,
+		kluczeNauczycieli=frozenset(kluczeNauczycieli)
+	)
+
+
+def pobierzFiltrSerwera(
+	identyfikatorSerwera: str,
+	konfiguracjaSerwera: dict[str, Any]
+) -> FiltrZastępstw:
+	"""
+	Zwraca skompilowany filtr zastępstw serwera, budując go tylko wtedy, gdy nie ma go w pamięci podręcznej.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		konfiguracjaSerwera (dict[str, Any]): Słownik z konfiguracją serwera.
+
+	Returns:
+		FiltrZastępstw: Skompilowany filtr zastępstw serwera.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+	odcisk = odciskiFiltrówSerwerów.get(identyfikatorSerwera)
+
+	if odcisk is None or odcisk not in skompilowaneFiltry:
+		wybraneKlasy = konfiguracjaSerwera.get("wybrane-klasy", [])
+		wybraniNauczyciele = konfiguracjaSerwera.get("wybrani-nauczyciele", [])
+		odcisk = zwróćOdciskFiltru(wybraneKlasy, wybraniNauczyciele)
+
+		if odcisk not in skompilowaneFiltry:
+			skompilowaneFiltry[odcisk] = zbudujFiltr(wybraneKlasy, wybraniNauczyciele)
+
+		odciskiFiltrówSerwerów[identyfikatorSerwera] = odcisk
+
+	return skompilowaneFiltry[odcisk]
+
+
+def zbudujRanking(
+	statystykiNauczycieli: Mapping[str, int],
+	filtr: FiltrZastępstw,
+	licznik: int
+) -> RankingNauczycieli:
+	"""
+	Buduje ranking nauczycieli z największą liczbą zastępstw, pomijając nauczycieli ustawionych w filtrze serwera.
+
+	Args:
+		statystykiNauczycieli (Mapping[str, int]): Liczby zastępstw według nauczycieli.
+		filtr (FiltrZastępstw): Skompilowany filtr zastępstw serwera z kluczami pomijanych nauczycieli.
+		licznik (int): Licznik zastępstw serwera odpowiadający statystykom.
+
+	Returns:
+		RankingNauczycieli: Ranking zawierający najwyżej 25 pozycji.
+	"""
+
+	pozycje = heapq.nsmallest(
+		maksymalnaLiczbaPozycjiRankingu,
+		((str(nauczyciel), int(liczba)) for nauczyciel, liczba in statystykiNauczycieli.items() if not (zwróćNazwyKluczy(nauczyciel) & filtr.kluczeNauczycieli)),
+		key=lambda pozycja: (-pozycja[1], pozycja[0])
+	)
+
+	return RankingNauczycieli(odcisk=filtr.odcisk, licznik=licznik, pozycje=tuple(pozycje))
+
+
+def pobierzRankingNauczycieli(
+	identyfikatorSerwera: str,
+	dane: dict[str, Any],
+	konfiguracjaSerwera: dict[str, Any]
+) -> tuple[tuple[str, int], ...]:
+	"""
+	Zwraca ranking nauczycieli serwera z pamięci, budując go od nowa tylko wtedy, gdy zmienił się filtr serwera lub licznik zastępstw nie odpowiada zapamiętanemu (np. po wyzerowaniu statystyk).
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		dane (dict[str, Any]): Dane serwera ze statystykami nauczycieli i licznikiem zastępstw.
+		konfiguracjaSerwera (dict[str, Any]): Słownik z konfiguracją serwera.
+
+	Returns:
+		tuple[tuple[str, int], ...]: Nauczyciele i liczby ich zastępstw, posortowani malejąco według liczby zastępstw.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+	filtr = pobierzFiltrSerwera(identyfikatorSerwera, konfiguracjaSerwera)
+	licznik = int(dane.get("licznik-zastepstw", 0))
+	ranking = rankingiNauczycieli.get(identyfikatorSerwera)
+
+	if ranking is None or ranking.odcisk != filtr.odcisk or ranking.licznik != licznik:
+		statystykiNauczycieli = dane.get("statystyki-nauczycieli", {})
+		ranking = zbudujRanking(statystykiNauczycieli if isinstance(statystykiNauczycieli, dict) else {}, filtr, licznik)
+		rankingiNauczycieli[identyfikatorSerwera] = ranking
+
+	return ranking.pozycje
+
+
+def zaktualizujRankingNauczycieli(
+	identyfikatorSerwera: str,
+	filtr: FiltrZastępstw,
+	poprzedniLicznik: int,
+	dane: dict[str, Any],
+	zmienieniNauczyciele: Iterable[str]
+) -> None:
+	"""
+	Aktualizuje przyrostowo ranking nauczycieli serwera po zwiększeniu liczników wybranych nauczycieli. Liczby zastępstw wyłącznie rosną, więc nauczyciel spoza rankingu może do niego trafić tylko po zwiększeniu własnego licznika i wystarczy porównać go z dotychczasowymi pozycjami. Ranking niezgodny z poprzednim stanem jest usuwany i zostanie zbudowany od nowa przy następnym odczycie.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		filtr (FiltrZastępstw): Skompilowany filtr zastępstw serwera z kluczami pomijanych nauczycieli.
+		poprzedniLicznik (int): Licznik zastępstw serwera przed zwiększeniem.
+		dane (dict[str, Any]): Nowe dane serwera ze statystykami nauczycieli i licznikiem zastępstw.
+		zmienieniNauczyciele (Iterable[str]): Nauczyciele, których liczniki zostały zwiększone.
+	"""
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+	ranking = rankingiNauczycieli.get(identyfikatorSerwera)
+
+	if ranking is None:
+		return
+
+	if ranking.odcisk != filtr.odcisk or ranking.licznik != poprzedniLicznik:
+		rankingiNauczycieli.pop(identyfikatorSerwera, None)
+		return
+
+	statystykiNauczycieli = dane.get("statystyki-nauczycieli", {})
+	pozycje = dict(ranking.pozycje)
+
+	for nauczyciel in zmienieniNauczyciele:
+		if nauczyciel in statystykiNauczycieli and not (zwróćNazwyKluczy(nauczyciel) & filtr.kluczeNauczycieli):
+			pozycje[nauczyciel] = int(statystykiNauczycieli[nauczyciel])
+
+	rankingiNauczycieli[identyfikatorSerwera] = zbudujRanking(pozycje, filtr, int(dane.get("licznik-zastepstw", 0)))
+
+
+def zwróćZakresStatystyk(
+	zakres: str,
+	dzisiaj: date
+) -> tuple[date, date]:
+	"""
+	Wyznacza okres statystyk okresowych dla wybranego zakresu. Drugi semestr rozpoczyna się w dniu ustawionym w kluczu `poczatek-drugiego-semestru`, a pierwszy z początkiem roku szkolnego (1 września).
+
+	Args:
+		zakres (str): Wybrany zakres (`ostatnie-7-dni`, `ten-miesiac` lub `ten-semestr`).
+		dzisiaj (date): Bieżąca data.
+
+	Returns:
+		tuple[date, date]: Pierwszy dzień okresu i dzień następujący po jego ostatnim dniu.
+	"""
+
+	koniec = dzisiaj + timedelta(days=1)
+
+	if zakres == "ostatnie-7-dni":
+		return dzisiaj - timedelta(days=6), koniec
+
+	if zakres == "ten-miesiac":
+		return dzisiaj.replace(day=1), koniec
+
+	początekRoku = date(dzisiaj.year if dzisiaj.month >= 9 else dzisiaj.year - 1, 9, 1)
+
+	try:
+		początekDrugiegoSemestru = date.fromisoformat(str(konfiguracja.get("poczatek-drugiego-semestru", "")).strip())
+	except ValueError:
+		return początekRoku, koniec
+
+	if początekRoku < początekDrugiegoSemestru <= dzisiaj:
+		return początekDrugiegoSemestru, koniec
+
+	return początekRoku, koniec
+
+
+def unieważnijFiltrSerwera(identyfikatorSerwera: str) -> None:
+	"""
+	Usuwa z pamięci podręcznej filtr zastępstw serwera po zmianie jego konfiguracji.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+	"""
+
+	odcisk = odciskiFiltrówSerwerów.pop(str(identyfikatorSerwera), None)
+
+	if odcisk and odcisk not in odciskiFiltrówSerwerów.values():
+		skompilowaneFiltry.pop(odcisk, None)
+
+
+def zwróćOdciskSerwera(konfiguracjaSerwera: dict[str, Any]) -> tuple:
+	"""
+	Tworzy odcisk konfiguracji serwera, który pozwala wykryć zmianę kanału lub filtrów od ostatniego przetworzenia.
+
+	Args:
+		konfiguracjaSerwera (dict[str, Any]): Słownik z konfiguracją serwera.
+
+	Returns:
+		tuple: Krotka z ID kanału, wybranymi klasami i wybranymi nauczycielami.
+	"""
+
+	return (
+		konfiguracjaSerwera.get("identyfikator-kanalu", ""),
+		tuple(konfiguracjaSerwera.get("wybrane-klasy", [])),
+		tuple(konfiguracjaSerwera.get("wybrani-nauczyciele", []))
+	)
+
+
+def pobierzIndeksSerwerów() -> Mapping[str, tuple[SubskrypcjaSzkoły, ...]]:
+	"""
+	Zwraca niezmienny indeks subskrypcji serwerów według szkół, budując go z pliku konfiguracyjnego przy pierwszym odczycie. Zwrócony indeks nie zmienia się po zmianie konfiguracji, więc może być odczytywany bez blokady konfiguracji.
+
+	Returns:
+		Mapping[str, tuple[SubskrypcjaSzkoły, ...]]: Subskrypcje serwerów według ID szkoły.
+	"""
+
+	global indeksSerwerówSzkół
+
+	if indeksSerwerówSzkół is None:
+		indeks = {}
+		szkołySerwerów.clear()
+
+		for identyfikatorSerwera, konfiguracjaSerwera in konfiguracja.get("serwery", {}).items():
+			subskrypcja = zbudujSubskrypcję(identyfikatorSerwera, konfiguracjaSerwera or {})
+
+			if subskrypcja:
+				szkoła = (konfiguracjaSerwera or {}).get("szkoła", "")
+				indeks[szkoła] = indeks.get(szkoła, ()) + (subskrypcja,)
+				szkołySerwerów[str(identyfikatorSerwera)] = szkoła
+
+		indeksSerwerówSzkół = MappingProxyType(indeks)
+
+	return indeksSerwerówSzkół
+
+
+def zbudujSubskrypcję(
+	identyfikatorSerwera: str,
+	konfiguracjaSerwera: dict[str, Any]
+) -> Optional[SubskrypcjaSzkoły]:
+	"""
+	Buduje wpis indeksu serwerów według szkół dla konfiguracji serwera.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		konfiguracjaSerwera (dict[str, Any]): Słownik z konfiguracją serwera.
+
+	Returns:
+		Optional[SubskrypcjaSzkoły]: Subskrypcja szkoły lub None, jeśli serwer nie wybrał szkoły.
+	"""
+
+	if not konfiguracjaSerwera.get("szkoła", ""):
+		return None
+
+	return SubskrypcjaSzkoły(
+		identyfikatorSerwera=str(identyfikatorSerwera),
+		identyfikatorKanału=str(konfiguracjaSerwera.get("identyfikator-kanalu", "")),
+		odcisk=zwróćOdciskSerwera(konfiguracjaSerwera),
+		filtr=pobierzFiltrSerwera(str(identyfikatorSerwera), konfiguracjaSerwera)
+	)
+
+
+def zaktualizujIndeksSerwera(
+	identyfikatorSerwera: str,
+	konfiguracjaSerwera: Optional[dict[str, Any]]
+) -> None:
+	"""
+	Aktualizuje wpis serwera w indeksie serwerów według szkół, podmieniając indeks na nową kopię zamiast modyfikować odczytywany indeks. Wywoływana z zajętą blokadą konfiguracji, po unieważnieniu filtru serwera.
+
+	Args:
+		identyfikatorSerwera (str): ID serwera Discord.
+		konfiguracjaSerwera (Optional[dict[str, Any]]): Aktualna konfiguracja serwera lub None, jeśli serwer został usunięty.
+	"""
+
+	global indeksSerwerówSzkół
+
+	identyfikatorSerwera = str(identyfikatorSerwera)
+	indeks = dict(pobierzIndeksSerwerów())
+	poprzedniaSzkoła = szkołySerwerów.pop(identyfikatorSerwera, None)
+
+	if poprzedniaSzkoła is not None:
+		pozostałe = tuple(subskrypcja for subskrypcja in indeks.get(poprzedniaSzkoła, ()) if subskrypcja.identyfikatorSerwera != identyfikatorSerwera)
+
+		if pozostałe:
+			indeks[poprzedniaSzkoła] = pozostałe
+		else:
+			indeks.pop(poprzedniaSzkoła, None)
+
+	subskrypcja = zbudujSubskrypcję(identyfikatorSerwera, konfiguracjaSerwera or {})
+
+	if subskrypcja:
+		szkoła = (konfiguracjaSerwera or {}).get("szkoła", "")
+		indeks[szkoła] = indeks.get(szkoła, ()) + (subskrypcja,)
+		szkołySerwerów[identyfikatorSerwera] = szkoła
+
+	indeksSerwerówSzkół = MappingProxyType(indeks)
 
 
 def pobierzSłownikSerwera(identyfikatorSerwera: str) -> dict[str, Any]:
@@ -307,9 +894,9 @@ async def zapiszKluczeSerwera(
 
 		serwery[identyfikatorSerwera] = daneSerwera
 		konfiguracja["serwery"] = serwery
-		snapshot = copy.deepcopy(konfiguracja)
-
-		await zapiszKonfiguracje(snapshot)
+		unieważnijFiltrSerwera(identyfikatorSerwera)
+		zaktualizujIndeksSerwera(identyfikatorSerwera, daneSerwera)
+		oznaczZmianęKonfiguracji()
 
 
 async def wyczyśćFiltry(identyfikatorSerwera: str) -> None:
@@ -328,76 +915,181 @@ async def wyczyśćFiltry(identyfikatorSerwera: str) -> None:
 		daneSerwera["szkoła"] = ""
 		daneSerwera["wybrane-klasy"] = []
 		daneSerwera["wybrani-nauczyciele"] = []
-		snapshot = copy.deepcopy(konfiguracja)
+		unieważnijFiltrSerwera(identyfikatorSerwera)
+		zaktualizujIndeksSerwera(identyfikatorSerwera, daneSerwera)
+		oznaczZmianęKonfiguracji()
 
-		await zapiszKonfiguracje(snapshot)
 
+def stwórzKluczeNormalizacyjne(tekst: str) -> list[str]:
+	"""
+	Tworzy dwie wersje kluczy normalizacyjnych dla podanego tekstu.
 
-def dopasujWpisyDoListy(
-	wpisy: list[str],
+	Args:
+		tekst (str): Tekst wejściowy do przetworzenia.
+
+	Returns:
+		list[str]: Lista dwóch kluczy normalizacyjnych [tekstNormalizowany, brakSpacji].
+	"""
+
+	tekstNormalizowany = normalizujTekst(tekst)
+	brakSpacji = re.sub(r"\s+", "", tekstNormalizowany)
+
+	return [tekstNormalizowany, brakSpacji]
+
+
+def zwróćTrigramy(tekst: str) -> set[str]:
+	"""
+	Tworzy zbiór trigramów znakowych tekstu uzupełnionego z obu stron dwiema spacjami, dzięki czemu pierwszy i ostatni znak nazwy (również jednoznakowej) tworzą własne trigramy.
+
+	Args:
+		tekst (str): Znormalizowany tekst bez spacji.
+
+	Returns:
+		set[str]: Zbiór trigramów tekstu.
+	"""
+
+	uzupełnionyTekst = f"  {tekst}  "
+
+	return {uzupełnionyTekst[indeks:indeks + 3] for indeks in range(len(uzupełnionyTekst) - 2)}
+
+
+def pobierzIndeksDopasowań(listaDoDopasowania: list[str]) -> IndeksDopasowań:
+	"""
+	Zwraca indeks wyszukiwania dla listy referencyjnej, budując go tylko przy pierwszym użyciu danej listy. Indeks zawiera mapowanie kluczy normalizacyjnych do oryginalnych elementów, indeks odwrócony trigramów, z którego wybierani są kandydaci do dopasowań przybliżonych, oraz drzewo prefiksów używane w autouzupełnianiu.
+
+	Args:
+		listaDoDopasowania (list[str]): Lista elementów do przetworzenia.
+
+	Returns:
+		IndeksDopasowań: Indeks wyszukiwania listy referencyjnej.
+	"""
+
+	kluczListy = tuple(listaDoDopasowania)
+	indeks = indeksyDopasowań.get(kluczListy)
+
+	if indeks is not None:
+		return indeks
+
+	mapaKluczy = defaultdict(list)
+	normalizowaneDoOryginalnych = defaultdict(list)
+	trigramyNormalizowanych = defaultdict(list)
+	drzewoPrefiksów = defaultdict(list)
+
+	for element in listaDoDopasowania:
+		pełnaNorma = re.sub(r"\s+", "", normalizujTekst(element))
+		słowa = normalizujTekst(element).split(" ")
+
+		# Element jest podpowiadany zarówno od początku nazwy, jak i od każdego kolejnego słowa (np. od nazwiska nauczyciela)
+		for klucz in {pełnaNorma, *(" ".join(słowa[indeks:]) for indeks in range(len(słowa)))}:
+			for długość in range(len(klucz) + 1):
+				węzeł = drzewoPrefiksów[klucz[:długość]]
+
+				if len(węzeł) < maksymalnaLiczbaPodpowiedzi and element not in węzeł:
+					węzeł.append(element)
+
+		if pełnaNorma not in normalizowaneDoOryginalnych:
+			for trigram in zwróćTrigramy(pełnaNorma):
+				trigramyNormalizowanych[trigram].append(pełnaNorma)
+
+		normalizowaneDoOryginalnych[pełnaNorma].append(element)
+
+		for klucz in stwórzKluczeNormalizacyjne(element):
+			mapaKluczy[klucz].append(element)
+
+	indeks = IndeksDopasowań(
+		mapaKluczy=dict(mapaKluczy),
+		normalizowaneDoOryginalnych=dict(normalizowaneDoOryginalnych),
+		trigramyNormalizowanych={trigram: tuple(normy) for trigram, normy in trigramyNormalizowanych.items()},
+		drzewoPrefiksów={prefiks: tuple(elementy) for prefiks, elementy in drzewoPrefiksów.items()}
+	)
+
+	if len(indeksyDopasowań) >= maksymalnaLiczbaIndeksówDopasowań:
+		indeksyDopasowań.pop(next(iter(indeksyDopasowań)))
+
+	indeksyDopasowań[kluczListy] = indeks
+
+	return indeks
+
+
+def podpowiedzWpisy(
 	listaDoDopasowania: list[str],
-	cutoff: float=0.6
-) -> tuple[list[str], dict[str, str], list[str]]:
+	wpisanyTekst: str
+) -> list[str]:
 	"""
-	Dopasowuje listę wpisów do listy referencyjnej, próbując znaleźć dokładne lub przybliżone dopasowania.
+	Zwraca elementy listy referencyjnej, których nazwa lub jedno z jej słów zaczyna się od wpisanego tekstu. Podpowiedzi są odczytywane z drzewa prefiksów przechowywanego w pamięci, więc nie wymagają blokady konfiguracji ani przeszukiwania listy.
 
 	Args:
-		wpisy (list[str]): Lista wpisów do dopasowania.
-		listaDoDopasowania (list[str]): Lista referencyjna, do której mają być dopasowane wpisy.
-		cutoff (float, optional): Minimalny próg podobieństwa dla dopasowań przybliżonych (0-1). Domyślnie 0.6.
+		listaDoDopasowania (list[str]): Lista klas lub nauczycieli szkoły.
+		wpisanyTekst (str): Tekst wpisany dotychczas przez użytkownika.
 
 	Returns:
-		tuple[list[str], dict[str, str], list[str]]:
-			idealneDopasowania: Lista idealnie dopasowanych wpisów.
-			sugestie: Słownik sugestii przybliżonych dopasowań.
-			nieZnaleziono: Lista wpisów, dla których nie znaleziono dopasowania.
+		list[str]: Najwyżej 25 pasujących elementów w kolejności z listy referencyjnej.
 	"""
 
-	def stwórzKluczeNormalizacyjne(tekst: str) -> list[str]:
-		"""
-		Tworzy dwie wersje kluczy normalizacyjnych dla podanego tekstu.
+	if not listaDoDopasowania:
+		return []
 
-		Args:
-			tekst (str): Tekst wejściowy do przetworzenia.
+	drzewoPrefiksów = pobierzIndeksDopasowań(listaDoDopasowania).drzewoPrefiksów
+	tekstNormalizowany = normalizujTekst(wpisanyTekst)
+	podpowiedzi = drzewoPrefiksów.get(tekstNormalizowany) or drzewoPrefiksów.get(re.sub(r"\s+", "", tekstNormalizowany), ())
 
-		Returns:
-			list[str]: Lista dwóch kluczy normalizacyjnych [tekstNormalizowany, brakSpacji].
-		"""
+	return list(podpowiedzi)
 
-		tekstNormalizowany = normalizujTekst(tekst)
-		brakSpacji = re.sub(r"\s+", "", tekstNormalizowany)
 
-		return [tekstNormalizowany, brakSpacji]
+def znajdźNajbliższeDopasowanie(
+	normaWpisu: str,
+	kandydaci: Iterable[str],
+	cutoff: float
+) -> Optional[tuple[float, str]]:
+	"""
+	Wyszukuje najbardziej podobną znormalizowaną nazwę spośród podanych kandydatów, oceniając ich tą samą miarą podobieństwa i w tej samej kolejności co `difflib.get_close_matches`.
 
-	def zbudujIndeks(listaDoDopasowania: list[str]) -> tuple[dict[str, list[str]], dict[str, list[str]], list[str]]:
-		"""
-		Buduje indeksy wyszukiwania dla listy referencyjnej, tworząc mapowanie kluczy normalizacyjnych do oryginalnych elementów.
+	Args:
+		normaWpisu (str): Znormalizowany wpis bez spacji.
+		kandydaci (Iterable[str]): Znormalizowane nazwy do porównania.
+		cutoff (float): Minimalny próg podobieństwa (0-1).
 
-		Args:
-			listaDoDopasowania (list[str]): Lista elementów do przetworzenia.
+	Returns:
+		Optional[tuple[float, str]]: Podobieństwo i najbardziej podobna nazwa lub None, jeśli żadna nie osiąga progu.
+	"""
 
-		Returns:
-			tuple[dict[str, list[str]], dict[str, list[str]], list[str]]:
-				mapaKluczy: Słownik, w którym każdy klucz normalizacyjny mapuje do listy odpowiadających mu oryginalnych elementów.
-				normalizowaneDoOryginalnych: Słownik odwzorowujący pełną znormalizowaną nazwę na listę oryginalnych elementów.
-				listaNormalizowanych: Lista wszystkich pełnych znormalizowanych nazw występujących w liście elementów do przetworzenia.
-		"""
+	porównanie = difflib.SequenceMatcher()
+	porównanie.set_seq2(normaWpisu)
+	najlepszyWynik = None
 
-		mapaKluczy = defaultdict(list)
-		normalizowaneDoOryginalnych = defaultdict(list)
-		listaNormalizowanych = []
+	for kandydat in kandydaci:
+		porównanie.set_seq1(kandydat)
 
-		for element in listaDoDopasowania:
-			pełnaNorma = re.sub(r"\s+", "", normalizujTekst(element))
-			normalizowaneDoOryginalnych[pełnaNorma].append(element)
-			listaNormalizowanych.append(pełnaNorma)
+		if porównanie.real_quick_ratio() >= cutoff and porównanie.quick_ratio() >= cutoff:
+			wynik = (porównanie.ratio(), kandydat)
 
-			for klucz in stwórzKluczeNormalizacyjne(element):
-				mapaKluczy[klucz].append(element)
+			if wynik[0] >= cutoff and (najlepszyWynik is None or wynik > najlepszyWynik):
+				najlepszyWynik = wynik
 
-		return mapaKluczy, normalizowaneDoOryginalnych, listaNormalizowanych
+	return najlepszyWynik
 
-	mapaKluczy, normalizowaneDoOryginalnych, listaNormalizowanych = zbudujIndeks(listaDoDopasowania)
+
+def dopasujWpisyDoListy(
+	wpisy: list[str],
+	listaDoDopasowania: list[str],
+	cutoff: float=0.6
+) -> tuple[list[str], dict[str, str], list[str]]:
+	"""
+	Dopasowuje listę wpisów do listy referencyjnej, próbując znaleźć dokładne lub przybliżone dopasowania.
+
+	Args:
+		wpisy (list[str]): Lista wpisów do dopasowania.
+		listaDoDopasowania (list[str]): Lista referencyjna, do której mają być dopasowane wpisy.
+		cutoff (float, optional): Minimalny próg podobieństwa dla dopasowań przybliżonych (0-1). Domyślnie 0.6.
+
+	Returns:
+		tuple[list[str], dict[str, str], list[str]]:
+			idealneDopasowania: Lista idealnie dopasowanych wpisów.
+			sugestie: Słownik sugestii przybliżonych dopasowań.
+			nieZnaleziono: Lista wpisów, dla których nie znaleziono dopasowania.
+	"""
+
+	indeks = pobierzIndeksDopasowań(listaDoDopasowania)
 
 	idealneDopasowania = []
 	sugestie = {}
@@ -408,8 +1100,8 @@ def dopasujWpisyDoListy(
 		znalezioneIdealneDopasowania = None
 
 		for klucz in kluczeWpisu:
-			if klucz in mapaKluczy:
-				znalezioneIdealneDopasowania = mapaKluczy[klucz][0]
+			if klucz in indeks.mapaKluczy:
+				znalezioneIdealneDopasowania = indeks.mapaKluczy[klucz][0]
 				break
 
 		if znalezioneIdealneDopasowania:
@@ -420,11 +1112,19 @@ def dopasujWpisyDoListy(
 
 		# Dopasowanie przybliżone
 		normaWpisu = re.sub(r"\s+", "", normalizujTekst(wpis))
-		normaKandydatów = difflib.get_close_matches(normaWpisu, listaNormalizowanych, n=1, cutoff=cutoff)
+		kandydaci = set()
 
-		if normaKandydatów:
-			normaKandydata = normaKandydatów[0]
-			kandydat = normalizowaneDoOryginalnych[normaKandydata][0]
+		for trigram in zwróćTrigramy(normaWpisu):
+			kandydaci.update(indeks.trigramyNormalizowanych.get(trigram, ()))
+
+		najlepszyWynik = znajdźNajbliższeDopasowanie(normaWpisu, kandydaci, cutoff)
+
+		# Nazwy bez wspólnego trigramu są sprawdzane dopiero wtedy, gdy żaden kandydat nie osiągnął progu
+		if najlepszyWynik is None:
+			najlepszyWynik = znajdźNajbliższeDopasowanie(normaWpisu, (norma for norma in indeks.normalizowaneDoOryginalnych if norma not in kandydaci), cutoff)
+
+		if najlepszyWynik:
+			kandydat = indeks.normalizowaneDoOryginalnych[najlepszyWynik[1]][0]
 			sugestie[wpis] = kandydat
 		else:
 			nieZnaleziono.append(wpis)
@@ -448,6 +1148,25 @@ def pobierzListęKlas(szkoła: str | None=None) -> list[str]:
 	if isinstance(suroweDane, dict):
 		return [klasa for grupy in suroweDane.values() for klasa in grupy]
 
+	if isinstance(suroweDane, list):
+		return suroweDane
+
+	return []
+
+
+def pobierzListęNauczycieli(szkoła: str | None=None) -> list[str]:
+	"""
+	Pobiera listę nauczycieli dla wybranej szkoły z konfiguracji.
+
+	Args:
+		szkoła (str | None, optional): Szkoła, dla której mają zostać pobrani nauczyciele.
+
+	Returns:
+		list[str]: Lista nauczycieli przypisanych do danej szkoły.
+	"""
+
+	suroweDane = (konfiguracja.get("szkoły", {})).get(szkoła, {}).get("lista-nauczycieli", [])
+
 	if isinstance(suroweDane, list):
 		return suroweDane
 
@@ -0,0 +1,87 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+# Standardowe biblioteki
+import asyncio
+import contextlib
+import heapq
+import time
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.handlers.logging import logiKonsoli
+from src.helpers.helpers import (
+	kolejnośćUsunięć,
+	nowoZaplanowaneUsunięcie,
+	ograniczUsuwanie,
+	zaplanowaneUsunięcia
+)
+
+# Maksymalna liczba ponownych prób usunięcia wiadomości po błędzie HTTP
+maksymalnaLiczbaPrób = 5
+
+async def usuwajZaplanowaneWiadomości(bot: discord.Client) -> None:
+	"""
+	Usuwa wiadomości zaplanowane przez `zaplanujUsunięcie` w chwili upływu ich terminu. Kolejka jest niezależna od połączenia z Discordem, więc zaplanowane usunięcia przetrwają ponowne połączenie, a usunięcia zakończone błędem HTTP są ponawiane z rosnącym opóźnieniem.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	await bot.wait_until_ready()
+
+	while not bot.is_closed():
+		if not zaplanowaneUsunięcia:
+			nowoZaplanowaneUsunięcie.clear()
+			await nowoZaplanowaneUsunięcie.wait()
+			continue
+
+		termin, _, identyfikatorKanału, identyfikatorWiadomości, próby = zaplanowaneUsunięcia[0]
+		pozostało = termin - time.monotonic()
+
+		if pozostało > 0:
+			nowoZaplanowaneUsunięcie.clear()
+
+			with contextlib.suppress(asyncio.TimeoutError):
+				await asyncio.wait_for(nowoZaplanowaneUsunięcie.wait(), pozostało)
+			continue
+
+		heapq.heappop(zaplanowaneUsunięcia)
+		kanał = bot.get_channel(identyfikatorKanału)
+
+		try:
+			if kanał is None:
+				raise LookupError(f"Nie znaleziono kanału o ID {identyfikatorKanału}.")
+
+			await ograniczUsuwanie(kanał.get_partial_message(identyfikatorWiadomości))
+		except discord.NotFound:
+			pass
+		except discord.Forbidden as e:
+			logiKonsoli.warning(
+				f"Brak uprawnień do usunięcia wiadomości o ID {identyfikatorWiadomości}. Więcej informacji: {e}"
+			)
+		except (discord.HTTPException, LookupError) as e:
+			if próby + 1 >= maksymalnaLiczbaPrób:
+				logiKonsoli.exception(
+					f"Nie udało się usunąć wiadomości o ID {identyfikatorWiadomości} po {maksymalnaLiczbaPrób} próbach. Więcej informacji: {e}"
+				)
+				continue
+
+			heapq.heappush(
+				zaplanowaneUsunięcia,
+				(time.monotonic() + 5 * 2 ** próby, next(kolejnośćUsunięć), identyfikatorKanału, identyfikatorWiadomości, próby + 1)
+			)
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas usuwania zaplanowanej wiadomości o ID {identyfikatorWiadomości}. Więcej informacji: {e}"
+			)
\ No newline at end of file
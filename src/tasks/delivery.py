@@ -0,0 +1,45 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+# Standardowe biblioteki
+import asyncio
+import time
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.handlers.configuration import konfiguracja
+from src.handlers.data import pobierzSerweryZeSkrzynką
+from src.handlers.logging import logiKonsoli
+from src.handlers.notifications import dostarczKroki
+
+async def ponawiajDostarczanie(bot: discord.Client) -> None:
+	"""
+	Okresowo ponawia dostarczanie kroków ze skrzynki nadawczej, których termin kolejnej próby już minął. Pierwsze sprawdzenie następuje zaraz po uruchomieniu bota, dzięki czemu wiadomości niedostarczone przed ponownym uruchomieniem są wysyłane od pierwszej niewysłanej.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	await bot.wait_until_ready()
+	interwał = max(1, int(konfiguracja.get("interwal-ponawiania-dostarczania", 30)))
+
+	while not bot.is_closed():
+		try:
+			serwery = await pobierzSerweryZeSkrzynką(time.time())
+			await asyncio.gather(*(dostarczKroki(bot, identyfikatorSerwera) for identyfikatorSerwera in serwery), return_exceptions=True)
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas ponawiania dostarczania wiadomości. Więcej informacji: {e}"
+			)
+
+		await asyncio.sleep(interwał)
\ No newline at end of file
@@ -24,19 +24,21 @@ from src.handlers.configuration import (
 	blokadaKonfiguracji,
 	konfiguracja
 )
-from src.handlers.data import zarządzajPlikiemDanych
+from src.handlers.data import (
+	skompaktujStatystyki,
+	zarządzajPlikiemDanych
+)
 from src.handlers.logging import logiKonsoli
 from src.helpers.helpers import (
-	blokadaNaSerwer,
 	odmieńZastępstwa,
-	ograniczUsuwanie,
 	ograniczWysyłanie,
-	zwróćNazwyKluczy
+	pobierzRankingNauczycieli,
+	zaplanujUsunięcie
 )
 
 async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 	"""
-	Monitoruje datę zakończenia roku szkolnego i generuje raport podsumowujący statystyki zastępstw.
+	Monitoruje datę zakończenia roku szkolnego i generuje raport podsumowujący statystyki zastępstw. Przy każdym sprawdzeniu łączy również starzejące się statystyki okresowe w większe przedziały.
 
 	Args:
 		bot (discord.Client): Instancja klienta Discord.
@@ -45,6 +47,8 @@ async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 	await bot.wait_until_ready()
 	while not bot.is_closed():
 		try:
+			await skompaktujStatystyki(datetime.now(ZoneInfo("Europe/Warsaw")).date())
+
 			async with blokadaKonfiguracji:
 				dataZakończeniaRoku = konfiguracja.get("koniec-roku-szkolnego", "").strip()
 				serwery = list(konfiguracja.get("serwery", {}).keys())
@@ -113,14 +117,8 @@ async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 							continue
 
 						if kanał.permissions_for(kanał.guild.me).mention_everyone:
-							async with blokadaNaSerwer:
-								wzmianka = await ograniczWysyłanie(kanał, "@everyone Podsumowanie roku szkolnego!", allowed_mentions=discord.AllowedMentions(everyone=True))
-							await asyncio.sleep(5)
-
-							try:
-								await ograniczUsuwanie(wzmianka)
-							except Exception:
-								pass
+							wzmianka = await ograniczWysyłanie(kanał, "@everyone Podsumowanie roku szkolnego!", allowed_mentions=discord.AllowedMentions(everyone=True))
+							zaplanujUsunięcie(wzmianka)
 						else:
 							logiKonsoli.warning(
 								f"Brak uprawnień do używania @everyone dla serwera o ID {identyfikatorSerwera}. Wzmianka została pominięta."
@@ -132,7 +130,6 @@ async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 
 						wybraniNauczyciele = konfiguracjaSerwera.get("wybrani-nauczyciele", [])
 						wybraneKlasy = konfiguracjaSerwera.get("wybrane-klasy", [])
-						statystyki = dane.get("statystyki-nauczycieli", {})
 
 						if wybraneKlasy and not wybraniNauczyciele:
 							embed = discord.Embed(
@@ -141,17 +138,15 @@ async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 								color=Constants.KOLOR
 							)
 
-							if isinstance(statystyki, dict) and statystyki:
-								sortowanie = sorted(statystyki.items(), key=lambda x: (-int(x[1]), x[0]))
-								wolneMiejsca = 25 - len(embed.fields)
+							ranking = pobierzRankingNauczycieli(str(identyfikatorSerwera), dane, konfiguracjaSerwera)
+							wolneMiejsca = 25 - len(embed.fields)
 
-								if wolneMiejsca > 0:
-									for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
-										embed.add_field(name=str(nauczyciel), value=f"Liczba zastępstw: {int(liczba)}", inline=True)
+							if wolneMiejsca > 0:
+								for nauczyciel, liczba in ranking[:wolneMiejsca]:
+									embed.add_field(name=nauczyciel, value=f"Liczba zastępstw: {liczba}", inline=True)
 
 							embed.set_footer(text=stopka)
-							async with blokadaNaSerwer:
-								await ograniczWysyłanie(kanał, embed=embed)
+							await ograniczWysyłanie(kanał, embed=embed)
 							logiKonsoli.info(
 								f"Roczne podsumowanie statystyk zastępstw zostało pomyślnie dostarczone do serwera o ID {identyfikatorSerwera}."
 							)
@@ -163,30 +158,20 @@ async def sprawdźKoniecRoku(bot: discord.Client) -> None:
 								color=Constants.KOLOR
 							)
 
-							wykluczeni = set()
-							pozostali = {}
-
-							for nauczyciel in wybraniNauczyciele:
-								wykluczeni |= zwróćNazwyKluczy(nauczyciel)
-
-							if isinstance(statystyki, dict):
-								for nazwa, liczba in statystyki.items():
-									if not (zwróćNazwyKluczy(nazwa) & wykluczeni):
-										pozostali[nazwa] = int(liczba)
+							# Ranking pomija nauczycieli ustawionych w filtrze serwera
+							ranking = pobierzRankingNauczycieli(str(identyfikatorSerwera), dane, konfiguracjaSerwera)
 
-							if pozostali:
-								sortowanie = sorted(pozostali.items(), key=lambda x: (-int(x[1]), x[0]))
+							if ranking:
 								wolneMiejsca = 25 - len(embed.fields)
 
 								if wolneMiejsca > 0:
-									for nauczyciel, liczba in sortowanie[:wolneMiejsca]:
-										embed.add_field(name=str(nauczyciel), value=f"Liczba zastępstw: {int(liczba)}", inline=True)
+									for nauczyciel, liczba in ranking[:wolneMiejsca]:
+										embed.add_field(name=nauczyciel, value=f"Liczba zastępstw: {liczba}", inline=True)
 							else:
 								embed.add_field(name="Brak danych", value="Nie znaleziono odpowiednich statystyk dla tego serwera.", inline=False)
 
 							embed.set_footer(text=stopka)
-							async with blokadaNaSerwer:
-								await ograniczWysyłanie(kanał, embed=embed)
+							await ograniczWysyłanie(kanał, embed=embed)
 							logiKonsoli.info(
 								f"Roczne podsumowanie statystyk zastępstw zostało pomyślnie dostarczone do serwera o ID {identyfikatorSerwera}."
 							)
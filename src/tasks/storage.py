@@ -0,0 +1,69 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+# Standardowe biblioteki
+import asyncio
+
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.handlers.configuration import (
+	konfiguracja,
+	zatwierdźKonfiguracje,
+	zmianaKonfiguracji
+)
+from src.handlers.data import zatwierdźZapisy
+from src.handlers.logging import logiKonsoli
+
+async def zapisujDaneOkresowo(bot: discord.Client) -> None:
+	"""
+	Okresowo zapisuje zbiorczo zmienione dane serwerów z pamięci podręcznej do bazy danych.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	await bot.wait_until_ready()
+	interwał = max(1, int(konfiguracja.get("interwal-zapisu-danych", 60)))
+
+	while not bot.is_closed():
+		await asyncio.sleep(interwał)
+
+		try:
+			await zatwierdźZapisy()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas okresowego zapisywania danych serwerów. Więcej informacji: {e}"
+			)
+
+
+async def zapisujKonfiguracjęOkresowo(bot: discord.Client) -> None:
+	"""
+	Zapisuje konfigurację do pliku konfiguracyjnego po jej zmianie, odczekując krótki czas, aby zmiany zgłoszone w tym czasie trafiły do pliku jednym zapisem.
+
+	Args:
+		bot (discord.Client): Instancja klienta Discord.
+	"""
+
+	await bot.wait_until_ready()
+	opóźnienie = max(0, float(konfiguracja.get("opoznienie-zapisu-konfiguracji", 5)))
+
+	while not bot.is_closed():
+		await zmianaKonfiguracji.wait()
+		await asyncio.sleep(opóźnienie)
+
+		try:
+			await zatwierdźKonfiguracje()
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas okresowego zapisywania pliku konfiguracyjnego. Więcej informacji: {e}"
+			)
\ No newline at end of file
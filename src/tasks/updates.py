@@ -12,107 +12,682 @@
 
 # Standardowe biblioteki
 import asyncio
+from collections import defaultdict
+from datetime import (
+	date,
+	datetime
+)
+import random
+import time
+from typing import (
+	Any,
+	Optional
+)
+from zoneinfo import ZoneInfo
 
 # Zewnętrzne biblioteki
 import discord
 
 # Wewnętrzne importy
-from src.handlers.configuration import (
-	blokadaKonfiguracji,
-	konfiguracja
+from src.classes.substitution import (
+	FiltrZastępstw,
+	RóżnicaWpisów,
+	SubskrypcjaSzkoły,
+	WpisZastępstwa,
+	WynikFiltrowania
+)
+from src.handlers.configuration import konfiguracja
+from src.handlers.data import (
+	zaplanujDostarczenie,
+	zarządzajPlikiemDanych
 )
-from src.handlers.data import zarządzajPlikiemDanych
 from src.handlers.logging import logiKonsoli
-from src.handlers.notifications import wyślijAktualizacje
-from src.handlers.parser import wyodrębnijDane
-from src.handlers.scraper import pobierzZawartośćStrony
+from src.handlers.notifications import (
+	dostarczKroki,
+	przygotujNagłówek,
+	przygotujOsadzeniaNauczyciela,
+	przygotujOsadzenieUsuniętych,
+	przygotujWiadomości,
+	zaplanujEdycję,
+	zaplanujWysłanie
+)
+from src.handlers.parser import (
+	filtrujWpisy,
+	wyodrębnijDaneSzkoły
+)
+from src.handlers.scraper import (
+	pobierzZawartośćStrony,
+	walidatoryStron
+)
 from src.helpers.helpers import (
-	blokadaNaSerwer,
 	obliczSumęKontrolną,
-	pobierzListęKlas
+	pobierzIndeksSerwerów,
+	pobierzListęKlas,
+	zaktualizujRankingNauczycieli
 )
 
+# Ostatnio wyodrębnione dane zastępstw per szkoła wraz z odciskiem listy klas, z którą je wyodrębniono, wykorzystywane, gdy strona nie uległa zmianie
+ostatnieDaneSzkół: dict[str, tuple[str, tuple[str, list[WpisZastępstwa]]]] = {}
+
+# Odciski konfiguracji serwerów, dla których ostatnio wyodrębnione dane szkoły zostały pomyślnie przetworzone
+przetworzoneSerwery: defaultdict[str, dict[str, tuple]] = defaultdict(dict)
+
+# Terminy kolejnych sprawdzeń szkół (według zegara monotonicznego)
+terminySprawdzeńSzkół: dict[str, float] = {}
+
+# Liczba kolejnych sprawdzeń szkoły, w których strona nie uległa zmianie
+niezmienioneSprawdzeniaSzkół: defaultdict[str, int] = defaultdict(int)
+
+# Odciski konfiguracji serwerów subskrybujących szkołę w chwili jej ostatniego zaplanowania, pozwalające od razu sprawdzić szkołę po zmianie konfiguracji
+subskrybenciSzkół: dict[str, frozenset] = {}
+
+# Domyślny harmonogram sprawdzania szkół, nadpisywany kluczem `harmonogram-sprawdzania` w pliku konfiguracyjnym oraz w konfiguracji konkretnej szkoły
+domyślnyHarmonogram = {
+	"godziny-poranne": [6, 10],
+	"interwal-poranny": 120,
+	"interwal-dzienny": 300,
+	"godziny-nocne": [22, 6],
+	"interwal-nocny": 1800,
+	"interwal-weekendowy": 3600,
+	"interwal-wakacyjny": 21600,
+	"prog-niezmienionych-odpowiedzi": 3,
+	"maksymalny-interwal": 3600,
+	"rozrzut": 0.2
+}
+
+# Domyślna liczba szkół sprawdzanych jednocześnie
+domyślnyLimitJednoczesnychSzkół = 4
+
+# Niepoprawne ustawienia sprawdzania, o których już ostrzeżono (ostrzeżenie nie jest powtarzane przy każdym obiegu pętli)
+zgłoszoneUstawieniaSprawdzania: set[str] = set()
+
+def czyWGodzinach(
+	godzina: int,
+	przedział: list[int]
+) -> bool:
+	"""
+	Sprawdza, czy godzina mieści się w przedziale godzin, również przechodzącym przez północ.
+
+	Args:
+		godzina (int): Sprawdzana godzina.
+		przedział (list[int]): Godzina początkowa (włącznie) i końcowa (wyłącznie).
+
+	Returns:
+		bool: True, jeśli godzina mieści się w przedziale, False w przeciwnym razie.
+	"""
+
+	początek, koniec = int(przedział[0]), int(przedział[1])
+
+	if początek <= koniec:
+		return początek <= godzina < koniec
+
+	return godzina >= początek or godzina < koniec
+
+
+def czyWakacje(
+	dzisiaj: date,
+	dataZakończeniaRoku: str
+) -> bool:
+	"""
+	Sprawdza, czy trwa przerwa między zakończeniem roku szkolnego a początkiem kolejnego (1 września).
+
+	Args:
+		dzisiaj (date): Bieżąca data.
+		dataZakończeniaRoku (str): Data zakończenia roku szkolnego z pliku konfiguracyjnego.
+
+	Returns:
+		bool: True, jeśli trwają wakacje, False w przeciwnym razie lub przy niepoprawnej dacie.
+	"""
+
+	try:
+		koniecRoku = datetime.strptime(dataZakończeniaRoku.strip()[:10], "%Y-%m-%d").date()
+	except ValueError:
+		return False
+
+	return koniecRoku <= dzisiaj < date(koniecRoku.year, 9, 1)
+
+
+def zwróćInterwałSzkoły(
+	harmonogram: dict[str, Any],
+	niezmienioneSprawdzenia: int,
+	dataZakończeniaRoku: str
+) -> float:
+	"""
+	Wyznacza czas do kolejnego sprawdzenia szkoły według godziny w strefie Europe/Warsaw. Rano w dni robocze strona sprawdzana jest najczęściej, w nocy, w weekendy i w wakacje rzadziej, a po kolejnych niezmienionych odpowiedziach interwał rośnie wykładniczo. Losowy rozrzut zapobiega jednoczesnemu pobieraniu stron szkół z jednego serwera.
+
+	Args:
+		harmonogram (dict[str, Any]): Harmonogram sprawdzania szkoły.
+		niezmienioneSprawdzenia (int): Liczba kolejnych sprawdzeń, w których strona nie uległa zmianie.
+		dataZakończeniaRoku (str): Data zakończenia roku szkolnego z pliku konfiguracyjnego.
+
+	Returns:
+		float: Liczba sekund do kolejnego sprawdzenia szkoły.
+	"""
+
+	teraz = datetime.now(ZoneInfo("Europe/Warsaw"))
+	dzieńRoboczy = teraz.weekday() < 5 and not czyWakacje(teraz.date(), dataZakończeniaRoku)
+
+	if not dzieńRoboczy:
+		interwał = float(harmonogram["interwal-wakacyjny"] if teraz.weekday() < 5 else harmonogram["interwal-weekendowy"])
+	elif czyWGodzinach(teraz.hour, harmonogram["godziny-poranne"]):
+		interwał = float(harmonogram["interwal-poranny"])
+	elif czyWGodzinach(teraz.hour, harmonogram["godziny-nocne"]):
+		interwał = float(harmonogram["interwal-nocny"])
+	else:
+		interwał = float(harmonogram["interwal-dzienny"])
+
+	# Rano, gdy zmiany są najbardziej prawdopodobne, interwał nie jest wydłużany przez niezmienione odpowiedzi
+	if not (dzieńRoboczy and czyWGodzinach(teraz.hour, harmonogram["godziny-poranne"])):
+		nadmiarowe = max(0, niezmienioneSprawdzenia - int(harmonogram["prog-niezmienionych-odpowiedzi"]))
+		interwał = min(interwał * 2 ** min(nadmiarowe, 16), max(interwał, float(harmonogram["maksymalny-interwal"])))
+
+	rozrzut = float(harmonogram["rozrzut"])
+	interwał *= random.uniform(1 - rozrzut, 1 + rozrzut)
+
+	# Sprawdzenie zaplanowane przed porankiem dnia roboczego nie może przypaść po jego rozpoczęciu
+	początekPoranka = teraz.replace(hour=int(harmonogram["godziny-poranne"][0]), minute=0, second=0, microsecond=0)
+
+	if dzieńRoboczy and teraz < początekPoranka:
+		interwał = min(interwał, (początekPoranka - teraz).total_seconds())
+
+	return max(1.0, interwał)
+
+
+def zwróćUstawieniaSprawdzania(
+	identyfikatorSzkoły: str | None=None,
+	daneSzkoły: dict[str, Any] | None=None
+) -> tuple[dict[str, Any], int]:
+	"""
+	Zwraca sprawdzony harmonogram sprawdzania szkoły (domyślny, nadpisany globalnym i nadpisany ustawieniami szkoły) oraz limit jednocześnie sprawdzanych szkół. Niepoprawna wartość w ręcznie edytowanym pliku konfiguracyjnym powoduje ostrzeżenie i użycie wartości domyślnych, dzięki czemu nie zatrzymuje sprawdzania pozostałych szkół.
+
+	Args:
+		identyfikatorSzkoły (str | None, optional): ID szkoły, której harmonogram jest sprawdzany.
+		daneSzkoły (dict[str, Any] | None, optional): Konfiguracja szkoły.
+
+	Returns:
+		tuple[dict[str, Any], int]: Harmonogram sprawdzania i limit jednocześnie sprawdzanych szkół.
+	"""
+
+	harmonogram = {**domyślnyHarmonogram, **(konfiguracja.get("harmonogram-sprawdzania", {}) or {}), **((daneSzkoły or {}).get("harmonogram-sprawdzania", {}) or {})}
+
+	try:
+		limit = int(konfiguracja.get("limit-jednoczesnych-szkol", domyślnyLimitJednoczesnychSzkół))
+
+		if limit < 1:
+			raise ValueError("Limit jednocześnie sprawdzanych szkół musi być dodatni.")
+	except (TypeError, ValueError) as e:
+		if "limit" not in zgłoszoneUstawieniaSprawdzania:
+			zgłoszoneUstawieniaSprawdzania.add("limit")
+			logiKonsoli.warning(
+				f"Niepoprawny limit jednocześnie sprawdzanych szkół w pliku konfiguracyjnym. Zostanie użyta wartość domyślna ({domyślnyLimitJednoczesnychSzkół}). Więcej informacji: {e}"
+			)
+		limit = domyślnyLimitJednoczesnychSzkół
+
+	try:
+		for klucz in ("godziny-poranne", "godziny-nocne"):
+			godziny = [int(godzina) for godzina in harmonogram[klucz]]
+
+			if len(godziny) != 2 or not all(0 <= godzina <= 24 for godzina in godziny):
+				raise ValueError(f"Klucz {klucz} musi zawierać dwie godziny z przedziału 0-24.")
+
+			harmonogram[klucz] = godziny
+
+		for klucz in ("interwal-poranny", "interwal-dzienny", "interwal-nocny", "interwal-weekendowy", "interwal-wakacyjny", "maksymalny-interwal"):
+			harmonogram[klucz] = float(harmonogram[klucz])
+
+			if not harmonogram[klucz] > 0:
+				raise ValueError(f"Klucz {klucz} musi być liczbą dodatnią.")
+
+		harmonogram["prog-niezmienionych-odpowiedzi"] = int(harmonogram["prog-niezmienionych-odpowiedzi"])
+		harmonogram["rozrzut"] = float(harmonogram["rozrzut"])
+
+		if harmonogram["prog-niezmienionych-odpowiedzi"] < 0 or not 0 <= harmonogram["rozrzut"] < 1:
+			raise ValueError("Próg niezmienionych odpowiedzi musi być nieujemny, a rozrzut mieścić się w przedziale 0-1.")
+	except (TypeError, ValueError) as e:
+		zgłoszenie = f"{identyfikatorSzkoły}:{e}"
+
+		if zgłoszenie not in zgłoszoneUstawieniaSprawdzania:
+			zgłoszoneUstawieniaSprawdzania.add(zgłoszenie)
+			logiKonsoli.warning(
+				f"Niepoprawny harmonogram sprawdzania dla szkoły o ID {identyfikatorSzkoły}. Zostanie użyty domyślny harmonogram. Więcej informacji: {e}"
+			)
+		harmonogram = dict(domyślnyHarmonogram)
+
+	return harmonogram, limit
+
+
 async def sprawdźAktualizacje(bot: discord.Client) -> None:
 	"""
-	Monitoruje i sprawdza aktualizacje zastępstw dla wszystkich serwerów i szkół zdefiniowanych w pliku konfiguracyjnym.
+	Monitoruje i sprawdza aktualizacje zastępstw dla wszystkich serwerów i szkół zdefiniowanych w pliku konfiguracyjnym. Każda szkoła sprawdzana jest według własnego harmonogramu, a szkoła, której subskrybenci zmienili konfigurację, sprawdzana jest od razu.
 
 	Args:
 		bot (discord.Client): Instancja klienta Discord.
 	"""
 
 	await bot.wait_until_ready()
+	_, limit = zwróćUstawieniaSprawdzania()
+	blokadaNaSzkołę = asyncio.Semaphore(limit)
+
 	while not bot.is_closed():
-		async with blokadaKonfiguracji:
-			szkoły = dict(konfiguracja.get("szkoły", {}).copy())
-			serwery = dict(konfiguracja.get("serwery", {}).copy())
+		# Odczyt bez oczekiwania nie może przeplatać się z zapisem konfiguracji, a serwery odczytywane są z niezmiennego indeksu, więc blokada konfiguracji nie jest potrzebna
+		szkoły = dict(konfiguracja.get("szkoły", {}).copy())
+		dataZakończeniaRoku = str(konfiguracja.get("koniec-roku-szkolnego", ""))
+		indeksSerwerów = pobierzIndeksSerwerów()
 
 		if not szkoły:
 			logiKonsoli.warning(
 				"Brak zdefiniowanych szkół w pliku konfiguracyjnym. Uzupełnij brakujące dane i spróbuj ponownie."
 			)
-		else:
-			for identyfikatorSzkoły, daneSzkoły in szkoły.items():
-				url = (daneSzkoły or {}).get("url", "")
-
-				if not url:
-					logiKonsoli.warning(
-						f"Nie ustawiono URL dla szkoły o ID {identyfikatorSzkoły} w pliku konfiguracyjnym. Uzupełnij brakujące dane i spróbuj ponownie."
-					)
-					continue
+			await asyncio.sleep(300)
+			continue
+
+		teraz = time.monotonic()
+		harmonogramy = {}
+		doSprawdzenia = []
+
+		for identyfikatorSzkoły, daneSzkoły in szkoły.items():
+			harmonogram = harmonogramy[identyfikatorSzkoły] = zwróćUstawieniaSprawdzania(identyfikatorSzkoły, daneSzkoły)[0]
+			subskrybenci = frozenset((subskrypcja.identyfikatorSerwera, subskrypcja.odcisk) for subskrypcja in indeksSerwerów.get(identyfikatorSzkoły, ()))
+
+			if identyfikatorSzkoły not in terminySprawdzeńSzkół:
+				# Pierwsze sprawdzenia szkół są rozłożone w czasie, aby nie pobierać wszystkich stron jednocześnie
+				terminySprawdzeńSzkół[identyfikatorSzkoły] = teraz + random.uniform(0, harmonogram["rozrzut"] * harmonogram["interwal-poranny"])
+				subskrybenciSzkół[identyfikatorSzkoły] = subskrybenci
+
+			if terminySprawdzeńSzkół[identyfikatorSzkoły] <= teraz or subskrybenciSzkół.get(identyfikatorSzkoły) != subskrybenci:
+				subskrybenciSzkół[identyfikatorSzkoły] = subskrybenci
+				doSprawdzenia.append(identyfikatorSzkoły)
+
+		if doSprawdzenia:
+			zadania = [sprawdźSzkołę(identyfikatorSzkoły, szkoły[identyfikatorSzkoły] or {}, indeksSerwerów.get(identyfikatorSzkoły, ()), blokadaNaSzkołę, bot) for identyfikatorSzkoły in doSprawdzenia]
+			wyniki = await asyncio.gather(*zadania, return_exceptions=True)
+
+			for identyfikatorSzkoły, zmieniona in zip(doSprawdzenia, wyniki):
+				if zmieniona is True:
+					niezmienioneSprawdzeniaSzkół[identyfikatorSzkoły] = 0
+				elif zmieniona is False:
+					niezmienioneSprawdzeniaSzkół[identyfikatorSzkoły] += 1
+
+				interwał = zwróćInterwałSzkoły(harmonogramy[identyfikatorSzkoły], niezmienioneSprawdzeniaSzkół[identyfikatorSzkoły], dataZakończeniaRoku)
+				terminySprawdzeńSzkół[identyfikatorSzkoły] = time.monotonic() + interwał
+
+		for identyfikatorSzkoły in list(terminySprawdzeńSzkół):
+			if identyfikatorSzkoły not in szkoły:
+				terminySprawdzeńSzkół.pop(identyfikatorSzkoły, None)
+				niezmienioneSprawdzeniaSzkół.pop(identyfikatorSzkoły, None)
+				subskrybenciSzkół.pop(identyfikatorSzkoły, None)
+
+		# Pętla budzi się najpóźniej co minutę, aby uwzględnić nowe szkoły i zmiany konfiguracji serwerów
+		await asyncio.sleep(min(60.0, max(1.0, min(terminySprawdzeńSzkół.values(), default=teraz + 60) - time.monotonic())))
+
+
+async def sprawdźSzkołę(
+	identyfikatorSzkoły: str,
+	daneSzkoły: dict[str, Any],
+	subskrypcje: tuple[SubskrypcjaSzkoły, ...],
+	blokadaNaSzkołę: asyncio.Semaphore,
+	bot: discord.Client
+) -> Optional[bool]:
+	"""
+	Pobiera stronę szkoły i sprawdza aktualizacje dla subskrybujących ją serwerów, niezależnie od pozostałych szkół.
 
-				zawartośćStrony = await pobierzZawartośćStrony(bot, url, kodowanie=(daneSzkoły or {}).get("kodowanie", "iso-8859-2"))
-				serweryDoSprawdzenia = [int(identyfikatorSerwera) for identyfikatorSerwera, konfiguracjaSerwera in serwery.items() if (konfiguracjaSerwera or {}).get("szkoła", "") == identyfikatorSzkoły]
+	Args:
+		identyfikatorSzkoły (str): ID szkoły z pliku konfiguracyjnego.
+		daneSzkoły (dict[str, Any]): Konfiguracja szkoły.
+		subskrypcje (tuple[SubskrypcjaSzkoły, ...]): Serwery subskrybujące szkołę, odczytane z indeksu serwerów według szkół.
+		blokadaNaSzkołę (asyncio.Semaphore): Semafor ograniczający liczbę jednocześnie sprawdzanych szkół.
+		bot (discord.Client): Instancja klienta Discord.
 
-				if not zawartośćStrony or not serweryDoSprawdzenia:
-					continue
+	Returns:
+		Optional[bool]: True, jeśli strona szkoły uległa zmianie, False, jeśli nie uległa zmianie, lub None, jeśli nie udało się jej sprawdzić.
+	"""
 
-				zadania = [sprawdźSerwer(int(identyfikatorSerwera), zawartośćStrony, bot) for identyfikatorSerwera in serweryDoSprawdzenia]
-				await asyncio.gather(*zadania, return_exceptions=True)
-		await asyncio.sleep(300)
+	url = daneSzkoły.get("url", "")
 
+	if not url:
+		logiKonsoli.warning(
+			f"Nie ustawiono URL dla szkoły o ID {identyfikatorSzkoły} w pliku konfiguracyjnym. Uzupełnij brakujące dane i spróbuj ponownie."
+		)
+		return
 
-async def sprawdźSerwer(
-	identyfikatorSerwera: int,
-	zawartośćStrony: str,
-	bot: discord.Client
-) -> None:
+	async with blokadaNaSzkołę:
+		try:
+			listaKlas = pobierzListęKlas(identyfikatorSzkoły)
+			odciskListyKlas = obliczSumęKontrolną("\n".join(listaKlas))
+
+			if ostatnieDaneSzkół.get(identyfikatorSzkoły, ("", None))[0] != odciskListyKlas:
+				# Lista klas zmieniła się od ostatniego wyodrębnienia danych, więc strona zostanie pobrana i przetworzona ponownie
+				walidatoryStron.pop(url, None)
+
+			wiersze, niezmieniona = await pobierzZawartośćStrony(bot, url, kodowanie=daneSzkoły.get("kodowanie", "iso-8859-2"), parser=daneSzkoły.get("parser", "html.parser"))
+			serweryDoSprawdzenia = {subskrypcja.identyfikatorSerwera: subskrypcja for subskrypcja in subskrypcje}
+
+			if niezmieniona:
+				# Strona nie uległa zmianie, więc sprawdzane są wyłącznie serwery nowe lub ze zmienioną konfiguracją
+				wyodrębnioneDane = ostatnieDaneSzkół.get(identyfikatorSzkoły, ("", None))[1]
+				serweryDoSprawdzenia = {identyfikatorSerwera: subskrypcja for identyfikatorSerwera, subskrypcja in serweryDoSprawdzenia.items() if przetworzoneSerwery[identyfikatorSzkoły].get(identyfikatorSerwera) != subskrypcja.odcisk}
+			elif wiersze is not None:
+				# Wyodrębnianie danych (a dla parsera strumieniowego również tokenizacja strony) odbywa się poza pętlą zdarzeń
+				wyodrębnioneDane = await asyncio.to_thread(wyodrębnijDaneSzkoły, wiersze, listaKlas)
+				ostatnieDaneSzkół[identyfikatorSzkoły] = (odciskListyKlas, wyodrębnioneDane)
+				przetworzoneSerwery[identyfikatorSzkoły] = {}
+			else:
+				return None
+
+			if not wyodrębnioneDane or not serweryDoSprawdzenia:
+				return not niezmieniona
+
+			# Serwery o identycznych (znormalizowanych) filtrach współdzielą jeden wynik filtrowania, sumy kontrolne i osadzenia
+			wynikiGrup = {}
+			zadania = []
+
+			for subskrypcja in serweryDoSprawdzenia.values():
+				filtr = subskrypcja.filtr
+
+				if filtr.odcisk not in wynikiGrup:
+					wynikiGrup[filtr.odcisk] = przygotujWynikFiltrowania(wyodrębnioneDane, filtr)
+
+				zadania.append(sprawdźSerwery(subskrypcja, wynikiGrup[filtr.odcisk], bot))
+
+			wyniki = await asyncio.gather(*zadania, return_exceptions=True)
+
+			for (identyfikatorSerwera, subskrypcja), wynik in zip(serweryDoSprawdzenia.items(), wyniki):
+				if wynik is True:
+					przetworzoneSerwery[identyfikatorSzkoły][identyfikatorSerwera] = subskrypcja.odcisk
+
+			return not niezmieniona
+		except Exception as e:
+			logiKonsoli.exception(
+				f"Wystąpił błąd podczas sprawdzania aktualizacji dla szkoły o ID {identyfikatorSzkoły}. Więcej informacji: {e}"
+			)
+			return None
+
+
+def przygotujWynikFiltrowania(
+	wyodrębnioneDane: tuple[str, list[WpisZastępstwa]],
+	filtr: FiltrZastępstw
+) -> WynikFiltrowania:
 	"""
-	Sprawdza aktualizacje per serwer, używając semafora ograniczającego jednoczesne sprawdzanie serwerów do trzech wątków.
+	Filtruje wpisy zastępstw szkoły, oblicza sumy kontrolne i buduje osadzenia jednorazowo dla grupy serwerów o identycznych filtrach.
 
 	Args:
-		identyfikatorSerwera (int): ID serwera Discord.
-		zawartośćStrony (str): Zawartość strony z zastępstwami.
-		bot (discord.Client): Instancja klienta Discord.
+		wyodrębnioneDane (tuple[str, list[WpisZastępstwa]]): Informacje dodatkowe i wpisy zastępstw wyodrębnione jednorazowo dla szkoły.
+		filtr (FiltrZastępstw): Skompilowany filtr wspólny dla grupy serwerów.
+
+	Returns:
+		WynikFiltrowania: Wynik filtrowania wraz z sumami kontrolnymi i przygotowanymi wiadomościami.
+	"""
+
+	informacjeDodatkowe, wpisySzkoły = wyodrębnioneDane
+	wpisyZastępstw = filtrujWpisy(wpisySzkoły, filtr)
+	klasySzkoły = {(wpis.nauczyciel, wpis.treść): wpis.klasy for wpis in wpisySzkoły}
+	odciskiWpisów = {}
+	sumyKontrolneGrup = {}
+	klasyWpisów = {}
+
+	for tytuł, wpisy in wpisyZastępstw:
+		sumyKontrolneGrup[tytuł] = obliczSumęKontrolną([(tytuł, wpisy)])
+		wystąpienia = defaultdict(int)
+
+		for wpis in wpisy:
+			odcisk = zwróćOdciskWiersza(tytuł, wpis, wystąpienia[wpis])
+			wystąpienia[wpis] += 1
+			odciskiWpisów[odcisk] = obliczSumęKontrolną(zwróćKluczWpisu(tytuł, wpis))
+			klasyWpisów[odcisk] = klasySzkoły.get((tytuł, wpis), frozenset())
+
+	return WynikFiltrowania(
+		informacjeDodatkowe=informacjeDodatkowe,
+		wpisyZastępstw=wpisyZastępstw,
+		sumaKontrolnaInformacjiDodatkowych=obliczSumęKontrolną(informacjeDodatkowe),
+		sumaKontrolnaWpisówZastępstw=obliczSumęKontrolną(wpisyZastępstw),
+		wiadomościInformacji=przygotujWiadomości(informacjeDodatkowe, None),
+		odciskiWpisów=odciskiWpisów,
+		sumyKontrolneGrup=sumyKontrolneGrup,
+		klasyWpisów=klasyWpisów
+	)
+
+
+def zwróćKluczWpisu(
+	tytuł: str,
+	wpis: str
+) -> str:
+	"""
+	Tworzy klucz wiersza zastępstwa złożony z nauczyciela i lekcji, który pozwala rozpoznać zmieniony wiersz niezależnie od jego pozostałej treści.
+
+	Args:
+		tytuł (str): Tytuł grupy wpisów (nauczyciel lub grupa zastępstw bez klasy).
+		wpis (str): Sformatowana treść wiersza zastępstwa.
+
+	Returns:
+		str: Klucz wiersza zastępstwa.
+	"""
+
+	linie = wpis.split("\n")
+
+	for indeks, linia in enumerate(linie):
+		if linia.startswith("**Lekcja:**"):
+			return "\n".join([tytuł, *linie[:indeks + 1]])
+
+	return f"{tytuł}\n{wpis}"
+
+
+def zwróćOdciskWiersza(
+	tytuł: str,
+	wpis: str,
+	wystąpienie: int = 0
+) -> str:
+	"""
+	Tworzy odcisk wiersza zastępstwa. Kolejne wystąpienia identycznego wiersza w tej samej grupie otrzymują numer wystąpienia, dzięki czemu nie są ze sobą utożsamiane, a pierwsze wystąpienie zachowuje dotychczasowy odcisk.
+
+	Args:
+		tytuł (str): Tytuł grupy wpisów (nauczyciel lub grupa zastępstw bez klasy).
+		wpis (str): Sformatowana treść wiersza zastępstwa.
+		wystąpienie (int, optional): Numer wystąpienia identycznego wiersza w grupie, liczony od zera. Domyślnie 0.
+
+	Returns:
+		str: Odcisk wiersza zastępstwa.
+	"""
+
+	return obliczSumęKontrolną(f"{tytuł}\n{wpis}\n{wystąpienie}" if wystąpienie else f"{tytuł}\n{wpis}")
+
+
+def przygotujRóżnicęWpisów(
+	wynikFiltrowania: WynikFiltrowania,
+	poprzednieOdciski: dict[str, str]
+) -> RóżnicaWpisów:
+	"""
+	Oblicza wiersze dodane, zmienione i usunięte względem poprzednio wysłanych wierszy serwera i buduje wiadomości zawierające wyłącznie różnicę. Wynik jest zapamiętywany, więc serwery grupy o identycznym poprzednim stanie współdzielą jedną różnicę.
+
+	Args:
+		wynikFiltrowania (WynikFiltrowania): Wynik filtrowania wspólny dla grupy serwerów o identycznych filtrach.
+		poprzednieOdciski (dict[str, str]): Odciski poprzednio wysłanych wierszy serwera przypisane do odcisków ich kluczy.
+
+	Returns:
+		RóżnicaWpisów: Różnica wierszy wraz z przygotowanymi wiadomościami.
+	"""
+
+	kluczPamięci = frozenset(poprzednieOdciski)
+	różnica = wynikFiltrowania.różnice.get(kluczPamięci)
+
+	if różnica is not None:
+		return różnica
+
+	aktualneOdciski = wynikFiltrowania.odciskiWpisów
+	kluczeUsuniętych = {odciskKlucza for odcisk, odciskKlucza in poprzednieOdciski.items() if odcisk not in aktualneOdciski}
+	kluczeDodanych = {odciskKlucza for odcisk, odciskKlucza in aktualneOdciski.items() if odcisk not in poprzednieOdciski}
+	wpisyDoWysłania = []
+	wpisyNowe = []
+
+	for tytuł, wpisy in wynikFiltrowania.wpisyZastępstw:
+		doWysłania = []
+		nowe = []
+		wystąpienia = defaultdict(int)
+
+		for wpis in wpisy:
+			odcisk = zwróćOdciskWiersza(tytuł, wpis, wystąpienia[wpis])
+			wystąpienia[wpis] += 1
+
+			if odcisk in poprzednieOdciski:
+				continue
+
+			doWysłania.append(wpis)
+
+			if aktualneOdciski[odcisk] not in kluczeUsuniętych:
+				nowe.append(wpis)
+
+		if doWysłania:
+			wpisyDoWysłania.append((tytuł, doWysłania))
+
+		if nowe:
+			wpisyNowe.append((tytuł, nowe))
+
+	liczbaUsuniętych = sum(1 for odcisk, odciskKlucza in poprzednieOdciski.items() if odcisk not in aktualneOdciski and odciskKlucza not in kluczeDodanych)
+	różnica = RóżnicaWpisów(
+		wpisyDoWysłania=wpisyDoWysłania,
+		wpisyNowe=wpisyNowe,
+		liczbaUsuniętych=liczbaUsuniętych,
+		wiadomości=przygotujWiadomości(wynikFiltrowania.informacjeDodatkowe, wpisyDoWysłania, liczbaUsuniętych)
+	)
+	wynikFiltrowania.różnice[kluczPamięci] = różnica
+
+	return różnica
+
+
+def przygotujOsadzeniaEdycji(
+	wynikFiltrowania: WynikFiltrowania,
+	wysłaneWiadomości: dict[str, list],
+	różnica: RóżnicaWpisów,
+	zmienioneInformacjeDodatkowe: bool
+) -> tuple[list[tuple[list[int], list[tuple[str, list[discord.Embed]]]]], list[tuple[str, list[discord.Embed]]]]:
+	"""
+	Wybiera wiadomości, które należy edytować, i grupy wpisów, które należy wysłać, porównując sumy kontrolne pełnych bloków z sumami zapisanymi przy wysłanych wiadomościach. Edytowane wiadomości otrzymują aktualną zawartość wszystkich grup, które się w nich znajdują. Wiadomości połączone grupą zajmującą więcej niż jedną wiadomość są edytowane razem, ponieważ zmiana takiej grupy przesuwa osadzenia pomiędzy nimi.
+
+	Args:
+		wynikFiltrowania (WynikFiltrowania): Wynik filtrowania wspólny dla grupy serwerów o identycznych filtrach.
+		wysłaneWiadomości (dict[str, list]): ID wszystkich wiadomości zajmowanych przez blok i jego suma kontrolna według tytułu grupy, dla bloków wysłanych w bieżącym dniu.
+		różnica (RóżnicaWpisów): Różnica wierszy względem poprzednio wysłanych wierszy serwera.
+		zmienioneInformacjeDodatkowe (bool): Informuje, czy zmieniły się informacje dodatkowe.
+
+	Returns:
+		tuple[list[tuple[list[int], list[tuple[str, list[discord.Embed]]]]], list[tuple[str, list[discord.Embed]]]]:
+			wiadomościDoEdycji: Kolejne zestawy powiązanych wiadomości jako ich ID (w kolejności na kanale) i pełna, aktualna zawartość ich grup.
+			noweGrupy: Osadzenia grup, które nie mają jeszcze swojej wiadomości.
 	"""
 
-	async with blokadaNaSerwer:
-		await sprawdźSerwery(identyfikatorSerwera, zawartośćStrony, bot)
+	def zwróćOsadzenia(tytuł: str) -> list[discord.Embed]:
+		"""
+		Zwraca aktualne osadzenia grupy wpisów, budując je jednorazowo dla całej grupy serwerów.
+
+		Args:
+			tytuł (str): Tytuł grupy wpisów (pusty tytuł oznacza nagłówek).
+
+		Returns:
+			list[discord.Embed]: Osadzenia grupy wpisów.
+		"""
+
+		if not tytuł:
+			return [przygotujNagłówek(wynikFiltrowania.informacjeDodatkowe, różnica.liczbaUsuniętych)]
+
+		if tytuł not in wynikFiltrowania.sumyKontrolneGrup:
+			return [przygotujOsadzenieUsuniętych(tytuł)]
+
+		if tytuł not in wynikFiltrowania.osadzeniaGrup:
+			wynikFiltrowania.osadzeniaGrup[tytuł] = przygotujOsadzeniaNauczyciela(tytuł, wpisyWedługTytułu[tytuł])
+
+		return wynikFiltrowania.osadzeniaGrup[tytuł]
+
+	wpisyWedługTytułu = dict(wynikFiltrowania.wpisyZastępstw)
+	zmienioneTytuły = []
+
+	if "" in wysłaneWiadomości and (zmienioneInformacjeDodatkowe or różnica.liczbaUsuniętych):
+		zmienioneTytuły.append("")
+
+	for tytuł, _ in wynikFiltrowania.wpisyZastępstw:
+		if wysłaneWiadomości.get(tytuł, [0, ""])[1] != wynikFiltrowania.sumyKontrolneGrup[tytuł]:
+			zmienioneTytuły.append(tytuł)
+
+	for tytuł, (_, sumaKontrolna) in wysłaneWiadomości.items():
+		if tytuł and sumaKontrolna and tytuł not in wynikFiltrowania.sumyKontrolneGrup:
+			zmienioneTytuły.append(tytuł)
+
+	kolejność = {tytuł: indeks for indeks, (tytuł, _) in enumerate(wynikFiltrowania.wpisyZastępstw, start=1)}
+	kolejność[""] = 0
+	tytułyWiadomości = defaultdict(set)
+	wiadomościDoEdycji = []
+	noweGrupy = []
+	edytowaneTytuły = set()
+
+	for tytuł, (identyfikatory, _) in wysłaneWiadomości.items():
+		for identyfikatorWiadomości in identyfikatory:
+			tytułyWiadomości[identyfikatorWiadomości].add(tytuł)
+
+	for tytuł in zmienioneTytuły:
+		if tytuł not in wysłaneWiadomości:
+			noweGrupy.append((tytuł, zwróćOsadzenia(tytuł)))
+			continue
+
+		if tytuł in edytowaneTytuły:
+			continue
+
+		# Zestaw obejmuje wszystkie wiadomości zmienionej grupy oraz, przechodnio, wiadomości pozostałych grup, które się w nich znajdują
+		tytułyZestawu = set()
+		identyfikatoryZestawu = set()
+		doSprawdzenia = [tytuł]
+
+		while doSprawdzenia:
+			tytułZestawu = doSprawdzenia.pop()
+
+			if tytułZestawu in tytułyZestawu:
+				continue
+
+			tytułyZestawu.add(tytułZestawu)
+
+			for identyfikatorWiadomości in wysłaneWiadomości[tytułZestawu][0]:
+				if identyfikatorWiadomości not in identyfikatoryZestawu:
+					identyfikatoryZestawu.add(identyfikatorWiadomości)
+					doSprawdzenia.extend(tytułyWiadomości[identyfikatorWiadomości])
+
+		edytowaneTytuły |= tytułyZestawu
+		wiadomościDoEdycji.append((
+			sorted(identyfikatoryZestawu),
+			[(tytułZestawu, zwróćOsadzenia(tytułZestawu)) for tytułZestawu in sorted(tytułyZestawu, key=lambda tytułZestawu: kolejność.get(tytułZestawu, len(kolejność)))]
+		))
+
+	# ID wiadomości Discord rosną wraz z czasem wysłania, więc zestawy edytowane są w kolejności, w jakiej znajdują się na kanale
+	wiadomościDoEdycji.sort(key=lambda zestaw: zestaw[0][0])
+
+	return wiadomościDoEdycji, noweGrupy
 
 
 async def sprawdźSerwery(
-	identyfikatorSerwera: int,
-	zawartośćStrony: str,
+	subskrypcja: SubskrypcjaSzkoły,
+	wynikFiltrowania: WynikFiltrowania,
 	bot: discord.Client
-) -> None:
+) -> bool:
 	"""
-	Pobiera konfigurację serwera, sprawdza aktualizacje danych, wysyła aktualizacje i aktualizuje statystyki.
+	Porównuje wynik filtrowania z ostatnio zapisanym stanem serwera, wysyła aktualizacje i aktualizuje statystyki.
 
 	Args:
-		identyfikatorSerwera (int): ID serwera Discord.
-		zawartośćStrony (str): Zawartość strony z zastępstwami.
+		subskrypcja (SubskrypcjaSzkoły): Serwer subskrybujący szkołę, odczytany z indeksu serwerów według szkół.
+		wynikFiltrowania (WynikFiltrowania): Wynik filtrowania wspólny dla grupy serwerów o identycznych filtrach.
 		bot (discord.Client): Instancja klienta Discord.
-	"""
 
-	async with blokadaKonfiguracji:
-		konfiguracjaSerwera = konfiguracja.get("serwery", {}).get(str(identyfikatorSerwera), {}).copy()
+	Returns:
+		bool: True, jeśli dane serwera zostały pomyślnie przetworzone, False w przeciwnym razie.
+	"""
 
-	identyfikatorKanału = konfiguracjaSerwera.get("identyfikator-kanalu", "")
-	kanał = bot.get_channel(int(identyfikatorKanału))
+	identyfikatorSerwera = int(subskrypcja.identyfikatorSerwera)
+	identyfikatorKanału = subskrypcja.identyfikatorKanału
+	kanał = bot.get_channel(int(identyfikatorKanału)) if identyfikatorKanału else None
 
-	if not identyfikatorKanału or not kanał:
-		return
+	if not kanał:
+		return False
 
 	try:
+		if not await dostarczKroki(bot, identyfikatorSerwera):
+			# Wcześniejsze wiadomości czekają na ponowienie, więc nowe zmiany zostaną porównane po ich dostarczeniu
+			return False
+
 		poprzednieDane = await zarządzajPlikiemDanych(identyfikatorSerwera)
 
 		if not isinstance(poprzednieDane, dict):
@@ -121,79 +696,109 @@ async def sprawdźSerwery(
 		sumaKontrolnaPoprzednichInformacjiDodatkowych = poprzednieDane.get("suma-kontrolna-informacji-dodatkowych", "")
 		sumaKontrolnaPoprzednichWpisówZastępstw = poprzednieDane.get("suma-kontrolna-wpisow-zastepstw", "")
 
-		wybraneKlasy = konfiguracjaSerwera.get("wybrane-klasy", [])
-		wybraniNauczyciele = konfiguracjaSerwera.get("wybrani-nauczyciele", [])
+		poprzednieOdciski = poprzednieDane.get("odciski-wpisow-zastepstw", {})
 
-		listaKlas = pobierzListęKlas(konfiguracjaSerwera.get("szkoła", ""))
-		informacjeDodatkowe, aktualneWpisyZastępstw = wyodrębnijDane(zawartośćStrony, wybraneKlasy, wybraniNauczyciele, listaKlas)
-		sumaKontrolnaAktualnychInformacjiDodatkowych = obliczSumęKontrolną(informacjeDodatkowe)
-		sumaKontrolnaAktualnychWpisówZastępstw = obliczSumęKontrolną(aktualneWpisyZastępstw)
+		if not isinstance(poprzednieOdciski, dict):
+			poprzednieOdciski = {}
 
-		if sumaKontrolnaAktualnychInformacjiDodatkowych != sumaKontrolnaPoprzednichInformacjiDodatkowych or sumaKontrolnaAktualnychWpisówZastępstw != sumaKontrolnaPoprzednichWpisówZastępstw:
-			if sumaKontrolnaAktualnychWpisówZastępstw == sumaKontrolnaPoprzednichWpisówZastępstw:
-				logiKonsoli.debug(
-					f"Treść informacji dodatkowych uległa zmianie dla serwera o ID {identyfikatorSerwera}. Zostaną wysłane zaktualizowane informacje."
-				)
-			else:
-				logiKonsoli.debug(
-					f"Treść zastępstw uległa zmianie dla serwera o ID {identyfikatorSerwera}. Zostaną wysłane zaktualizowane zastępstwa."
-				)
+		sumaKontrolnaAktualnychInformacjiDodatkowych = wynikFiltrowania.sumaKontrolnaInformacjiDodatkowych
+		sumaKontrolnaAktualnychWpisówZastępstw = wynikFiltrowania.sumaKontrolnaWpisówZastępstw
+
+		if not poprzednieOdciski and sumaKontrolnaAktualnychWpisówZastępstw == sumaKontrolnaPoprzednichWpisówZastępstw:
+			# Dane zapisane przed wprowadzeniem odcisków wierszy, a aktualne wiersze zostały już wysłane
+			poprzednieOdciski = wynikFiltrowania.odciskiWpisów
 
-			try:
-				if sumaKontrolnaAktualnychInformacjiDodatkowych != sumaKontrolnaPoprzednichInformacjiDodatkowych and sumaKontrolnaAktualnychWpisówZastępstw == sumaKontrolnaPoprzednichWpisówZastępstw:
-					await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, None)
+		różnica = przygotujRóżnicęWpisów(wynikFiltrowania, poprzednieOdciski)
+		dzisiaj = datetime.now(ZoneInfo("Europe/Warsaw")).date().isoformat()
+		wysłaneWiadomości = poprzednieDane.get("wiadomosci-zastepstw", {}) if poprzednieDane.get("data-wiadomosci", "") == dzisiaj else {}
 
-				elif sumaKontrolnaAktualnychInformacjiDodatkowych == sumaKontrolnaPoprzednichInformacjiDodatkowych and sumaKontrolnaAktualnychWpisówZastępstw != sumaKontrolnaPoprzednichWpisówZastępstw:
-					await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, aktualneWpisyZastępstw)
+		if not isinstance(wysłaneWiadomości, dict):
+			wysłaneWiadomości = {}
 
-				else:
-					await wyślijAktualizacje(kanał, identyfikatorSerwera, informacjeDodatkowe, aktualneWpisyZastępstw)
+		# Tryb edycji wymaga wiadomości wysłanych w bieżącym dniu; w przeciwnym razie wysyłana jest nowa seria wiadomości
+		trybEdycji = bool(konfiguracja.get("edytuj-wyslane-wiadomosci", True)) and any(wysłaneWiadomości)
+		zmienioneInformacjeDodatkowe = sumaKontrolnaAktualnychInformacjiDodatkowych != sumaKontrolnaPoprzednichInformacjiDodatkowych
+		zmienioneWpisyZastępstw = bool(różnica.wpisyDoWysłania or różnica.liczbaUsuniętych)
 
-				poprzedniLicznik = int(poprzednieDane.get("licznik-zastepstw", 0))
+		if zmienioneInformacjeDodatkowe or zmienioneWpisyZastępstw or poprzednieOdciski != poprzednieDane.get("odciski-wpisow-zastepstw", {}):
+			if zmienioneWpisyZastępstw:
+				logiKonsoli.debug(
+					f"Treść zastępstw uległa zmianie dla serwera o ID {identyfikatorSerwera}. Zostaną wysłane nowe lub zmienione zastępstwa."
+				)
+			elif zmienioneInformacjeDodatkowe:
+				logiKonsoli.debug(
+					f"Treść informacji dodatkowych uległa zmianie dla serwera o ID {identyfikatorSerwera}. Zostaną wysłane zaktualizowane informacje."
+				)
 
-				if sumaKontrolnaAktualnychWpisówZastępstw != sumaKontrolnaPoprzednichWpisówZastępstw:
-					przyrost = sum(len(wpisy) for _, wpisy in aktualneWpisyZastępstw) if aktualneWpisyZastępstw else 0
-					nowyLicznik = poprzedniLicznik + przyrost
-					statystykiNauczycieli = poprzednieDane.get("statystyki-nauczycieli", {})
+			# Sumy kontrolne zapamiętywane razem z ID wiadomości, w których znajdują się poszczególne bloki
+			sumyKontrolne = {"": sumaKontrolnaAktualnychInformacjiDodatkowych, **wynikFiltrowania.sumyKontrolneGrup}
 
-					if not isinstance(statystykiNauczycieli, dict):
-						statystykiNauczycieli = {}
+			if trybEdycji and (zmienioneWpisyZastępstw or (zmienioneInformacjeDodatkowe and "" in wysłaneWiadomości)):
+				wiadomościDoEdycji, noweGrupy = przygotujOsadzeniaEdycji(wynikFiltrowania, wysłaneWiadomości, różnica, zmienioneInformacjeDodatkowe)
+				kroki = zaplanujEdycję(wiadomościDoEdycji, noweGrupy, bool(różnica.wpisyNowe), sumyKontrolne, dzisiaj)
+			elif zmienioneWpisyZastępstw:
+				kroki = zaplanujWysłanie(różnica.wiadomości, dzisiaj, sumyKontrolne)
+			elif zmienioneInformacjeDodatkowe:
+				kroki = zaplanujWysłanie(wynikFiltrowania.wiadomościInformacji, dzisiaj)
+			else:
+				kroki = []
 
-					for tytuł, wpisy in (aktualneWpisyZastępstw or []):
-						nazwa = (tytuł or "").strip()
+			# Do statystyk trafiają wyłącznie nowe wiersze, a nie wiersze zmienione lub wysłane już wcześniej
+			poprzedniLicznik = int(poprzednieDane.get("licznik-zastepstw", 0))
+			nowyLicznik = poprzedniLicznik + sum(len(wpisy) for _, wpisy in różnica.wpisyNowe)
+			statystykiNauczycieli = poprzednieDane.get("statystyki-nauczycieli", {})
+			zmienieniNauczyciele = set()
 
-						if "Zastępstwa z nieprzypisanymi klasami!" in nazwa:
-							for wpis in wpisy:
-								if "**Nauczyciel:**" in wpis:
-									nauczyciel = wpis.split("**Nauczyciel:**", 1)[1].strip()
-									nauczyciel = nauczyciel.split("\n", 1)[0].strip().split("/", 1)[0].split(" - ", 1)[0].strip()
-									statystykiNauczycieli[nauczyciel] = int(statystykiNauczycieli.get(nauczyciel, 0)) + 1
+			# Statystyki okresowe rejestrują dzienne przyrosty ogółem, według nauczycieli i według klas
+			przyrostyStatystyk = defaultdict(int)
+			przyrostyStatystyk[("wszystkie", "")] = nowyLicznik - poprzedniLicznik
 
-							continue
+			if not isinstance(statystykiNauczycieli, dict):
+				statystykiNauczycieli = {}
 
-						klucz = nazwa.split("/", 1)[0].split(" - ", 1)[0].strip()
-						statystykiNauczycieli[klucz] = int(statystykiNauczycieli.get(klucz, 0)) + len(wpisy)
-				else:
-					nowyLicznik = poprzedniLicznik
-					statystykiNauczycieli = poprzednieDane.get("statystyki-nauczycieli", {})
+			for tytuł, wpisy in różnica.wpisyNowe:
+				nazwa = (tytuł or "").strip()
 
-					if not isinstance(statystykiNauczycieli, dict):
-						statystykiNauczycieli = {}
+				if "Zastępstwa z nieprzypisanymi klasami!" in nazwa:
+					for wpis in wpisy:
+						if "**Nauczyciel:**" in wpis:
+							nauczyciel = wpis.split("**Nauczyciel:**", 1)[1].strip()
+							nauczyciel = nauczyciel.split("\n", 1)[0].strip().split("/", 1)[0].split(" - ", 1)[0].strip()
+							statystykiNauczycieli[nauczyciel] = int(statystykiNauczycieli.get(nauczyciel, 0)) + 1
+							zmienieniNauczyciele.add(nauczyciel)
+							przyrostyStatystyk[("nauczyciel", nauczyciel)] += 1
 
-				noweDane = {
-					"suma-kontrolna-informacji-dodatkowych": sumaKontrolnaAktualnychInformacjiDodatkowych,
-					"suma-kontrolna-wpisow-zastepstw": sumaKontrolnaAktualnychWpisówZastępstw,
-					"licznik-zastepstw": nowyLicznik,
-					"statystyki-nauczycieli": statystykiNauczycieli,
-					"ostatni-raport": poprzednieDane.get("ostatni-raport", "")
-				}
+					continue
 
-				await zarządzajPlikiemDanych(identyfikatorSerwera, noweDane)
-			except discord.DiscordException as e:
-				logiKonsoli.exception(
-					f"Nie udało się wysłać wszystkich wiadomości do serwera o ID {identyfikatorSerwera}, suma kontrolna nie zostanie zaktualizowana. Więcej informacji: {e}"
-				)
+				klucz = nazwa.split("/", 1)[0].split(" - ", 1)[0].strip()
+				statystykiNauczycieli[klucz] = int(statystykiNauczycieli.get(klucz, 0)) + len(wpisy)
+				zmienieniNauczyciele.add(klucz)
+				przyrostyStatystyk[("nauczyciel", klucz)] += len(wpisy)
+
+				# Identyczne wiersze grupy mają te same klasy, więc wystarcza odcisk pierwszego wystąpienia
+				for wpis in wpisy:
+					for klasa in wynikFiltrowania.klasyWpisów.get(zwróćOdciskWiersza(tytuł, wpis), ()):
+						przyrostyStatystyk[("klasa", klasa)] += 1
+
+			noweDane = {
+				"suma-kontrolna-informacji-dodatkowych": sumaKontrolnaAktualnychInformacjiDodatkowych,
+				"suma-kontrolna-wpisow-zastepstw": sumaKontrolnaAktualnychWpisówZastępstw,
+				"licznik-zastepstw": nowyLicznik,
+				"statystyki-nauczycieli": statystykiNauczycieli,
+				"ostatni-raport": poprzednieDane.get("ostatni-raport", ""),
+				"odciski-wpisow-zastepstw": dict(wynikFiltrowania.odciskiWpisów),
+				"wiadomosci-zastepstw": wysłaneWiadomości,
+				"data-wiadomosci": dzisiaj if wysłaneWiadomości else ""
+			}
+
+			# Nowy stan serwera jest zapisywany razem z wiadomościami w skrzynce nadawczej, które dostarczane są od pierwszej niewysłanej
+			await zaplanujDostarczenie(identyfikatorSerwera, noweDane, kanał.id, kroki, {klucz: liczba for klucz, liczba in przyrostyStatystyk.items() if liczba}, date.fromisoformat(dzisiaj))
+			zaktualizujRankingNauczycieli(identyfikatorSerwera, subskrypcja.filtr, poprzedniLicznik, noweDane, zmienieniNauczyciele)
+			await dostarczKroki(bot, identyfikatorSerwera)
+
+		return True
 	except Exception as e:
 		logiKonsoli.exception(
 			f"Wystąpił błąd podczas przetwarzania aktualizacji dla serwera o ID {identyfikatorSerwera}. Więcej informacji: {e}"
-		)
\ No newline at end of file
+		)
+		return False
\ No newline at end of file
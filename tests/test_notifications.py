@@ -0,0 +1,76 @@
+#
+#
+#    ▄▄▄▄▄▄▄▄     ▄▄       ▄▄▄▄    ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄▄▄  ▄▄▄▄▄▄      ▄▄▄▄    ▄▄▄▄▄▄▄▄ ▄▄      ▄▄    ▄▄
+#    ▀▀▀▀▀███    ████    ▄█▀▀▀▀█   ▀▀▀██▀▀▀  ██▀▀▀▀▀▀  ██▀▀▀▀█▄  ▄█▀▀▀▀█   ▀▀▀██▀▀▀ ██      ██   ████
+#        ██▀     ████    ██▄          ██     ██        ██    ██  ██▄          ██    ▀█▄ ██ ▄█▀   ████
+#      ▄██▀     ██  ██    ▀████▄      ██     ███████   ██████▀    ▀████▄      ██     ██ ██ ██   ██  ██
+#     ▄██       ██████        ▀██     ██     ██        ██             ▀██     ██     ███▀▀███   ██████
+#    ███▄▄▄▄▄  ▄██  ██▄  █▄▄▄▄▄█▀     ██     ██▄▄▄▄▄▄  ██        █▄▄▄▄▄█▀     ██     ███  ███  ▄██  ██▄
+#    ▀▀▀▀▀▀▀▀  ▀▀    ▀▀   ▀▀▀▀▀       ▀▀     ▀▀▀▀▀█▀▀  ▀▀         ▀▀▀▀▀       ▀▀     ▀▀▀  ▀▀▀  ▀▀    ▀▀
+#                                                █▄▄
+#
+# Zewnętrzne biblioteki
+import discord
+
+# Wewnętrzne importy
+from src.classes.constants import Constants
+from src.handlers.notifications import (
+	przygotujWiadomości,
+	spakujOsadzenia,
+	zaplanujEdycję,
+	zaplanujWysłanie
+)
+
+
+def zwróćOsadzenie(długość: int) -> discord.Embed:
+	"""
+	Buduje osadzenie o podanej długości opisu.
+
+	Args:
+		długość (int): Liczba znaków opisu osadzenia.
+
+	Returns:
+		discord.Embed: Osadzenie testowe.
+	"""
+
+	return discord.Embed(description="x" * długość)
+
+
+def test_spakujOsadzeniaKontynuujeGrupęPrzekraczającąLimitZnaków():
+	grupa = [zwróćOsadzenie(4000), zwróćOsadzenie(4000), zwróćOsadzenie(500)]
+	spakowane = spakujOsadzenia([("A", grupa)])
+
+	assert [tytuły for tytuły, _ in spakowane] == [["A"], ["A"]]
+	assert [osadzenie for _, osadzenia in spakowane for osadzenie in osadzenia] == grupa
+	assert all(sum(len(osadzenie) for osadzenie in osadzenia) <= Constants.MAKSYMALNA_DŁUGOŚĆ_EMBEDÓW for _, osadzenia in spakowane)
+
+
+def test_spakujOsadzeniaKontynuujeGrupęPrzekraczającąLimitOsadzeń():
+	grupa = [zwróćOsadzenie(10) for _ in range(Constants.MAKSYMALNA_LICZBA_EMBEDÓW + 2)]
+	spakowane = spakujOsadzenia([("", [zwróćOsadzenie(10)]), ("A", grupa), ("B", [zwróćOsadzenie(10)])])
+
+	assert [tytuły for tytuły, _ in spakowane] == [[""], ["A"], ["A", "B"]]
+	assert sum(len(osadzenia) for _, osadzenia in spakowane) == len(grupa) + 2
+
+
+def test_zaplanujWysłanieOznaczaKontynuowaneGrupy():
+	wiadomości = przygotujWiadomości("", [("A", [f"**Lekcja:** {numer}\n" + "x" * 900 for numer in range(12)])])
+	kroki = [krok for krok in zaplanujWysłanie(wiadomości, "2026-10-19", {"": "n", "A": "a"}) if "A" in krok.get("tytuly", {})]
+
+	assert len(kroki) > 1
+	assert [krok["kontynuowane"] for krok in kroki] == [[]] + [["A"]] * (len(kroki) - 1)
+
+
+def test_zaplanujEdycjęPrzelewaDalszeCzęściGrupy():
+	grupa = [zwróćOsadzenie(4000), zwróćOsadzenie(4000), zwróćOsadzenie(500)]
+	kroki = zaplanujEdycję([([123], [("A", grupa)])], [], False, {"A": "s"}, "2026-10-19")
+
+	assert [(krok["rodzaj"], krok["identyfikator-wiadomosci"], krok["kontynuowane"]) for krok in kroki] == [("edytuj", 123, []), ("wyslij", None, ["A"])]
+	assert sum(len(krok["osadzenia"]) for krok in kroki) == len(grupa)
+
+
+def test_zaplanujEdycjęUsuwaNiepotrzebneWiadomościGrupy():
+	kroki = zaplanujEdycję([([123, 124, 125], [("A", [zwróćOsadzenie(500)]), ("B", [zwróćOsadzenie(500)])])], [("C", [zwróćOsadzenie(500)])], False, {"A": "a", "B": "b", "C": "c"}, "2026-10-19")
+
+	assert [(krok["rodzaj"], krok["identyfikator-wiadomosci"]) for krok in kroki] == [("edytuj", 123), ("usun", 124), ("usun", 125), ("wyslij", None)]
+	assert list(kroki[0]["tytuly"]) == ["A", "B"]
\ No newline at end of file